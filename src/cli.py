@@ -5,8 +5,8 @@ import json
 
 sys.path.append("src/")
 
-from graphs.algorithms import dijkstra_path, bfs
-from graphs.graph import carregar_lista_adjacencia
+from graphs.algorithms import bfs
+import registro
 from solve import deque_to_string, main_solve
 from viz import visualizar_grafo, main_viz
 
@@ -14,7 +14,13 @@ DIR = os.path.dirname(os.path.abspath(__file__))
 BASE_DIR = os.path.join(DIR, "../")
 
 def dijkstra_output(source, target, dataset_path, output_dir):
-    custo, caminho = dijkstra_path(carregar_lista_adjacencia(), source, target)
+    # nomes digitados -> nomes do grafo; um bairro desconhecido falha aqui, antes do Dijkstra
+    indice = registro.grafo_bairros_csr().indice
+    source = indice.resolver(source)
+    target = indice.resolver(target)
+
+    # a árvore de caminhos mínimos da origem fica no cache do registro
+    custo, caminho = registro.cache_arvores().dijkstra_path(registro.grafo_bairros_csr(), source, target)
 
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
@@ -29,7 +35,9 @@ def dijkstra_output(source, target, dataset_path, output_dir):
     print(f"Resultado salvo em: {output_path}")
 
 def bfs_output(source, dataset_path, output_dir):
-    caminho = bfs(carregar_lista_adjacencia(), source)
+    source = registro.grafo_bairros_csr().indice.resolver(source)
+
+    caminho = bfs(registro.grafo_bairros(), source)
 
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
@@ -158,7 +166,8 @@ def main():
 
     if args.out:
         main_solve()
-        main_viz()
+        # as entradas da visualização acabaram de ser geradas pelo main_solve
+        main_viz(gerar_entradas=False)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,116 @@
+import os
+
+import numpy as np
+
+from graphs.csr import GrafoCSR
+from graphs.snapshot import mapear_npz, salvar_npz
+
+# Índice de alcançabilidade sobre o DAG de condensação.
+#
+# Cada componente fortemente conexa guarda um bitset (palavras uint64) com as componentes que ela alcança,
+# incluindo ela mesma. Como as componentes estão numeradas em ordem topológica (graphs.scc), basta
+# percorrê-las de trás para frente fazendo o OU dos bitsets dos sucessores no DAG.
+# Depois disso "X alcança Y?" é um teste de bit, e "tudo que X alcança" / "tudo que alcança Y" são
+# operações vetorizadas sobre a linha / coluna de bits, sem nenhuma travessia no grafo.
+
+
+class IndiceAlcance:
+
+    def __init__(self, nomes, componente, bits, versao):
+
+        # Definição dos parâmetros:
+        #   nomes -> nome de cada vértice, na ordem dos ids
+        #   componente -> componente (em ordem topológica) de cada vértice
+        #   bits -> matriz (componentes x palavras) uint64; o bit d da linha c indica que c alcança d
+        #   versao -> GrafoCSR.versao do grafo usado na construção
+
+        self.nomes = list(nomes)
+        self.ids = {nome: i for i, nome in enumerate(self.nomes)}
+        self.componente = np.asanyarray(componente, dtype=np.int32)
+        self.bits = np.asanyarray(bits, dtype=np.uint64)
+        self.versao = versao
+
+    @property
+    def tamanho_bytes(self):
+        return self.componente.nbytes + self.bits.nbytes
+
+    # True se existe caminho de "origem" até "destino"
+    def alcanca(self, origem, destino) -> bool:
+        c_origem = int(self.componente[self.ids[origem]])
+        c_destino = int(self.componente[self.ids[destino]])
+        palavra = int(self.bits[c_origem, c_destino >> 6])
+        return bool((palavra >> (c_destino & 63)) & 1)
+
+    # Todos os vértices alcançáveis a partir de "origem" (incluindo ela), na ordem dos ids
+    def alcancaveis_de(self, origem) -> list:
+        linha = self.bits[self.componente[self.ids[origem]]]
+        return self._vertices(_desempacotar(linha, len(self.bits)))
+
+    # Todos os vértices que alcançam "destino" (incluindo ele), na ordem dos ids
+    def que_alcancam(self, destino) -> list:
+        c_destino = int(self.componente[self.ids[destino]])
+        coluna = (self.bits[:, c_destino >> 6] >> np.uint64(c_destino & 63)) & np.uint64(1)
+        return self._vertices(coluna.astype(bool))
+
+    # componentes marcadas -> nomes dos vértices dessas componentes
+    def _vertices(self, componentes_marcadas):
+        return [self.nomes[v] for v in np.flatnonzero(componentes_marcadas[self.componente]).tolist()]
+
+    def salvar(self, caminho: str) -> None:
+        salvar_npz(caminho, {
+            "versao": np.frombuffer(self.versao.encode("utf-8"), dtype=np.uint8),
+            "nomes": np.array(self.nomes, dtype=str),
+            "componente": self.componente,
+            "bits": self.bits,
+        })
+
+    @classmethod
+    def carregar(cls, caminho: str):
+        v = mapear_npz(caminho)
+        return cls(v["nomes"].tolist(), v["componente"], v["bits"], bytes(v["versao"]).decode("utf-8"))
+
+# bitset (palavras uint64) -> vetor booleano com "quantidade" posições
+def _desempacotar(palavras, quantidade):
+    bytes_ = np.ascontiguousarray(palavras, dtype="<u8").view(np.uint8)
+    return np.unpackbits(bytes_, bitorder="little")[:quantidade].astype(bool)
+
+def construir_indice_alcance(grafo) -> IndiceAlcance:
+    if not isinstance(grafo, GrafoCSR):
+        grafo = GrafoCSR.de_lista_adjacencia(grafo)
+
+    condensacao = grafo.condensacao
+    quantidade = condensacao.num_componentes
+    palavras = (quantidade + 63) // 64
+
+    bits = np.zeros((quantidade, palavras), dtype=np.uint64)
+    offsets = condensacao.dag_offsets
+    alvos = condensacao.dag_alvos
+
+    # ordem topológica inversa: os sucessores de c (números maiores) já estão prontos
+    for c in range(quantidade - 1, -1, -1):
+        bits[c, c >> 6] = np.uint64(1) << np.uint64(c & 63)
+        sucessores = alvos[offsets[c]:offsets[c + 1]]
+        if len(sucessores):
+            bits[c] |= np.bitwise_or.reduce(bits[sucessores], axis=0)
+
+    return IndiceAlcance(grafo.nomes, condensacao.componente, bits, grafo.versao)
+
+# Lê o índice do disco se foi gerado para esta mesma versão do grafo;
+# caso contrário constrói e salva para as próximas execuções
+def carregar_indice_alcance(grafo: GrafoCSR, caminho: str) -> IndiceAlcance:
+    if os.path.exists(caminho):
+        try:
+            indice = IndiceAlcance.carregar(caminho)
+            if indice.versao == grafo.versao:
+                return indice
+        except (OSError, ValueError, KeyError):
+            pass
+
+    indice = construir_indice_alcance(grafo)
+
+    try:
+        indice.salvar(caminho)
+    except OSError:
+        pass
+
+    return indice
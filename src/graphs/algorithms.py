@@ -2,12 +2,24 @@ import heapq
 import sys
 from collections import deque
 
+import numpy as np
+
+from graphs.csr import GrafoCSR, _vista, compacto
+
 def dijkstra(lista_adjacencia, v_inicio):
 
     # Definição dos parâmetros:
     #   lista_adjacencia -> lista de adjacencia do grafo: vértice -> [[vértice adjacente, peso]]
     #   v_inicio -> vértice de início que será utilizado como referência para o começo do algoritmo
 
+    # grafo compacto: a busca roda sobre os ids inteiros
+    if isinstance(lista_adjacencia, GrafoCSR):
+        if lista_adjacencia.possui_peso_negativo:
+            return -1
+
+        distancias, _ = _dijkstra_csr(lista_adjacencia, lista_adjacencia.ids[v_inicio])
+        return dict(zip(lista_adjacencia.nomes, distancias))
+
     # checagem para pesos negativos no grafo
     for vertice in lista_adjacencia.keys():
         for v_adjacente, peso in lista_adjacencia[vertice]:
@@ -57,6 +69,11 @@ def dijkstra_path(lista_adjacencia, v_inicio, v_destino):
     #   v_inicio -> vértice de início que será utilizado como referência para o começo do algoritmo
     #   v_destino -> vértice de destino do caminho que será gerado
 
+    # grafo compacto (como os do registro): a busca roda sobre os ids inteiros
+    # e a checagem de pesos negativos usa o valor guardado no grafo
+    if isinstance(lista_adjacencia, GrafoCSR):
+        return _dijkstra_path_csr(lista_adjacencia, v_inicio, v_destino)
+
     # checagem para pesos negativos no grafo
     for vertice in lista_adjacencia.keys():
         for v_adjacente, peso in lista_adjacencia[vertice]:
@@ -93,6 +110,14 @@ def dijkstra_path(lista_adjacencia, v_inicio, v_destino):
         #retira e obtém o valor com menor distância presente na fila de prioridade
         distancia, vertice = heapq.heappop(min_heap)
 
+        # entrada desatualizada: o vértice já saiu da fila antes com uma distância menor
+        if distancia > resultado[vertice]:
+            continue
+
+        # o destino saiu da fila com a distância definitiva: o resto do grafo não muda o caminho
+        if vertice == v_destino:
+            break
+
         # ocorre a verificação de cada vértice adjacente ao vértice analisado
         for v_adjacente, peso in lista_adjacencia[vertice]:
 
@@ -130,12 +155,197 @@ def dijkstra_path(lista_adjacencia, v_inicio, v_destino):
     # retorna o custo e o caminho mais curto para chegar ao vértice de destino partindo do vértice de início
     return resultado[v_destino], caminho
 
+def dijkstra_bidirecional(lista_adjacencia, v_inicio, v_destino):
+
+    # Definição dos parâmetros:
+    #   lista_adjacencia -> GrafoCSR (ou lista de adjacencia em dicionário, convertida para GrafoCSR)
+    #   v_inicio -> vértice de início do caminho
+    #   v_destino -> vértice de destino do caminho
+    #
+    # Caminho mínimo ponto a ponto: uma busca sai do início no grafo original e outra sai do destino
+    # no grafo reverso, sempre expandindo a fronteira de menor distância. A busca para quando a soma
+    # dos topos das duas filas não consegue mais melhorar o melhor encontro já visto (mu).
+    # Retorna (custo, caminho) no mesmo formato de dijkstra_path.
+
+    grafo = compacto(lista_adjacencia)
+
+    # o grafo compacto guarda se há peso negativo, então a checagem não percorre as arestas a cada chamada
+    if grafo.possui_peso_negativo:
+        return -1
+
+    inicio = grafo.ids[v_inicio]
+    destino = grafo.ids[v_destino]
+
+    if inicio == destino:
+        return 0, deque([v_inicio])
+
+    # pela condensação, muitos pares sem caminho são respondidos sem busca nenhuma
+    condensacao = grafo.condensacao
+    if condensacao.sem_rota(inicio, destino):
+        return sys.maxsize, -1
+
+    # a busca para frente só precisa de vértices que ainda podem chegar ao destino (componente <= a do destino)
+    # e a busca para trás só de vértices alcançáveis a partir do início (componente >= a do início)
+    componente = _vista(condensacao.componente)
+    limites = (componente[destino], componente[inicio])
+
+    # [0] -> busca para frente (a partir do início), [1] -> busca para trás (a partir do destino, no reverso)
+    vistas = (grafo.vistas(), grafo.reverso.vistas())
+
+    # distâncias e antecessores ficam em dicionários esparsos: só os vértices tocados pela busca entram,
+    # então o custo da consulta não depende do tamanho do grafo inteiro
+    distancias = ({inicio: 0}, {destino: 0})
+    antecessor = ({inicio: inicio}, {destino: destino})
+    filas = ([(0, inicio)], [(0, destino)])
+
+    # melhor custo encontrado até agora e o vértice onde as duas buscas se encontraram
+    mu = sys.maxsize
+    encontro = -1
+
+    while filas[0] and filas[1]:
+
+        # nenhuma entrada restante pode formar um caminho melhor que mu
+        if filas[0][0][0] + filas[1][0][0] >= mu:
+            break
+
+        # expande o lado cuja fronteira está mais perto da sua origem
+        lado = 0 if filas[0][0][0] <= filas[1][0][0] else 1
+        offsets, alvos, pesos = vistas[lado]
+        dist, dist_outro = distancias[lado], distancias[1 - lado]
+        ant = antecessor[lado]
+        fila = filas[lado]
+
+        distancia, vertice = heapq.heappop(fila)
+
+        # entrada desatualizada: o vértice já saiu da fila com uma distância menor
+        if distancia > dist[vertice]:
+            continue
+
+        limite = limites[lado]
+
+        for i in range(offsets[vertice], offsets[vertice + 1]):
+            v_adjacente = alvos[i]
+
+            # fora das componentes que podem estar no caminho
+            if (componente[v_adjacente] > limite) if lado == 0 else (componente[v_adjacente] < limite):
+                continue
+
+            nova_distancia = distancia + pesos[i]
+
+            if nova_distancia < dist.get(v_adjacente, sys.maxsize):
+                dist[v_adjacente] = nova_distancia
+                ant[v_adjacente] = vertice
+                heapq.heappush(fila, (nova_distancia, v_adjacente))
+
+                # o vértice já foi alcançado pela outra busca: há um caminho completo passando por ele
+                if v_adjacente in dist_outro and nova_distancia + dist_outro[v_adjacente] < mu:
+                    mu = nova_distancia + dist_outro[v_adjacente]
+                    encontro = v_adjacente
+
+    # as buscas nunca se encontraram: não existe caminho
+    if encontro == -1:
+        return sys.maxsize, -1
+
+    # metade do início até o encontro (antecessores da busca para frente)
+    caminho = _montar_caminho(grafo, antecessor[0], inicio, encontro)
+
+    # metade do encontro até o destino (na busca reversa o "antecessor" é o próximo vértice do caminho)
+    atual = encontro
+    while atual != destino:
+        atual = antecessor[1][atual]
+        caminho.append(grafo.nomes[atual])
+
+    return mu, caminho
+
+def dijkstra_lote(lista_adjacencia, pares):
+
+    # Definição dos parâmetros:
+    #   lista_adjacencia -> GrafoCSR (ou lista de adjacencia em dicionário, convertida uma única vez)
+    #   pares -> lista de pares (vértice de início, vértice de destino)
+    #
+    # Caminhos mínimos em lote: os pares são agrupados pela origem e cada origem distinta roda um único
+    # Dijkstra, que para assim que todos os destinos daquela origem saem da fila.
+    # Retorna uma lista de (custo, caminho), na mesma ordem de "pares" e no mesmo formato de dijkstra_path.
+
+    if not isinstance(lista_adjacencia, GrafoCSR):
+        lista_adjacencia = GrafoCSR.de_lista_adjacencia(lista_adjacencia)
+
+    grafo = lista_adjacencia
+
+    if grafo.possui_peso_negativo:
+        return -1
+
+    offsets, alvos, pesos = grafo.vistas()
+    condensacao = grafo.condensacao
+    componente = _vista(condensacao.componente)
+
+    # origem -> conjunto de destinos pedidos a partir dela
+    destinos_por_origem = {}
+    for v_inicio, v_destino in pares:
+        destinos_por_origem.setdefault(grafo.ids[v_inicio], set()).add(grafo.ids[v_destino])
+
+    # (origem, destino) -> (custo, caminho)
+    respostas = {}
+
+    for inicio, destinos in destinos_por_origem.items():
+        distancias = {inicio: 0}
+        antecessor = {inicio: inicio}
+        min_heap = [(0, inicio)]
+
+        # destinos que a condensação já descarta não seguram a busca
+        pendentes = {destino for destino in destinos if not condensacao.sem_rota(inicio, destino)}
+
+        # vértices em componentes depois da última componente de destino não chegam a nenhum destino
+        limite = max((componente[destino] for destino in pendentes), default=-1)
+
+        while min_heap and pendentes:
+            distancia, vertice = heapq.heappop(min_heap)
+
+            # entrada desatualizada
+            if distancia > distancias[vertice]:
+                continue
+
+            # o vértice saiu da fila com a distância definitiva
+            pendentes.discard(vertice)
+
+            for i in range(offsets[vertice], offsets[vertice + 1]):
+                v_adjacente = alvos[i]
+                if componente[v_adjacente] > limite:
+                    continue
+
+                nova_distancia = distancia + pesos[i]
+
+                if nova_distancia < distancias.get(v_adjacente, sys.maxsize):
+                    distancias[v_adjacente] = nova_distancia
+                    antecessor[v_adjacente] = vertice
+                    heapq.heappush(min_heap, (nova_distancia, v_adjacente))
+
+        for destino in destinos:
+            if destino in distancias:
+                respostas[(inicio, destino)] = (distancias[destino], _montar_caminho(grafo, antecessor, inicio, destino))
+            else:
+                respostas[(inicio, destino)] = (sys.maxsize, -1)
+
+    # cada par recebe o próprio deque, mesmo quando o par se repete na entrada
+    resultado = []
+    for v_inicio, v_destino in pares:
+        custo, caminho = respostas[(grafo.ids[v_inicio], grafo.ids[v_destino])]
+        resultado.append((custo, caminho if caminho == -1 else deque(caminho)))
+
+    return resultado
+
 def bellman_ford(vertices, arestas, v_inicio):
 
     # Definição dos parâmetros:
     #   vertices -> lista de vértices
     #   arestas -> lista de arestas onde cada elemento é uma lista organizada da seguinte forma: [vertice de origem, vertice de destino, peso]
     #   v_inicio -> vértice de início que será utilizado como referência para o começo do algoritmo
+    #
+    # Também aceita um GrafoCSR no lugar de "vertices"; nesse caso as arestas são lidas do próprio grafo
+    # e "arestas" é ignorado (pode ser None)
+
+    if isinstance(vertices, GrafoCSR):
+        return _bellman_ford_csr(vertices, v_inicio)
 
     # o resultado sai no seguinte formato: vértice -> distância mínima
     resultado = {}
@@ -153,6 +363,9 @@ def bellman_ford(vertices, arestas, v_inicio):
     # começo das iterações do algoritmo
     for i in range (iteracoes):
 
+        # indica se alguma distância mudou nesta passada
+        mudou = False
+
         #percorre todas as arestas
         for aresta in arestas:
             v_origem = aresta[0]
@@ -166,6 +379,12 @@ def bellman_ford(vertices, arestas, v_inicio):
 
                 # a distância do vértice de destino é atualizada
                 resultado[v_destino] = resultado[v_origem] + peso
+                mudou = True
+
+        # uma passada sem mudanças significa que as distâncias convergiram:
+        # as passadas restantes (e a checagem de ciclo negativo) não mudariam nada
+        if not mudou:
+            return resultado
     
     # aqui é feita mais uma iteração para checar se há ciclos negativos
     for aresta in arestas:
@@ -183,12 +402,171 @@ def bellman_ford(vertices, arestas, v_inicio):
     #retorna o resultado
     return resultado
 
+def bellman_ford_fila(vertices, arestas, v_inicio, retornar_ciclo=False):
+
+    # Definição dos parâmetros:
+    #   vertices -> lista de vértices (ou um GrafoCSR, como em bellman_ford)
+    #   arestas -> lista de arestas [vertice de origem, vertice de destino, peso]
+    #   v_inicio -> vértice de início
+    #   retornar_ciclo -> se True, em caso de ciclo negativo retorna a lista de vértices do ciclo
+    #                     (o primeiro vértice repetido no final) em vez de -1
+    #
+    # Bellman-Ford baseado em fila (SPFA): em vez de passar por todas as arestas n - 1 vezes, só relaxa
+    # as arestas que saem de vértices cuja distância acabou de mudar, e termina quando a fila esvazia.
+    # O resultado é o mesmo de bellman_ford: vértice -> distância mínima, ou -1 se houver ciclo negativo.
+
+    # lista de adjacência por índice: vizinhos[u] = [(v, peso)]
+    if isinstance(vertices, GrafoCSR):
+        nomes = vertices.nomes
+        indices = vertices.ids
+        offsets, alvos, pesos = vertices.vistas()
+        vizinhos = [
+            [(alvos[i], pesos[i]) for i in range(offsets[u], offsets[u + 1])]
+            for u in range(vertices.num_vertices)
+        ]
+    else:
+        nomes = list(vertices)
+        indices = {vertice: i for i, vertice in enumerate(nomes)}
+        vizinhos = [[] for _ in nomes]
+        for aresta in arestas:
+            vizinhos[indices[aresta[0]]].append((indices[aresta[1]], aresta[2]))
+
+    n = len(nomes)
+    inicio = indices[v_inicio]
+
+    distancias = [sys.maxsize] * n
+    antecessor = [-1] * n
+
+    # número de arestas do caminho atual até cada vértice: um caminho mínimo tem no máximo n - 1,
+    # então chegar a n arestas só é possível passando por um ciclo negativo
+    arestas_no_caminho = [0] * n
+
+    distancias[inicio] = 0
+
+    fila = deque([inicio])
+    na_fila = bytearray(n)
+    na_fila[inicio] = 1
+
+    while fila:
+        vertice = fila.popleft()
+        na_fila[vertice] = 0
+
+        for v_adjacente, peso in vizinhos[vertice]:
+            nova_distancia = distancias[vertice] + peso
+
+            if nova_distancia < distancias[v_adjacente]:
+                distancias[v_adjacente] = nova_distancia
+                antecessor[v_adjacente] = vertice
+                arestas_no_caminho[v_adjacente] = arestas_no_caminho[vertice] + 1
+
+                if arestas_no_caminho[v_adjacente] >= n:
+                    if retornar_ciclo:
+                        return _extrair_ciclo(antecessor, v_adjacente, n, nomes)
+                    return -1
+
+                # só entra na fila se ainda não estiver lá
+                if not na_fila[v_adjacente]:
+                    na_fila[v_adjacente] = 1
+                    fila.append(v_adjacente)
+
+    return dict(zip(nomes, distancias))
+
+# Recupera o ciclo negativo a partir de um vértice cujo caminho tem n arestas
+def _extrair_ciclo(antecessor, vertice, n, nomes):
+    # voltar n vezes pelos antecessores garante cair dentro do ciclo
+    for _ in range(n):
+        vertice = antecessor[vertice]
+
+    ciclo = [vertice]
+    atual = antecessor[vertice]
+    while atual != vertice:
+        ciclo.append(atual)
+        atual = antecessor[atual]
+    ciclo.append(vertice)
+
+    # os antecessores percorrem o ciclo de trás para frente
+    ciclo.reverse()
+    return [nomes[v] for v in ciclo]
+
+def bellman_ford_vetorizado(vertices, arestas, v_inicio, retornar_vetor=False):
+
+    # Definição dos parâmetros:
+    #   vertices -> lista de vértices (ou um GrafoCSR, como em bellman_ford)
+    #   arestas -> lista de arestas [vertice de origem, vertice de destino, peso]
+    #   v_inicio -> vértice de início
+    #   retornar_vetor -> se True, retorna o vetor de distâncias (np.inf quando inalcançável)
+    #                     na ordem dos vértices, em vez do dicionário
+    #
+    # Mesmo algoritmo de bellman_ford, mas cada passada relaxa todas as arestas de uma vez com NumPy:
+    # calcula distancia[origem] + peso para todas as arestas e faz um "scatter-min" no destino.
+    # Retorna -1 se houver ciclo negativo.
+
+    if isinstance(vertices, GrafoCSR):
+        grafo = vertices
+        inteiros = False
+    else:
+        nomes = list(vertices)
+        indices = {vertice: i for i, vertice in enumerate(nomes)}
+        grafo = GrafoCSR.de_arestas(
+            nomes,
+            [indices[aresta[0]] for aresta in arestas],
+            [indices[aresta[1]] for aresta in arestas],
+            [aresta[2] for aresta in arestas],
+            ids=indices,
+        )
+        # com pesos inteiros o dicionário volta com inteiros, como em bellman_ford
+        inteiros = all(isinstance(aresta[2], int) for aresta in arestas)
+
+    n = grafo.num_vertices
+
+    # o grafo reverso tem as arestas agrupadas pelo destino: o scatter-min vira um
+    # np.minimum.reduceat sobre os grupos, sem precisar ordenar nada a cada passada
+    reverso = grafo.reverso
+    origens = reverso.alvos
+    pesos = reverso.pesos
+
+    # somente destinos com arestas de entrada (reduceat não aceita grupos vazios)
+    destinos = np.flatnonzero(np.diff(reverso.offsets))
+    inicios = reverso.offsets[destinos]
+
+    distancias = np.full(n, np.inf)
+    distancias[grafo.ids[v_inicio]] = 0
+
+    # n - 1 passadas de relaxamento e uma passada extra para detectar ciclos negativos;
+    # inf + peso continua inf, então vértices ainda inalcançáveis não relaxam ninguém
+    for passada in range(n if len(destinos) else 0):
+        candidatas = np.minimum.reduceat(distancias[origens] + pesos, inicios)
+        atuais = distancias[destinos]
+
+        # nenhuma distância diminuiu: convergiu
+        if not (candidatas < atuais).any():
+            break
+
+        if passada == n - 1:
+            return -1
+
+        distancias[destinos] = np.minimum(atuais, candidatas)
+
+    if retornar_vetor:
+        return distancias
+
+    resultado = {}
+    for nome, distancia in zip(grafo.nomes, distancias.tolist()):
+        if distancia == np.inf:
+            resultado[nome] = sys.maxsize
+        else:
+            resultado[nome] = int(distancia) if inteiros else distancia
+
+    return resultado
+
 def bfs(lista_adjacencia, v_inicio):
 
     # Definição dos parâmetros:
     #   lista_adjacencia -> lista de adjacencia do grafo: vértice -> [[vértice adjacente, peso]]
     #   v_inicio -> vértice de início que será utilizado como referência para o começo do algoritmo
 
+    if isinstance(lista_adjacencia, GrafoCSR):
+        return _bfs_csr(lista_adjacencia, v_inicio)
 
     # o resultado do algoritmo será uma lista com a sequência de vertices visitados pelo bfs
     resultado = []
@@ -230,68 +608,373 @@ def bfs(lista_adjacencia, v_inicio):
     # retorna o resultado
     return resultado
 
+def bfs_niveis(lista_adjacencia, v_inicio, alfa=14, beta=24):
+
+    # Definição dos parâmetros:
+    #   lista_adjacencia -> lista de adjacencia do grafo (dicionário ou GrafoCSR)
+    #   v_inicio -> vértice de início que será utilizado como referência para o começo do algoritmo
+    #   alfa, beta -> limiares da troca de direção: a busca passa para "bottom-up" quando as arestas
+    #                 que saem da fronteira passam de 1/alfa das arestas dos vértices ainda não visitados,
+    #                 e volta para "top-down" quando a fronteira fica menor que 1/beta dos vértices
+    #
+    # BFS sincronizada por níveis: cada nível é processado de uma vez como vetores NumPy.
+    #   top-down -> junta as arestas de saída de toda a fronteira e fica com os vizinhos ainda não visitados
+    #   bottom-up -> cada vértice não visitado procura, nas arestas de entrada (grafo reverso),
+    #                algum antecessor que esteja na fronteira
+    # Em grafos "mundo pequeno", com hubs, poucos níveis cobrem quase todos os vértices, e nos níveis
+    # grandes o bottom-up olha bem menos arestas que o top-down.
+    #
+    # Retorna um dicionário com:
+    #   "ordem" -> vértices na ordem de visitação (nível a nível; dentro de um nível, na ordem dos pais)
+    #   "nomes" -> nomes dos vértices, na ordem dos ids usados nos vetores abaixo
+    #   "distancias" -> número de arestas até cada id (-1 se não for alcançável)
+    #   "pais" -> id do pai de cada id na árvore da busca (-1 para a origem e para os não alcançados)
+    #   "direcoes" -> direção usada em cada nível ("top-down" ou "bottom-up")
+    #
+    # Nos níveis top-down a ordem é exatamente a de bfs; nos níveis bottom-up os irmãos (vértices com
+    # o mesmo pai) ficam na ordem dos ids, já que a aresta usada não é a primeira da lista do pai.
+
+    grafo = lista_adjacencia
+    if not isinstance(grafo, GrafoCSR):
+        grafo = GrafoCSR.de_lista_adjacencia(lista_adjacencia)
+
+    n = grafo.num_vertices
+    reverso = grafo.reverso
+    grau_saida = np.diff(grafo.offsets)
+
+    distancias = np.full(n, -1, dtype=np.int64)
+    pais = np.full(n, -1, dtype=np.int32)
+
+    # posição de cada vértice na ordem de visitação (define a ordem dos filhos no nível seguinte)
+    posicao = np.full(n, -1, dtype=np.int64)
+
+    inicio = grafo.ids[v_inicio]
+    distancias[inicio] = 0
+    posicao[inicio] = 0
+
+    fronteira = np.array([inicio], dtype=np.int64)
+    niveis = [fronteira]
+    direcoes = []
+    visitados = 1
+
+    # arestas que saem dos vértices ainda não visitados
+    arestas_nao_visitadas = grafo.num_arestas - int(grau_saida[inicio])
+    bottom_up = False
+    nivel = 0
+
+    while len(fronteira):
+        nivel += 1
+        arestas_fronteira = int(grau_saida[fronteira].sum())
+
+        if not bottom_up and arestas_fronteira > arestas_nao_visitadas / alfa:
+            bottom_up = True
+        elif bottom_up and len(fronteira) < n / beta:
+            bottom_up = False
+
+        if bottom_up:
+            direcoes.append("bottom-up")
+
+            na_fronteira = np.zeros(n, dtype=bool)
+            na_fronteira[fronteira] = True
+
+            candidatos = np.flatnonzero(distancias == -1)
+            antecessores, donos = _arestas_de(reverso.offsets, reverso.alvos, candidatos)
+
+            # só interessam as arestas de entrada que vêm da fronteira; o pai é o que foi visitado primeiro
+            mascara = na_fronteira[antecessores]
+            antecessores = antecessores[mascara]
+            donos = donos[mascara]
+
+            ordem = np.lexsort((posicao[antecessores], donos))
+            antecessores = antecessores[ordem]
+            donos = donos[ordem]
+            primeiro = np.ones(len(donos), dtype=bool)
+            primeiro[1:] = donos[1:] != donos[:-1]
+
+            novos = donos[primeiro]
+            pais_novos = antecessores[primeiro]
+
+            # filhos na ordem dos pais
+            ordem = np.lexsort((novos, posicao[pais_novos]))
+            novos = novos[ordem]
+            pais_novos = pais_novos[ordem]
+        else:
+            direcoes.append("top-down")
+
+            vizinhos, donos = _arestas_de(grafo.offsets, grafo.alvos, fronteira)
+
+            mascara = distancias[vizinhos] == -1
+            vizinhos = vizinhos[mascara]
+            donos = donos[mascara]
+
+            # cada vizinho fica com a primeira aresta que o alcançou, preservando a ordem da busca
+            _, primeiro = np.unique(vizinhos, return_index=True)
+            primeiro.sort()
+
+            novos = vizinhos[primeiro]
+            pais_novos = donos[primeiro]
+
+        distancias[novos] = nivel
+        pais[novos] = pais_novos
+        posicao[novos] = np.arange(visitados, visitados + len(novos))
+        visitados += len(novos)
+        arestas_nao_visitadas -= int(grau_saida[novos].sum())
+
+        if len(novos):
+            niveis.append(novos)
+        fronteira = novos
+
+    # o último nível não encontra ninguém e não conta como nível da busca
+    direcoes.pop()
+
+    nomes = grafo.nomes
+    return {
+        "ordem": [nomes[v] for v in np.concatenate(niveis).tolist()],
+        "nomes": nomes,
+        "distancias": distancias,
+        "pais": pais,
+        "direcoes": direcoes,
+    }
+
+# Todas as arestas que saem dos vértices informados, como dois vetores (destino, origem),
+# na ordem dos vértices e, para cada vértice, na ordem da sua lista de adjacência
+def _arestas_de(offsets, alvos, vertices):
+    inicios = offsets[vertices]
+    quantidades = offsets[vertices + 1] - inicios
+    total = int(quantidades.sum())
+
+    # índice de cada aresta: o início do bloco do vértice + a posição dentro do bloco
+    deslocamento = np.repeat(inicios - (np.cumsum(quantidades) - quantidades), quantidades)
+    indices = deslocamento + np.arange(total)
+
+    return alvos[indices].astype(np.int64), np.repeat(vertices, quantidades)
+
+# Tipos de aresta na classificação da busca em profundidade (códigos guardados no vetor "tipos")
+ARESTA_ARVORE = 0
+ARESTA_RETORNO = 1
+ARESTA_AVANCO = 2
+ARESTA_CRUZAMENTO = 3
+
+TIPOS_ARESTA = ("arvore", "retorno", "avanco", "cruzamento")
+
 def dfs(lista_adjacencia, v_inicio):
 
     # Definição dos parâmetros:
     #   lista_adjacencia -> lista de adjacencia do grafo: vértice -> [[vértice adjacente, peso]]
     #   v_inicio -> vértice de início que será utilizado como referência para o começo do algoritmo
 
-    # o resultado do algoritmo será uma lista com a sequência de vertices visitados pelo bfs
-    resultado = []
+    # o resultado do algoritmo é a lista com a sequência de vertices visitados pelo dfs
+    return dfs_classificada(lista_adjacencia, v_inicio, classificar=False)["ordem"]
 
-    # cria-se e popula-se um dicionário (vertice -> estado de visitação) para determinar se um vertice já foi ou não visitado pelo algoritmo
-    visitado = {}
+def dfs_classificada(lista_adjacencia, v_inicio, classificar=True, ao_classificar=None):
 
-    # um conjunto auxiliar para rastrear quem está na pilha de execução agora, usa isso para pegar ciclos e saber o tipo da aresta e classifica-la.
-    pilha_recursao = set()
+    # Definição dos parâmetros:
+    #   lista_adjacencia -> lista de adjacencia do grafo (dicionário ou GrafoCSR)
+    #   v_inicio -> vértice de início que será utilizado como referência para o começo do algoritmo
+    #   classificar -> se True, guarda a classificação de cada aresta em vetores compactos
+    #   ao_classificar -> função opcional chamada como ao_classificar(origem, destino, tipo) para cada aresta,
+    #                     com tipo em TIPOS_ARESTA ("arvore", "retorno", "avanco" ou "cruzamento")
+    #
+    # Busca em profundidade com pilha explícita (sem recursão, então não esbarra no limite de recursão
+    # do Python em caminhos longos) e sem nenhuma saída no console. Retorna um dicionário com:
+    #   "ordem" -> vértices na ordem de visitação (o mesmo resultado de dfs)
+    #   "nomes" -> nomes dos vértices, na ordem dos ids usados nos vetores abaixo
+    #   "descoberta", "termino" -> tempos de descoberta e de término de cada id (-1 se não foi visitado)
+    #   "origens", "destinos", "tipos" -> ids e código (ARESTA_*) de cada aresta classificada,
+    #                                     na ordem em que foram examinadas (vazios se classificar=False)
+
+    grafo = lista_adjacencia
+    if not isinstance(grafo, GrafoCSR):
+        grafo = GrafoCSR.de_lista_adjacencia(lista_adjacencia)
+
+    offsets, alvos, _ = grafo.vistas()
+    nomes = grafo.nomes
+    n = grafo.num_vertices
+
+    registrar = classificar or ao_classificar is not None
+
+    descoberta = [-1] * n
+    termino = [-1] * n
+
+    # vértices que estão na pilha agora: uma aresta para um deles fecha um ciclo (aresta de retorno)
+    na_pilha = bytearray(n)
+
+    origens = []
+    destinos = []
+    tipos = bytearray()
+
+    inicio = grafo.ids[v_inicio]
+    ordem = [inicio]
+    descoberta[inicio] = 0
+    na_pilha[inicio] = 1
+    tempo = 1
+
+    # cada posição da pilha guarda o vértice e o índice da próxima aresta dele a examinar
+    pilha = [inicio]
+    proxima = [offsets[inicio]]
+
+    while pilha:
+        vertice = pilha[-1]
+        i = proxima[-1]
+
+        # todas as arestas do vértice já foram examinadas: ele termina e sai da pilha
+        if i == offsets[vertice + 1]:
+            pilha.pop()
+            proxima.pop()
+            na_pilha[vertice] = 0
+            termino[vertice] = tempo
+            tempo += 1
+            continue
+
+        proxima[-1] = i + 1
+        v_adjacente = alvos[i]
+
+        if descoberta[v_adjacente] == -1:
+            # ainda não visitado: aresta de árvore, a busca desce para o vizinho
+            tipo = ARESTA_ARVORE
+
+            descoberta[v_adjacente] = tempo
+            tempo += 1
+            na_pilha[v_adjacente] = 1
+            ordem.append(v_adjacente)
+
+            pilha.append(v_adjacente)
+            proxima.append(offsets[v_adjacente])
+        elif na_pilha[v_adjacente]:
+            tipo = ARESTA_RETORNO
+        elif descoberta[vertice] < descoberta[v_adjacente]:
+            # já terminado e descendente do vértice atual
+            tipo = ARESTA_AVANCO
+        else:
+            # já terminado em outro ramo da busca
+            tipo = ARESTA_CRUZAMENTO
+
+        if registrar:
+            if classificar:
+                origens.append(vertice)
+                destinos.append(v_adjacente)
+                tipos.append(tipo)
+            if ao_classificar is not None:
+                ao_classificar(nomes[vertice], nomes[v_adjacente], TIPOS_ARESTA[tipo])
+
+    return {
+        "ordem": [nomes[v] for v in ordem],
+        "nomes": nomes,
+        "descoberta": np.array(descoberta, dtype=np.int64),
+        "termino": np.array(termino, dtype=np.int64),
+        "origens": np.array(origens, dtype=np.int32),
+        "destinos": np.array(destinos, dtype=np.int32),
+        "tipos": np.frombuffer(bytes(tipos), dtype=np.uint8),
+    }
+
+
+#####################################
+# Versões para o grafo compacto (GrafoCSR)
+#
+# Mesma lógica das funções acima, mas sobre ids inteiros e os vetores do grafo:
+# distâncias, antecessores e estados de visitação ficam em listas/bytearrays indexados pelo id,
+# sem tuplas nem strings no laço principal. Os resultados voltam com os nomes dos vértices,
+# no mesmo formato das versões com dicionário.
+#####################################
+
+def _dijkstra_csr(grafo, inicio):
 
-    vertices = lista_adjacencia.keys()
-    for vertice in vertices:
-        visitado[vertice] = False
+    # Definição dos parâmetros:
+    #   grafo -> GrafoCSR
+    #   inicio -> id do vértice de início
 
-    
-    # o vértice de início tem seu estado de visitação mudado para True, indicando que já está sendo visitado
-    visitado[v_inicio] = True
+    offsets, alvos, pesos = grafo.vistas()
 
-    # início da chamada recursiva da função auxiliar de "mergulho" na profundidade do grafo
-    # adicionado o parametro de pilha_recursao
-    dfs_aux(v_inicio, visitado, lista_adjacencia, resultado,pilha_recursao)
+    # distância e antecessor de cada id (-1 indica que não há antecessor)
+    distancias = [sys.maxsize] * grafo.num_vertices
+    antecessor = [-1] * grafo.num_vertices
 
-    # retorna o resultado
-    return resultado
+    distancias[inicio] = 0
+    antecessor[inicio] = inicio
 
-def dfs_aux(vertice, visitado, lista_adjacencia, resultado,pilha_recursao):
+    min_heap = [(0, inicio)]
 
-    # Definição dos parâmetros:
-    #   vertice -> vértice que está sendo visitado pelo algoritmo
-    #   visitado -> dicionário com os estados de visitação dos vértices
-    #   lista_adjacencia -> lista de adjacencia do grafo: vértice -> [[vértice adjacente, peso]]
-    #   resultado -> lista com a sequência de vértices visitados pelo dfs
+    while min_heap:
+        distancia, vertice = heapq.heappop(min_heap)
 
-    # o vértice é marcado como visitado pelo algoritmo e adicionado ao resultado
-    visitado[vertice] = True
-    #adiciona o vertice atual a pilha e a pilha de recursao
-    pilha_recursao.add(vertice)
-    resultado.append(vertice)
+        # entrada desatualizada: o vértice já foi fechado com uma distância menor
+        if distancia > distancias[vertice]:
+            continue
 
-    # para cada vértice adjacente ao vértice visitado
-    for v_adjacente, peso in lista_adjacencia[vertice]:
-            
-            # se o vértice adjacente ainda não foi visitado
-            if visitado[v_adjacente] == False:
+        for i in range(offsets[vertice], offsets[vertice + 1]):
+            v_adjacente = alvos[i]
+            nova_distancia = distancia + pesos[i]
 
-                # Se não foi visitado, é uma aresta de árvore,logo um caminho novo
-                print(f"Aresta de Árvore {vertice} -> {v_adjacente}")
+            if nova_distancia < distancias[v_adjacente]:
+                distancias[v_adjacente] = nova_distancia
+                antecessor[v_adjacente] = vertice
+                heapq.heappush(min_heap, (nova_distancia, v_adjacente))
 
-                # ocorre a chamada recursiva da função auxiliar, iniciando o processo de visitação com o vértice adjacente
-                dfs_aux(v_adjacente, visitado, lista_adjacencia, resultado,pilha_recursao)
-            else:
-                # Se o vizinho estiver na pilha de recursão,isso significa que é uma aresta de retorno,indicando um ciclo
-                if v_adjacente in pilha_recursao:
-                    print(f"Aresta de Retorno {vertice} -> {v_adjacente} ")
-                
-                # Se já foi visitado mas não está na pilha, é aresta de avanço
-                else:
-                    print(f"[Aresta de Avanço] {vertice} -> {v_adjacente}")
-    # Remove o vértice da pilha antes de voltar
-    pilha_recursao.remove(vertice)
+    return distancias, antecessor
+
+# Reconstrói o caminho (deque de nomes) a partir da lista de antecessores
+def _montar_caminho(grafo, antecessor, inicio, destino):
+    caminho = deque()
+    atual = destino
+
+    caminho.appendleft(grafo.nomes[atual])
+    while atual != inicio:
+        atual = antecessor[atual]
+        caminho.appendleft(grafo.nomes[atual])
+
+    return caminho
+
+# No grafo compacto o caminho entre dois vértices usa a busca bidirecional
+def _dijkstra_path_csr(grafo, v_inicio, v_destino):
+    return dijkstra_bidirecional(grafo, v_inicio, v_destino)
+
+def _bellman_ford_csr(grafo, v_inicio):
+    n = grafo.num_vertices
+    origens = memoryview(grafo.origens())
+    _, alvos, pesos = grafo.vistas()
+
+    distancias = [sys.maxsize] * n
+    distancias[grafo.ids[v_inicio]] = 0
+
+    # n - 1 iterações sobre todas as arestas, parando antes se uma passada não mudar nada
+    for _ in range(n - 1):
+        mudou = False
+        for i in range(grafo.num_arestas):
+            d_origem = distancias[origens[i]]
+            if d_origem != sys.maxsize and d_origem + pesos[i] < distancias[alvos[i]]:
+                distancias[alvos[i]] = d_origem + pesos[i]
+                mudou = True
+
+        if not mudou:
+            return dict(zip(grafo.nomes, distancias))
+
+    # iteração extra para detectar ciclos negativos
+    for i in range(grafo.num_arestas):
+        d_origem = distancias[origens[i]]
+        if d_origem != sys.maxsize and d_origem + pesos[i] < distancias[alvos[i]]:
+            return -1
+
+    return dict(zip(grafo.nomes, distancias))
+
+def _bfs_csr(grafo, v_inicio):
+    offsets, alvos, _ = grafo.vistas()
+
+    inicio = grafo.ids[v_inicio]
+    visitado = bytearray(grafo.num_vertices)
+    visitado[inicio] = 1
+
+    # a própria lista de resultado serve de fila: "frente" aponta para o próximo vértice a expandir
+    resultado = [inicio]
+    frente = 0
+
+    while frente < len(resultado):
+        vertice = resultado[frente]
+        frente += 1
+
+        for i in range(offsets[vertice], offsets[vertice + 1]):
+            v_adjacente = alvos[i]
+            if not visitado[v_adjacente]:
+                visitado[v_adjacente] = 1
+                resultado.append(v_adjacente)
+
+    return [grafo.nomes[v] for v in resultado]
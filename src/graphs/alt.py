@@ -0,0 +1,209 @@
+import heapq
+import os
+import sys
+
+import numpy as np
+
+from graphs.algorithms import _dijkstra_csr, _montar_caminho
+from graphs.csr import GrafoCSR, _vista
+from graphs.snapshot import mapear_npz, salvar_npz
+
+# ALT: A* com landmarks e desigualdade triangular.
+#
+# Para um conjunto pequeno de vértices "landmark" L guardamos as distâncias d(L, v) e d(v, L)
+# para todos os vértices. Pela desigualdade triangular, para quaisquer v e t:
+#   d(v, t) >= d(L, t) - d(L, v)
+#   d(v, t) >= d(v, L) - d(t, L)
+# O maior desses limites entre os landmarks é uma heurística admissível (e consistente) para o A*,
+# que não precisa de coordenadas geográficas e faz a busca assentar bem menos vértices que o Dijkstra.
+
+
+# Distâncias de "inicio" para todos os vértices, com np.inf para os inalcançáveis
+def _distancias(grafo, inicio):
+    distancias, _ = _dijkstra_csr(grafo, inicio)
+    vetor = np.array(distancias, dtype=np.float64)
+    vetor[vetor == sys.maxsize] = np.inf
+    return vetor
+
+# Escolhe k landmarks:
+#   "distante" -> começa pelo vértice de maior grau e escolhe sempre o vértice mais longe dos já escolhidos
+#   "grau" -> os k vértices de maior grau (entrada + saída)
+def escolher_landmarks(grafo: GrafoCSR, k: int = 8, estrategia: str = "distante") -> list[int]:
+    n = grafo.num_vertices
+    k = min(k, n)
+
+    grau_saida = np.diff(grafo.offsets)
+    grau_entrada = np.diff(grafo.reverso.offsets)
+    grau = grau_saida + grau_entrada
+
+    if estrategia == "grau":
+        return np.argsort(-grau, kind="stable")[:k].tolist()
+
+    if estrategia != "distante":
+        raise ValueError(f"Estratégia de landmarks desconhecida: {estrategia}")
+
+    # vértices sem arestas de saída (ou de entrada) dão limites fracos em uma das direções
+    candidatos = (grau_saida > 0) & (grau_entrada > 0)
+    if not candidatos.any():
+        candidatos[:] = True
+
+    landmarks = [int(np.argmax(np.where(candidatos, grau, -1)))]
+
+    # menor distância (ida + volta) de cada vértice até o conjunto de landmarks
+    proximidade = np.full(n, np.inf)
+
+    while len(landmarks) < k:
+        ultimo = landmarks[-1]
+        ida_volta = _distancias(grafo, ultimo) + _distancias(grafo.reverso, ultimo)
+        proximidade = np.minimum(proximidade, ida_volta)
+
+        # vértices ainda não alcançados (np.inf) são os mais "distantes" e entram primeiro
+        pontuacao = np.where(candidatos, proximidade, -1.0)
+        pontuacao[landmarks] = -1.0
+        proximo = int(np.argmax(pontuacao))
+
+        if pontuacao[proximo] < 0:
+            break
+        landmarks.append(proximo)
+
+    return landmarks
+
+# Tabelas (k x n): de[i][v] = d(landmark_i, v) e para[i][v] = d(v, landmark_i)
+def construir_tabelas_landmarks(grafo: GrafoCSR, k: int = 8, estrategia: str = "distante") -> dict:
+    landmarks = escolher_landmarks(grafo, k, estrategia)
+
+    de = np.vstack([_distancias(grafo, l) for l in landmarks]) if landmarks else np.empty((0, grafo.num_vertices))
+    para = np.vstack([_distancias(grafo.reverso, l) for l in landmarks]) if landmarks else np.empty((0, grafo.num_vertices))
+
+    return {
+        "versao": grafo.versao,
+        "k": k,
+        "estrategia": estrategia,
+        "landmarks": np.array(landmarks, dtype=np.int32),
+        "de": de,
+        "para": para,
+    }
+
+# Lê as tabelas do disco se foram geradas para esta mesma versão do grafo, com os mesmos k e estratégia
+# (a escolha "distante" pode parar antes de k landmarks, então o número de landmarks não identifica k);
+# caso contrário constrói e salva para as próximas execuções
+def carregar_tabelas_landmarks(grafo: GrafoCSR, caminho: str, k: int = 8, estrategia: str = "distante") -> dict:
+    if os.path.exists(caminho):
+        try:
+            vetores = mapear_npz(caminho)
+            versao = bytes(vetores["versao"]).decode("utf-8")
+            k_salvo = int(vetores["k"][0])
+            estrategia_salva = bytes(vetores["estrategia"]).decode("utf-8")
+            if versao == grafo.versao and k_salvo == k and estrategia_salva == estrategia:
+                vetores["versao"] = versao
+                vetores["k"] = k_salvo
+                vetores["estrategia"] = estrategia_salva
+                return vetores
+        except (OSError, ValueError, KeyError, IndexError):
+            pass
+
+    tabelas = construir_tabelas_landmarks(grafo, k, estrategia)
+
+    try:
+        salvar_npz(caminho, {
+            "versao": np.frombuffer(tabelas["versao"].encode("utf-8"), dtype=np.uint8),
+            "k": np.array([k], dtype=np.int64),
+            "estrategia": np.frombuffer(estrategia.encode("utf-8"), dtype=np.uint8),
+            "landmarks": tabelas["landmarks"],
+            "de": tabelas["de"],
+            "para": tabelas["para"],
+        })
+    except OSError:
+        pass
+
+    return tabelas
+
+def dijkstra_alt(grafo, v_inicio, v_destino, tabelas=None, estatisticas=None):
+
+    # Definição dos parâmetros:
+    #   grafo -> GrafoCSR (ou lista de adjacencia em dicionário, convertida para GrafoCSR)
+    #   v_inicio -> vértice de início do caminho
+    #   v_destino -> vértice de destino do caminho
+    #   tabelas -> tabelas de landmarks (construir_tabelas_landmarks / carregar_tabelas_landmarks);
+    #              sem tabelas a heurística é zero e a busca vira um Dijkstra com parada no destino
+    #   estatisticas -> dicionário opcional que recebe o número de vértices assentados ("assentados")
+    #
+    # Retorna (custo, caminho) no mesmo formato de dijkstra_path.
+
+    if not isinstance(grafo, GrafoCSR):
+        grafo = GrafoCSR.de_lista_adjacencia(grafo)
+
+    if grafo.possui_peso_negativo:
+        return -1
+
+    inicio = grafo.ids[v_inicio]
+    destino = grafo.ids[v_destino]
+    offsets, alvos, pesos = grafo.vistas()
+
+    # heurística h(v): limite inferior de d(v, destino), calculado só para os vértices tocados
+    if tabelas is not None and len(tabelas["landmarks"]):
+        de = [_vista(linha) for linha in tabelas["de"]]
+        para = [_vista(linha) for linha in tabelas["para"]]
+
+        # colunas do destino: d(L, destino) e d(destino, L) para cada landmark
+        de_destino = [linha[destino] for linha in de]
+        para_destino = [linha[destino] for linha in para]
+        limites = list(zip(de, de_destino, para, para_destino))
+
+        def heuristica(v):
+            melhor = 0.0
+            for linha_de, d_l_t, linha_para, d_t_l in limites:
+                # inf - inf (landmark sem relação com v nem com o destino) não dá limite nenhum
+                limite = d_l_t - linha_de[v]
+                if limite > melhor:
+                    melhor = limite
+                limite = linha_para[v] - d_t_l
+                if limite > melhor:
+                    melhor = limite
+            return melhor
+    else:
+        def heuristica(v):
+            return 0.0
+
+    distancias = {inicio: 0}
+    antecessor = {inicio: inicio}
+    assentados = 0
+
+    h_inicio = heuristica(inicio)
+    fila = [] if h_inicio == np.inf else [(h_inicio, 0, inicio)]
+
+    while fila:
+        _, distancia, vertice = heapq.heappop(fila)
+
+        # entrada desatualizada
+        if distancia > distancias[vertice]:
+            continue
+
+        assentados += 1
+
+        # heurística consistente: o destino sai da fila com a distância definitiva
+        if vertice == destino:
+            break
+
+        for i in range(offsets[vertice], offsets[vertice + 1]):
+            v_adjacente = alvos[i]
+            nova_distancia = distancia + pesos[i]
+
+            if nova_distancia < distancias.get(v_adjacente, sys.maxsize):
+                h = heuristica(v_adjacente)
+
+                # limite infinito: o destino não é alcançável a partir desse vértice
+                if h == np.inf:
+                    continue
+
+                distancias[v_adjacente] = nova_distancia
+                antecessor[v_adjacente] = vertice
+                heapq.heappush(fila, (nova_distancia + h, nova_distancia, v_adjacente))
+
+    if estatisticas is not None:
+        estatisticas["assentados"] = assentados
+
+    if destino not in distancias:
+        return sys.maxsize, -1
+
+    return distancias[destino], _montar_caminho(grafo, antecessor, inicio, destino)
@@ -0,0 +1,121 @@
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from graphs.algorithms import _dijkstra_csr, _montar_caminho
+from graphs.csr import GrafoCSR, _vista, compacto
+
+# Cache LRU de árvores de caminhos mínimos.
+#
+# Para cada (versão do grafo, origem) o cache guarda o vetor de distâncias e o vetor de antecessores
+# calculados pelo Dijkstra. Qualquer consulta posterior a partir da mesma origem, para qualquer destino,
+# só precisa reconstruir o caminho a partir dos antecessores. Como a chave inclui GrafoCSR.versao,
+# uma árvore nunca é devolvida para um grafo diferente daquele em que foi calculada.
+#
+# Uma lista de adjacência em dicionário é convertida (e a versão recalculada) a cada chamada; para aproveitar
+# o cache, passe um GrafoCSR (como os do registro).
+
+
+class CacheArvores:
+
+    def __init__(self, memoria_max_bytes: int = 64 * 1024 * 1024):
+
+        # Definição dos parâmetros:
+        #   memoria_max_bytes -> orçamento de memória das árvores guardadas; ao passar dele,
+        #                        as árvores usadas há mais tempo são descartadas primeiro
+
+        self.memoria_max_bytes = memoria_max_bytes
+        self.memoria_usada = 0
+
+        # (versão, id da origem) -> (distâncias, antecessores); a ordem do OrderedDict é a ordem de uso
+        self._arvores = OrderedDict()
+        self._trava = threading.Lock()
+
+        self.acertos = 0
+        self.falhas = 0
+        self.remocoes = 0
+
+    # Distâncias (np.inf quando inalcançável) e antecessores (-1 quando não há) a partir de v_inicio
+    def arvore(self, grafo: GrafoCSR, v_inicio):
+        chave = (grafo.versao, grafo.ids[v_inicio])
+
+        with self._trava:
+            if chave in self._arvores:
+                self._arvores.move_to_end(chave)
+                self.acertos += 1
+                return self._arvores[chave]
+            self.falhas += 1
+
+        # o Dijkstra roda fora da trava para não bloquear consultas que acertam o cache
+        distancias, antecessor = _dijkstra_csr(grafo, chave[1])
+
+        distancias = np.array(distancias, dtype=np.float64)
+        distancias[distancias == sys.maxsize] = np.inf
+        antecessor = np.array(antecessor, dtype=np.int32)
+
+        # somente leitura: as mesmas árvores são entregues a todos que consultarem
+        distancias.setflags(write=False)
+        antecessor.setflags(write=False)
+        arvore = (distancias, antecessor)
+
+        tamanho = distancias.nbytes + antecessor.nbytes
+
+        with self._trava:
+            # árvore maior que o orçamento inteiro: devolve sem guardar
+            if tamanho > self.memoria_max_bytes or chave in self._arvores:
+                return arvore
+
+            self._arvores[chave] = arvore
+            self.memoria_usada += tamanho
+
+            while self.memoria_usada > self.memoria_max_bytes:
+                _, (d, a) = self._arvores.popitem(last=False)
+                self.memoria_usada -= d.nbytes + a.nbytes
+                self.remocoes += 1
+
+        return arvore
+
+    # Mesmo formato de algorithms.dijkstra: vértice -> distância mínima
+    def dijkstra(self, lista_adjacencia, v_inicio):
+        grafo = compacto(lista_adjacencia)
+        if grafo.possui_peso_negativo:
+            return -1
+
+        distancias, _ = self.arvore(grafo, v_inicio)
+        return {
+            nome: sys.maxsize if distancia == np.inf else distancia
+            for nome, distancia in zip(grafo.nomes, distancias.tolist())
+        }
+
+    # Mesmo formato de algorithms.dijkstra_path: (custo, caminho)
+    def dijkstra_path(self, lista_adjacencia, v_inicio, v_destino):
+        grafo = compacto(lista_adjacencia)
+        if grafo.possui_peso_negativo:
+            return -1
+
+        distancias, antecessor = self.arvore(grafo, v_inicio)
+        destino = grafo.ids[v_destino]
+
+        if distancias[destino] == np.inf:
+            return sys.maxsize, -1
+
+        caminho = _montar_caminho(grafo, _vista(antecessor), grafo.ids[v_inicio], destino)
+        return distancias[destino].item(), caminho
+
+    def estatisticas(self) -> dict:
+        with self._trava:
+            return {
+                "arvores": len(self._arvores),
+                "memoria_usada": self.memoria_usada,
+                "memoria_max_bytes": self.memoria_max_bytes,
+                "acertos": self.acertos,
+                "falhas": self.falhas,
+                "remocoes": self.remocoes,
+            }
+
+    def limpar(self) -> None:
+        with self._trava:
+            self._arvores.clear()
+            self.memoria_usada = 0
@@ -0,0 +1,285 @@
+import heapq
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from graphs.algorithms import _dijkstra_csr, bfs_niveis
+from graphs.csr import GrafoCSR
+
+# Centralidade de intermediação (betweenness) exata pelo algoritmo de Brandes.
+#
+# Para cada origem s uma busca (BFS sem pesos, Dijkstra com pesos) conta quantos caminhos mínimos
+# chegam em cada vértice (sigma) e, voltando dos vértices mais distantes para os mais próximos,
+# acumula a dependência de s em cada vértice intermediário. A intermediação é a soma das dependências
+# de todas as origens, então as origens podem ser divididas entre processos e os vetores somados no final.
+#
+# Cada processo recebe os vetores do grafo uma única vez, no inicializador do pool, e guarda o GrafoCSR
+# em uma variável global do módulo; as tarefas só carregam a lista de ids de origem.
+
+
+# grafo do processo trabalhador (preenchido por _iniciar_trabalhador)
+_grafo_trabalhador = None
+
+def _iniciar_trabalhador(nomes, offsets, alvos, pesos, dirigido):
+    global _grafo_trabalhador
+    _grafo_trabalhador = GrafoCSR(nomes, offsets, alvos, pesos, dirigido)
+
+def _tarefa(fontes, ponderado):
+    return _dependencias(_grafo_trabalhador, fontes, ponderado)
+
+# Soma das dependências de todas as origens em "fontes"
+def _dependencias(grafo, fontes, ponderado):
+    n = grafo.num_vertices
+    offsets, alvos, pesos = grafo.vistas()
+    total = [0.0] * n
+
+    for s in fontes:
+        distancias = [-1] * n
+        sigma = [0] * n
+        antecessores = [[] for _ in range(n)]
+
+        # vértices na ordem em que tiveram a distância fechada (não decrescente)
+        ordem = []
+
+        distancias[s] = 0
+        sigma[s] = 1
+
+        if ponderado:
+            fila = [(0, s)]
+            fechado = bytearray(n)
+
+            while fila:
+                distancia, vertice = heapq.heappop(fila)
+                if fechado[vertice]:
+                    continue
+                fechado[vertice] = 1
+                ordem.append(vertice)
+
+                for i in range(offsets[vertice], offsets[vertice + 1]):
+                    v_adjacente = alvos[i]
+                    nova_distancia = distancia + pesos[i]
+
+                    if distancias[v_adjacente] == -1 or nova_distancia < distancias[v_adjacente]:
+                        distancias[v_adjacente] = nova_distancia
+                        sigma[v_adjacente] = sigma[vertice]
+                        antecessores[v_adjacente] = [vertice]
+                        heapq.heappush(fila, (nova_distancia, v_adjacente))
+                    elif nova_distancia == distancias[v_adjacente] and not fechado[v_adjacente]:
+                        # outro caminho mínimo com o mesmo custo
+                        sigma[v_adjacente] += sigma[vertice]
+                        antecessores[v_adjacente].append(vertice)
+        else:
+            ordem.append(s)
+            frente = 0
+
+            while frente < len(ordem):
+                vertice = ordem[frente]
+                frente += 1
+                proxima_distancia = distancias[vertice] + 1
+
+                for i in range(offsets[vertice], offsets[vertice + 1]):
+                    v_adjacente = alvos[i]
+
+                    if distancias[v_adjacente] == -1:
+                        distancias[v_adjacente] = proxima_distancia
+                        ordem.append(v_adjacente)
+
+                    if distancias[v_adjacente] == proxima_distancia:
+                        sigma[v_adjacente] += sigma[vertice]
+                        antecessores[v_adjacente].append(vertice)
+
+        # acumulação das dependências, do mais distante para o mais próximo
+        dependencia = [0.0] * n
+        for w in reversed(ordem):
+            fator = (1.0 + dependencia[w]) / sigma[w]
+            for v in antecessores[w]:
+                dependencia[v] += sigma[v] * fator
+            if w != s:
+                total[w] += dependencia[w]
+
+    return np.array(total)
+
+def intermediacao(grafo, ponderado=True, normalizado=False, processos=None, tamanho_lote=None) -> dict:
+
+    # Definição dos parâmetros:
+    #   grafo -> GrafoCSR (ou lista de adjacencia em dicionário, convertida para GrafoCSR)
+    #   ponderado -> True: caminhos mínimos pelos pesos (Dijkstra); False: pelo número de arestas (BFS)
+    #   normalizado -> divide pelo número de pares possíveis ((n-1)(n-2), ou metade no não-direcionado)
+    #   processos -> número de processos (None: os.cpu_count(); 1: roda no próprio processo)
+    #   tamanho_lote -> origens por tarefa (None: divide as origens em ~4 lotes por processo)
+    #
+    # Retorna vértice -> intermediação. No grafo não-direcionado cada par é contado uma vez só.
+
+    if not isinstance(grafo, GrafoCSR):
+        grafo = GrafoCSR.de_lista_adjacencia(grafo)
+
+    if ponderado and grafo.possui_peso_negativo:
+        raise ValueError("Intermediação ponderada exige pesos não negativos")
+
+    n = grafo.num_vertices
+    processos = processos or os.cpu_count() or 1
+    processos = max(1, min(processos, n))
+
+    if processos == 1:
+        total = _dependencias(grafo, range(n), ponderado)
+    else:
+        tamanho_lote = tamanho_lote or max(1, -(-n // (processos * 4)))
+        lotes = [range(i, min(i + tamanho_lote, n)) for i in range(0, n, tamanho_lote)]
+
+        vetores = (grafo.nomes, np.asarray(grafo.offsets), np.asarray(grafo.alvos), np.asarray(grafo.pesos), grafo.dirigido)
+
+        with ProcessPoolExecutor(processos, initializer=_iniciar_trabalhador, initargs=vetores) as executor:
+            total = sum(executor.map(_tarefa, lotes, [ponderado] * len(lotes)))
+
+    # no grafo não-direcionado cada caminho foi contado nas duas direções
+    if not grafo.dirigido:
+        total = total / 2
+
+    if normalizado and n > 2:
+        pares = (n - 1) * (n - 2)
+        total = total / (pares if grafo.dirigido else pares / 2)
+
+    return dict(zip(grafo.nomes, total.tolist()))
+
+
+#####################################
+# Centralidades espectrais e de distância
+#
+# O GrafoCSR já é a matriz de adjacência esparsa (offsets/alvos/pesos no formato CSR). O produto
+# y = A^T x, usado em cada passo da iteração de potência, vira um único np.bincount: cada aresta u -> v
+# contribui x[u] * peso para y[v]. Nenhum laço em Python passa pelos vértices ou arestas.
+#####################################
+
+# y[v] = soma de x[u] * peso(u, v) sobre as arestas u -> v
+def _produto_transposto(origens, alvos, pesos, x, n):
+    return np.bincount(alvos, weights=x[origens] * pesos, minlength=n)
+
+# Pesos usados nas centralidades espectrais: os do grafo, ou 1 para cada aresta
+def _pesos_espectrais(grafo, ponderado):
+    if ponderado:
+        if grafo.possui_peso_negativo:
+            raise ValueError("Centralidade ponderada exige pesos não negativos")
+        return np.asarray(grafo.pesos)
+    return np.ones(grafo.num_arestas)
+
+def pagerank(grafo, amortecimento=0.85, tolerancia=1e-10, max_iteracoes=100, ponderado=False) -> dict:
+
+    # Definição dos parâmetros:
+    #   grafo -> GrafoCSR (ou lista de adjacencia em dicionário, convertida para GrafoCSR)
+    #   amortecimento -> probabilidade de seguir uma aresta em vez de saltar para um vértice qualquer
+    #   tolerancia -> para quando a soma das mudanças (norma L1) fica abaixo de n * tolerancia
+    #   max_iteracoes -> limite de iterações da potência
+    #   ponderado -> se True, a probabilidade de seguir cada aresta é proporcional ao peso
+    #
+    # Vértices sem arestas de saída (dangling) distribuem a sua pontuação igualmente entre todos.
+
+    if not isinstance(grafo, GrafoCSR):
+        grafo = GrafoCSR.de_lista_adjacencia(grafo)
+
+    n = grafo.num_vertices
+    if n == 0:
+        return {}
+
+    origens = grafo.origens()
+    alvos = np.asarray(grafo.alvos)
+    pesos = _pesos_espectrais(grafo, ponderado)
+
+    # probabilidade de transição de cada aresta: peso / soma dos pesos que saem da origem
+    saida = np.bincount(origens, weights=pesos, minlength=n)
+    sem_saida = saida == 0
+    transicao = pesos / np.where(sem_saida, 1.0, saida)[origens]
+
+    x = np.full(n, 1.0 / n)
+    for _ in range(max_iteracoes):
+        anterior = x
+        x = amortecimento * (_produto_transposto(origens, alvos, transicao, x, n) + x[sem_saida].sum() / n)
+        x += (1.0 - amortecimento) / n
+
+        if np.abs(x - anterior).sum() < n * tolerancia:
+            break
+
+    return dict(zip(grafo.nomes, x.tolist()))
+
+def autovetor(grafo, tolerancia=1e-6, max_iteracoes=1000, ponderado=False) -> dict:
+
+    # Definição dos parâmetros:
+    #   grafo -> GrafoCSR (ou lista de adjacencia em dicionário, convertida para GrafoCSR)
+    #   tolerancia -> para quando a soma das mudanças (norma L1) fica abaixo de n * tolerancia
+    #   max_iteracoes -> limite de iterações da potência
+    #   ponderado -> se True, usa os pesos das arestas
+    #
+    # Centralidade de autovetor pelas arestas de entrada: x[v] é proporcional à soma de x[u] sobre u -> v.
+    # Iteramos (I + A^T) x, com o mesmo autovetor principal de A^T e que não oscila em grafos bipartidos.
+    # Num digrafo acíclico (como o de voos) o autovalor principal é zero e a pontuação se concentra nos
+    # vértices do fim dos caminhos mais longos; a iteração para no limite de iterações.
+
+    if not isinstance(grafo, GrafoCSR):
+        grafo = GrafoCSR.de_lista_adjacencia(grafo)
+
+    n = grafo.num_vertices
+    if n == 0:
+        return {}
+
+    origens = grafo.origens()
+    alvos = np.asarray(grafo.alvos)
+    pesos = _pesos_espectrais(grafo, ponderado)
+
+    x = np.full(n, 1.0 / n)
+    for _ in range(max_iteracoes):
+        anterior = x
+        x = x + _produto_transposto(origens, alvos, pesos, x, n)
+        x /= np.linalg.norm(x) or 1.0
+
+        if np.abs(x - anterior).sum() < n * tolerancia:
+            break
+
+    return dict(zip(grafo.nomes, x.tolist()))
+
+def proximidade(grafo, ponderado=True) -> dict:
+
+    # Definição dos parâmetros:
+    #   grafo -> GrafoCSR (ou lista de adjacencia em dicionário, convertida para GrafoCSR)
+    #   ponderado -> True: distâncias pelos pesos (Dijkstra); False: pelo número de arestas (BFS)
+    #
+    # Retorna vértice -> {"proximidade": ..., "harmonica": ...}, com as distâncias de todos os outros
+    # vértices ATÉ o vértice (arestas de entrada), obtidas por uma travessia a partir dele no grafo reverso.
+    #   proximidade -> (r - 1) / soma das distâncias, escalada por (r - 1) / (n - 1), onde r é o número de
+    #                  vértices que chegam nele (Wasserman e Faust, para grafos não conexos)
+    #   harmonica -> soma de 1 / distância (vértices que não chegam contribuem com zero)
+
+    if not isinstance(grafo, GrafoCSR):
+        grafo = GrafoCSR.de_lista_adjacencia(grafo)
+
+    if ponderado and grafo.possui_peso_negativo:
+        raise ValueError("Proximidade ponderada exige pesos não negativos")
+
+    n = grafo.num_vertices
+    reverso = grafo.reverso
+    resultado = {}
+
+    for v, nome in enumerate(grafo.nomes):
+        if ponderado:
+            distancias, _ = _dijkstra_csr(reverso, v)
+            distancias = np.array(distancias, dtype=np.float64)
+            alcancaveis = distancias[distancias != sys.maxsize]
+        else:
+            distancias = bfs_niveis(reverso, nome)["distancias"]
+            alcancaveis = distancias[distancias >= 0].astype(np.float64)
+
+        # sem o próprio vértice (distância zero)
+        positivas = alcancaveis[alcancaveis > 0]
+        soma = alcancaveis.sum()
+        r = len(alcancaveis)
+
+        proximidade_v = 0.0
+        if soma > 0 and n > 1:
+            proximidade_v = ((r - 1) / soma) * ((r - 1) / (n - 1))
+
+        resultado[nome] = {
+            "proximidade": float(proximidade_v),
+            "harmonica": float((1.0 / positivas).sum()),
+        }
+
+    return resultado
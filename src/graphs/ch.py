@@ -0,0 +1,330 @@
+import heapq
+import os
+import sys
+import time
+from collections import deque
+
+import numpy as np
+
+from graphs.csr import GrafoCSR, _vista
+from graphs.snapshot import mapear_npz, salvar_npz
+
+# Contraction Hierarchies (CH) para grafos dirigidos e ponderados.
+#
+# Pré-processamento (offline): os vértices são "contraídos" um a um, do menos para o mais importante.
+# Ao contrair v, cada caminho u -> v -> w que seja o único caminho mínimo entre u e w vira um atalho
+# u -> w (com v guardado como vértice do meio). No fim cada vértice tem um nível (ordem de contração).
+#
+# Consulta: uma busca sobe a hierarquia a partir da origem (só arestas para vértices de nível maior) e
+# outra sobe a partir do destino no grafo reverso. O menor encontro das duas é a distância exata, e os
+# atalhos são desempacotados recursivamente para recuperar o caminho original.
+
+# limite de vértices assentados em cada busca de testemunha; passar do limite só gera atalhos a mais
+LIMITE_TESTEMUNHA = 500
+
+
+# Busca de testemunha: Dijkstra local a partir de "origem" sem passar por "ignorado",
+# parando quando a distância passa de "limite". Retorna as distâncias encontradas.
+def _busca_testemunha(saida, origem, ignorado, limite):
+    distancias = {origem: 0}
+    fila = [(0, origem)]
+    assentados = 0
+
+    while fila and assentados < LIMITE_TESTEMUNHA:
+        distancia, vertice = heapq.heappop(fila)
+        if distancia > distancias[vertice]:
+            continue
+        if distancia > limite:
+            break
+        assentados += 1
+
+        for v_adjacente, (peso, _) in saida[vertice].items():
+            if v_adjacente == ignorado:
+                continue
+            nova_distancia = distancia + peso
+            if nova_distancia < distancias.get(v_adjacente, sys.maxsize):
+                distancias[v_adjacente] = nova_distancia
+                heapq.heappush(fila, (nova_distancia, v_adjacente))
+
+    return distancias
+
+# Atalhos necessários para contrair v: lista de (u, w, peso)
+def _atalhos(saida, entrada, v):
+    atalhos = []
+    saidas = [(w, peso) for w, (peso, _) in saida[v].items()]
+    if not saidas:
+        return atalhos
+
+    maior_saida = max(peso for _, peso in saidas)
+
+    for u, (peso_uv, _) in entrada[v].items():
+        distancias = _busca_testemunha(saida, u, v, peso_uv + maior_saida)
+
+        for w, peso_vw in saidas:
+            if w == u:
+                continue
+            # só vira atalho se nenhum caminho sem v for tão curto quanto u -> v -> w
+            if distancias.get(w, sys.maxsize) > peso_uv + peso_vw:
+                atalhos.append((u, w, peso_uv + peso_vw))
+
+    return atalhos
+
+# Prioridade de contração: diferença de arestas (atalhos criados - arestas removidas)
+# mais o número de vizinhos já contraídos, para espalhar as contrações pelo grafo
+def _prioridade(saida, entrada, vizinhos_contraidos, v):
+    return len(_atalhos(saida, entrada, v)) - len(saida[v]) - len(entrada[v]) + vizinhos_contraidos[v]
+
+
+class HierarquiaContracao:
+
+    def __init__(self, nomes, nivel, subida, descida, versao, segundos_construcao=0.0):
+
+        # Definição dos parâmetros:
+        #   nomes -> nome de cada vértice, na ordem dos ids do GrafoCSR original
+        #   nivel -> ordem de contração de cada vértice
+        #   subida -> (offsets, alvos, pesos, meio): arestas u -> w com nivel[w] > nivel[u], indexadas por u
+        #   descida -> (offsets, origens, pesos, meio): arestas u -> w com nivel[u] > nivel[w], indexadas por w
+        #   versao -> versão do GrafoCSR a partir do qual a hierarquia foi construída
+        #   segundos_construcao -> tempo do pré-processamento, guardado junto com o índice
+        #
+        # "meio" é o vértice contraído que o atalho pula (-1 para arestas originais)
+
+        self.nomes = list(nomes)
+        self.ids = {nome: i for i, nome in enumerate(self.nomes)}
+        self.nivel = nivel
+        self.subida = subida
+        self.descida = descida
+        self.versao = versao
+        self.segundos_construcao = segundos_construcao
+
+        self._vistas_subida = tuple(_vista(v) for v in subida)
+        self._vistas_descida = tuple(_vista(v) for v in descida)
+
+    @property
+    def num_atalhos(self):
+        return int((self.subida[3] >= 0).sum() + (self.descida[3] >= 0).sum())
+
+    # Tamanho em bytes dos vetores do índice
+    @property
+    def tamanho_bytes(self):
+        return int(self.nivel.nbytes + sum(v.nbytes for v in self.subida) + sum(v.nbytes for v in self.descida))
+
+    def salvar(self, caminho: str) -> None:
+        salvar_npz(caminho, {
+            "versao": np.frombuffer(self.versao.encode("utf-8"), dtype=np.uint8),
+            "segundos_construcao": np.array([self.segundos_construcao], dtype=np.float64),
+            "nomes": np.array(self.nomes, dtype=str),
+            "nivel": self.nivel,
+            "subida_offsets": self.subida[0], "subida_alvos": self.subida[1],
+            "subida_pesos": self.subida[2], "subida_meio": self.subida[3],
+            "descida_offsets": self.descida[0], "descida_origens": self.descida[1],
+            "descida_pesos": self.descida[2], "descida_meio": self.descida[3],
+        })
+
+    @classmethod
+    def carregar(cls, caminho: str):
+        v = mapear_npz(caminho)
+        return cls(
+            v["nomes"].tolist(),
+            v["nivel"],
+            (v["subida_offsets"], v["subida_alvos"], v["subida_pesos"], v["subida_meio"]),
+            (v["descida_offsets"], v["descida_origens"], v["descida_pesos"], v["descida_meio"]),
+            bytes(v["versao"]).decode("utf-8"),
+            float(v["segundos_construcao"][0]),
+        )
+
+    # Procura a aresta a -> b da hierarquia e devolve o vértice do meio (-1 se for aresta original)
+    def _meio(self, a, b):
+        if self.nivel[a] < self.nivel[b]:
+            offsets, vizinhos, _, meio = self._vistas_subida
+            indice, procurado = a, b
+        else:
+            offsets, vizinhos, _, meio = self._vistas_descida
+            indice, procurado = b, a
+
+        for i in range(offsets[indice], offsets[indice + 1]):
+            if vizinhos[i] == procurado:
+                return meio[i]
+
+        raise KeyError(f"Aresta inexistente na hierarquia: {self.nomes[a]} -> {self.nomes[b]}")
+
+    # Troca cada atalho pelos dois trechos que ele pula, até sobrarem só arestas originais
+    def _desempacotar(self, a, b, caminho):
+        pilha = [(a, b)]
+        while pilha:
+            u, w = pilha.pop()
+            meio = self._meio(u, w)
+            if meio < 0:
+                caminho.append(self.nomes[w])
+            else:
+                # empilha o segundo trecho primeiro para o primeiro sair antes
+                pilha.append((meio, w))
+                pilha.append((u, meio))
+
+    def consultar(self, v_inicio, v_destino):
+
+        # Retorna (custo, caminho) no mesmo formato de dijkstra_path
+
+        inicio = self.ids[v_inicio]
+        destino = self.ids[v_destino]
+
+        # [0] -> subida a partir do início, [1] -> subida a partir do destino (arestas de descida ao contrário)
+        vistas = (self._vistas_subida, self._vistas_descida)
+        distancias = ({inicio: 0}, {destino: 0})
+        antecessor = ({inicio: inicio}, {destino: destino})
+        filas = ([(0, inicio)], [(0, destino)])
+
+        mu = 0 if inicio == destino else sys.maxsize
+        encontro = inicio if inicio == destino else -1
+
+        while filas[0] or filas[1]:
+            # cada lado para quando o menor da sua fila já não melhora mu
+            for lado in (0, 1):
+                fila = filas[lado]
+                if fila and fila[0][0] >= mu:
+                    fila.clear()
+                if not fila:
+                    continue
+
+                distancia, vertice = heapq.heappop(fila)
+                dist, dist_outro = distancias[lado], distancias[1 - lado]
+                if distancia > dist[vertice]:
+                    continue
+
+                if vertice in dist_outro and distancia + dist_outro[vertice] < mu:
+                    mu = distancia + dist_outro[vertice]
+                    encontro = vertice
+
+                offsets, vizinhos, pesos, _ = vistas[lado]
+                for i in range(offsets[vertice], offsets[vertice + 1]):
+                    v_adjacente = vizinhos[i]
+                    nova_distancia = distancia + pesos[i]
+                    if nova_distancia < dist.get(v_adjacente, sys.maxsize):
+                        dist[v_adjacente] = nova_distancia
+                        antecessor[lado][v_adjacente] = vertice
+                        heapq.heappush(fila, (nova_distancia, v_adjacente))
+
+        if encontro == -1:
+            return sys.maxsize, -1
+
+        # caminho na hierarquia: início -> ... -> encontro -> ... -> destino
+        subida = [encontro]
+        while subida[-1] != inicio:
+            subida.append(antecessor[0][subida[-1]])
+        subida.reverse()
+
+        descida = [encontro]
+        while descida[-1] != destino:
+            descida.append(antecessor[1][descida[-1]])
+
+        hierarquico = subida + descida[1:]
+
+        caminho = deque([self.nomes[inicio]])
+        for a, b in zip(hierarquico, hierarquico[1:]):
+            self._desempacotar(a, b, caminho)
+
+        return mu, caminho
+
+
+def construir_hierarquia(grafo: GrafoCSR) -> HierarquiaContracao:
+    if not isinstance(grafo, GrafoCSR):
+        grafo = GrafoCSR.de_lista_adjacencia(grafo)
+
+    if grafo.possui_peso_negativo:
+        raise ValueError("Contraction Hierarchies não aceita pesos negativos")
+
+    inicio_tempo = time.perf_counter()
+    n = grafo.num_vertices
+
+    # grafo de trabalho: saida[u][w] = (peso, meio) e entrada[w][u] = (peso, meio);
+    # arestas paralelas ficam só com a de menor peso e laços são descartados
+    saida = [dict() for _ in range(n)]
+    entrada = [dict() for _ in range(n)]
+    for u, w, peso in zip(grafo.origens().tolist(), grafo.alvos.tolist(), grafo.pesos.tolist()):
+        if u != w and peso < saida[u].get(w, (sys.maxsize,))[0]:
+            saida[u][w] = (peso, -1)
+            entrada[w][u] = (peso, -1)
+
+    # todas as arestas (originais e atalhos) que vão para a hierarquia final: (u, w) -> (peso, meio)
+    arestas = {}
+    for u in range(n):
+        for w, valor in saida[u].items():
+            arestas[(u, w)] = valor
+
+    vizinhos_contraidos = [0] * n
+    fila = [(_prioridade(saida, entrada, vizinhos_contraidos, v), v) for v in range(n)]
+    heapq.heapify(fila)
+
+    nivel = np.zeros(n, dtype=np.int32)
+    proximo_nivel = 0
+
+    while fila:
+        _, v = heapq.heappop(fila)
+
+        # atualização preguiçosa: recalcula a prioridade e, se piorou, devolve para a fila
+        prioridade = _prioridade(saida, entrada, vizinhos_contraidos, v)
+        if fila and prioridade > fila[0][0]:
+            heapq.heappush(fila, (prioridade, v))
+            continue
+
+        for u, w, peso in _atalhos(saida, entrada, v):
+            if peso < saida[u].get(w, (sys.maxsize,))[0]:
+                saida[u][w] = (peso, v)
+                entrada[w][u] = (peso, v)
+                arestas[(u, w)] = (peso, v)
+
+        # remove v do grafo de trabalho
+        for w in saida[v]:
+            del entrada[w][v]
+            vizinhos_contraidos[w] += 1
+        for u in entrada[v]:
+            del saida[u][v]
+            vizinhos_contraidos[u] += 1
+        saida[v] = {}
+        entrada[v] = {}
+
+        nivel[v] = proximo_nivel
+        proximo_nivel += 1
+
+    # separa as arestas em subida (nível cresce) e descida (nível diminui)
+    subida = [(u, w, peso, meio) for (u, w), (peso, meio) in arestas.items() if nivel[w] > nivel[u]]
+    descida = [(w, u, peso, meio) for (u, w), (peso, meio) in arestas.items() if nivel[w] < nivel[u]]
+
+    return HierarquiaContracao(
+        grafo.nomes, nivel, _vetores(subida, n), _vetores(descida, n), grafo.versao,
+        time.perf_counter() - inicio_tempo
+    )
+
+# (indice, vizinho, peso, meio) -> vetores CSR indexados por "indice"
+def _vetores(arestas, n):
+    arestas.sort(key=lambda a: a[0])
+    indices = np.array([a[0] for a in arestas], dtype=np.int64)
+
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(indices, minlength=n), out=offsets[1:])
+
+    return (
+        offsets,
+        np.array([a[1] for a in arestas], dtype=np.int32),
+        np.array([a[2] for a in arestas], dtype=np.float64),
+        np.array([a[3] for a in arestas], dtype=np.int32),
+    )
+
+# Lê a hierarquia do disco se ela foi construída para esta versão do grafo; caso contrário constrói e salva
+def carregar_hierarquia(grafo: GrafoCSR, caminho: str) -> HierarquiaContracao:
+    if os.path.exists(caminho):
+        try:
+            hierarquia = HierarquiaContracao.carregar(caminho)
+            if hierarquia.versao == grafo.versao:
+                return hierarquia
+        except (OSError, ValueError, KeyError, IndexError):
+            pass
+
+    hierarquia = construir_hierarquia(grafo)
+
+    try:
+        hierarquia.salvar(caminho)
+    except OSError:
+        pass
+
+    return hierarquia
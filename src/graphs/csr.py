@@ -0,0 +1,212 @@
+import hashlib
+
+import numpy as np
+
+from graphs.graus import Graus
+from graphs.indice import IndiceVertices
+from graphs.scc import Condensacao
+
+
+# memoryview com formato nativo ("q", "i", "d"): vetores lidos de arquivo (np.memmap)
+# vêm com a ordem de bytes explícita ("<i8"), que o memoryview não sabe indexar
+def _vista(vetor):
+    return memoryview(np.ascontiguousarray(vetor)).cast("B").cast(vetor.dtype.char)
+
+
+# Representação compacta (CSR - Compressed Sparse Row) de um grafo ponderado.
+#
+# Os nomes dos vértices são convertidos em ids inteiros densos (0..n-1) e as arestas
+# ficam em três vetores contíguos:
+#   offsets[u] .. offsets[u + 1] -> intervalo das arestas que saem do vértice u
+#   alvos[i]                     -> vértice de destino da aresta i
+#   pesos[i]                     -> peso da aresta i
+#
+# Dessa forma cada aresta custa 12 bytes (int32 + float64), em vez de uma tupla,
+# uma referência de string e um objeto float como na lista de adjacência em dicionário.
+class GrafoCSR:
+
+    def __init__(self, nomes, offsets, alvos, pesos, dirigido=True, ids=None):
+
+        # Definição dos parâmetros:
+        #   nomes -> lista com o nome de cada vértice, na ordem dos ids
+        #   offsets -> vetor (n + 1) com o início das arestas de cada vértice
+        #   alvos -> vetor com o id de destino de cada aresta
+        #   pesos -> vetor com o peso de cada aresta
+        #   dirigido -> False quando cada aresta já aparece nas duas direções (grafo não-direcionado)
+        #   ids -> dicionário nome -> id já pronto (opcional, para compartilhar entre grafo e reverso)
+
+        self.nomes = list(nomes)
+        self.ids = ids if ids is not None else {nome: i for i, nome in enumerate(self.nomes)}
+        self.offsets = np.asanyarray(offsets, dtype=np.int64)
+        self.alvos = np.asanyarray(alvos, dtype=np.int32)
+        self.pesos = np.asanyarray(pesos, dtype=np.float64)
+        self.dirigido = dirigido
+
+        # atributos calculados sob demanda (e guardados depois da primeira vez)
+        self._reverso = None
+        self._vistas = None
+        self._origens = None
+        self._peso_negativo = None
+        self._versao = None
+        self._condensacao = None
+        self._graus = None
+        self._indice = None
+
+    # Constrói o grafo a partir de arestas em colunas paralelas (ids inteiros)
+    @classmethod
+    def de_arestas(cls, nomes, origens, destinos, pesos, dirigido=True, ids=None):
+        n = len(nomes)
+        origens = np.asarray(origens, dtype=np.int64)
+
+        # ordenação estável: as arestas de cada vértice mantêm a ordem em que apareceram
+        ordem = np.argsort(origens, kind="stable")
+
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(origens, minlength=n), out=offsets[1:])
+
+        alvos = np.asarray(destinos, dtype=np.int32)[ordem]
+        pesos = np.asarray(pesos, dtype=np.float64)[ordem]
+
+        return cls(nomes, offsets, alvos, pesos, dirigido, ids)
+
+    # Constrói o grafo a partir da lista de adjacência em dicionário: vértice -> [(vizinho, peso)]
+    @classmethod
+    def de_lista_adjacencia(cls, lista_adjacencia, dirigido=True):
+        ids = {}
+        for vertice in lista_adjacencia.keys():
+            ids.setdefault(vertice, len(ids))
+
+        offsets = [0]
+        alvos = []
+        pesos = []
+
+        for vizinhos in lista_adjacencia.values():
+            for v_adjacente, peso in vizinhos:
+                # vértices que só aparecem como destino também ganham um id
+                alvos.append(ids.setdefault(v_adjacente, len(ids)))
+                pesos.append(peso)
+            offsets.append(len(alvos))
+
+        # vértices sem lista própria (só aparecem como destino) ficam sem arestas de saída
+        offsets.extend([len(alvos)] * (len(ids) + 1 - len(offsets)))
+
+        return cls(list(ids.keys()), offsets, alvos, pesos, dirigido)
+
+    # Converte de volta para a lista de adjacência em dicionário
+    def para_lista_adjacencia(self):
+        return {nome: self[nome] for nome in self.nomes}
+
+    @property
+    def num_vertices(self):
+        return len(self.nomes)
+
+    @property
+    def num_arestas(self):
+        return len(self.alvos)
+
+    # Vetor com o vértice de origem de cada aresta (inverso dos offsets).
+    # Calculado uma vez por grafo e compartilhado entre os chamadores, por isso é somente leitura.
+    def origens(self):
+        if self._origens is None:
+            self._origens = np.repeat(np.arange(self.num_vertices, dtype=np.int32), np.diff(self.offsets))
+            self._origens.flags.writeable = False
+        return self._origens
+
+    # Índice reverso (arestas de entrada), necessário para buscas no grafo transposto.
+    # Em grafos não-direcionados o reverso é o próprio grafo.
+    @property
+    def reverso(self):
+        if not self.dirigido:
+            return self
+
+        if self._reverso is None:
+            reverso = GrafoCSR.de_arestas(self.nomes, self.alvos, self.origens(), self.pesos, ids=self.ids)
+            # o reverso do reverso é o grafo original
+            reverso._reverso = self
+            self._reverso = reverso
+
+        return self._reverso
+
+    # Visões (memoryview) dos vetores, usadas nos laços em Python puro:
+    # o acesso por índice devolve int/float nativos sem copiar os dados
+    def vistas(self):
+        if self._vistas is None:
+            self._vistas = (_vista(self.offsets), _vista(self.alvos), _vista(self.pesos))
+        return self._vistas
+
+    # Componentes fortemente conexas e DAG de condensação (calculados uma vez por grafo)
+    @property
+    def condensacao(self):
+        if self._condensacao is None:
+            self._condensacao = Condensacao(self)
+        return self._condensacao
+
+    # Graus de entrada, saída e ponderados de todos os vértices (calculados uma vez por grafo)
+    @property
+    def graus(self):
+        if self._graus is None:
+            self._graus = Graus(self)
+        return self._graus
+
+    # Índice de nomes normalizados -> id, para resolver nomes digitados pelo usuário (montado uma vez por grafo)
+    @property
+    def indice(self):
+        if self._indice is None:
+            self._indice = IndiceVertices(self.nomes)
+        return self._indice
+
+    @property
+    def possui_peso_negativo(self):
+        if self._peso_negativo is None:
+            self._peso_negativo = bool(self.num_arestas and self.pesos.min() < 0)
+        return self._peso_negativo
+
+    # Identificador do conteúdo do grafo (muda sempre que vértices ou arestas mudam)
+    @property
+    def versao(self):
+        if self._versao is None:
+            h = hashlib.sha1()
+            h.update("\n".join(map(str, self.nomes)).encode("utf-8"))
+            for vetor in (self.offsets, self.alvos, self.pesos):
+                h.update(np.ascontiguousarray(vetor).tobytes())
+            self._versao = h.hexdigest()
+        return self._versao
+
+    #####################################
+    # Interface de dicionário, para que o código que usa a lista de adjacência
+    # (len, keys, items, grafo[vertice]...) funcione também com o grafo compacto
+    #####################################
+
+    def __len__(self):
+        return self.num_vertices
+
+    def __iter__(self):
+        return iter(self.nomes)
+
+    def __contains__(self, nome):
+        return nome in self.ids
+
+    def __getitem__(self, nome):
+        u = self.ids[nome]
+        ini, fim = self.offsets[u], self.offsets[u + 1]
+        return list(zip([self.nomes[v] for v in self.alvos[ini:fim].tolist()], self.pesos[ini:fim].tolist()))
+
+    def keys(self):
+        return self.nomes
+
+    def values(self):
+        return [self[nome] for nome in self.nomes]
+
+    def items(self):
+        return [(nome, self[nome]) for nome in self.nomes]
+
+    def __repr__(self):
+        return f"GrafoCSR(vertices={self.num_vertices}, arestas={self.num_arestas}, dirigido={self.dirigido})"
+
+
+# GrafoCSR de uma lista de adjacência: o próprio grafo ou, com converter=True, uma conversão nova
+# (com converter=False devolve None para listas em dicionário)
+def compacto(lista_adjacencia, converter=True):
+    if isinstance(lista_adjacencia, GrafoCSR):
+        return lista_adjacencia
+    return GrafoCSR.de_lista_adjacencia(lista_adjacencia) if converter else None
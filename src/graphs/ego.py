@@ -0,0 +1,99 @@
+import numpy as np
+
+from graphs.algorithms import _arestas_de
+from graphs.csr import GrafoCSR
+
+# Métricas de ego network e coeficientes de agrupamento de todos os vértices em uma passada.
+#
+# Primeiro as arestas viram listas de vizinhos ordenadas e sem repetição (uma aresta paralela conta uma vez).
+# Para cada vértice v, a ego network é v mais os seus vizinhos; as arestas dela são as arestas que saem de
+# um membro da ego e chegam em outro membro. Essas arestas são contadas juntando as listas (já ordenadas)
+# de todos os membros e testando cada destino com np.searchsorted na ego ordenada: o custo é linear na soma
+# dos graus dos membros, sem montar sets de tuplas.
+#
+# Triângulos e agrupamento usam o grafo simétrico (sem direção), sem laços e sem arestas paralelas:
+#   triangulos(v) -> pares de vizinhos de v ligados entre si
+#   agrupamento(v) -> triangulos(v) / (k(k-1)/2), com k vizinhos distintos de v
+#   transitividade -> 3 * triângulos / trincas conectadas do grafo inteiro
+
+
+# CSR sem arestas repetidas, com os vizinhos de cada vértice em ordem crescente
+def _simples(n, origens, alvos):
+    chaves = np.unique(origens.astype(np.int64) * n + alvos)
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(chaves // n, minlength=n), out=offsets[1:])
+    return offsets, (chaves % n).astype(np.int64)
+
+def metricas_ego(grafo) -> dict:
+
+    # Definição dos parâmetros:
+    #   grafo -> GrafoCSR (ou lista de adjacencia em dicionário, convertida para GrafoCSR)
+    #
+    # Retorna um dicionário com "nomes" e um vetor por métrica, na ordem dos ids:
+    #   grau -> número de entradas na lista de adjacência (arestas paralelas contam)
+    #   ordem_ego -> vértices da ego network
+    #   tamanho_ego -> pares (u, w) distintos com aresta u -> w dentro da ego (no grafo não-direcionado,
+    #                  cada aresta conta nas duas direções, como em ego_bairro.csv)
+    #   densidade_ego -> tamanho_ego / (ordem_ego * (ordem_ego - 1))
+    #   triangulos, agrupamento -> ver o comentário do módulo
+    # e os valores globais "transitividade" e "agrupamento_medio".
+
+    if not isinstance(grafo, GrafoCSR):
+        grafo = GrafoCSR.de_lista_adjacencia(grafo)
+
+    n = grafo.num_vertices
+    origens = grafo.origens().astype(np.int64)
+    alvos = np.asarray(grafo.alvos, dtype=np.int64)
+
+    offsets, vizinhos = _simples(n, origens, alvos)
+
+    # grafo simétrico sem laços, usado nos triângulos
+    sem_laco = origens != alvos
+    sim_offsets, sim_vizinhos = _simples(
+        n,
+        np.concatenate([origens[sem_laco], alvos[sem_laco]]),
+        np.concatenate([alvos[sem_laco], origens[sem_laco]]),
+    )
+
+    ordem_ego = np.zeros(n, dtype=np.int64)
+    tamanho_ego = np.zeros(n, dtype=np.int64)
+    triangulos = np.zeros(n, dtype=np.int64)
+
+    for v in range(n):
+        proprios = vizinhos[offsets[v]:offsets[v + 1]]
+
+        # ego ordenada: v entra na posição certa entre os vizinhos (e não duplica se houver laço)
+        ego = np.union1d(proprios, [v])
+        ordem_ego[v] = len(ego)
+
+        destinos, _ = _arestas_de(offsets, vizinhos, ego)
+        posicoes = np.searchsorted(ego, destinos)
+        posicoes[posicoes == len(ego)] = 0
+        tamanho_ego[v] = np.count_nonzero(ego[posicoes] == destinos)
+
+        # triângulos: arestas entre dois vizinhos distintos de v no grafo simétrico (cada uma aparece 2 vezes)
+        vizinhanca = sim_vizinhos[sim_offsets[v]:sim_offsets[v + 1]]
+        if len(vizinhanca) > 1:
+            destinos, _ = _arestas_de(sim_offsets, sim_vizinhos, vizinhanca)
+            posicoes = np.searchsorted(vizinhanca, destinos)
+            posicoes[posicoes == len(vizinhanca)] = 0
+            triangulos[v] = np.count_nonzero(vizinhanca[posicoes] == destinos) // 2
+
+    possiveis = ordem_ego * (ordem_ego - 1)
+    densidade_ego = np.divide(tamanho_ego, possiveis, out=np.zeros(n), where=possiveis > 0)
+
+    k = np.diff(sim_offsets)
+    trincas = k * (k - 1) // 2
+    agrupamento = np.divide(triangulos, trincas, out=np.zeros(n), where=trincas > 0)
+
+    return {
+        "nomes": grafo.nomes,
+        "grau": np.diff(grafo.offsets),
+        "ordem_ego": ordem_ego,
+        "tamanho_ego": tamanho_ego,
+        "densidade_ego": densidade_ego,
+        "triangulos": triangulos,
+        "agrupamento": agrupamento,
+        "transitividade": float(triangulos.sum() / trincas.sum()) if trincas.sum() else 0.0,
+        "agrupamento_medio": float(agrupamento.mean()) if n else 0.0,
+    }
@@ -0,0 +1,158 @@
+import sys
+
+import numpy as np
+
+from graphs.algorithms import _dijkstra_csr, bfs_niveis
+from graphs.csr import GrafoCSR
+
+# Excentricidade de todos os vértices, diâmetro, raio, centro e periferia sem calcular todos os pares.
+#
+# Cada travessia completa a partir de um vértice w (ida: d(w, v); volta, no grafo reverso: d(v, w))
+# dá a excentricidade exata de w e, pela desigualdade triangular, limites para todos os outros:
+#   ecc(v) >= d(v, w)               (v precisa ao menos chegar em w)
+#   ecc(v) >= ecc(w) - d(w, v)      (o vértice mais longe de w também está longe de v)
+#   ecc(v) <= d(v, w) + ecc(w)      (v chega em qualquer vértice passando por w)
+# Como no BoundingDiameters (Takes e Kosters), a próxima travessia parte alternadamente do vértice com
+# maior limite superior e do vértice com menor limite inferior, até que os limites de todos se encontrem.
+# Em grafos reais isso costuma exigir poucas travessias em vez de uma por vértice.
+#
+# Os limites só valem dentro de um conjunto fortemente conexo (no grafo não-direcionado, uma componente
+# conexa): por padrão usamos a componente do vértice de maior grau.
+
+
+# Distâncias de "inicio" para todos os vértices (np.inf para os inalcançáveis),
+# em número de arestas (BFS) ou somando os pesos (Dijkstra)
+def _distancias(grafo, inicio, ponderado):
+    if ponderado:
+        distancias, _ = _dijkstra_csr(grafo, inicio)
+        vetor = np.array(distancias, dtype=np.float64)
+        vetor[vetor == sys.maxsize] = np.inf
+    else:
+        vetor = bfs_niveis(grafo, grafo.nomes[inicio])["distancias"].astype(np.float64)
+        vetor[vetor < 0] = np.inf
+    return vetor
+
+# Componente fortemente conexa do vértice de maior grau (entrada + saída):
+# os vértices que ele alcança e que também o alcançam. Retorna (ids da componente, id do hub)
+def componente_do_hub(grafo: GrafoCSR):
+    grau = np.diff(grafo.offsets) + np.diff(grafo.reverso.offsets)
+    hub = int(np.argmax(grau))
+
+    ida = _distancias(grafo, hub, False) != np.inf
+    volta = _distancias(grafo.reverso, hub, False) != np.inf
+
+    return np.flatnonzero(ida & volta), hub
+
+def calcular_excentricidades(grafo, ponderado=False, vertices=None) -> dict:
+
+    # Definição dos parâmetros:
+    #   grafo -> GrafoCSR (ou lista de adjacencia em dicionário, convertida para GrafoCSR)
+    #   ponderado -> se True as distâncias somam os pesos (Dijkstra); senão contam arestas (BFS)
+    #   vertices -> ids de um conjunto fortemente conexo; por padrão, a componente do vértice de maior grau
+
+    if not isinstance(grafo, GrafoCSR):
+        grafo = GrafoCSR.de_lista_adjacencia(grafo)
+
+    if ponderado and grafo.possui_peso_negativo:
+        raise ValueError("Excentricidade ponderada exige pesos não negativos")
+
+    if vertices is None:
+        vertices, _ = componente_do_hub(grafo)
+    vertices = np.asarray(vertices, dtype=np.int64)
+
+    k = len(vertices)
+    inferior = np.zeros(k)
+    superior = np.full(k, np.inf)
+    pendente = np.ones(k, dtype=bool)
+
+    # desempate pelo grau: vértices mais conectados costumam dar limites melhores
+    grau = (np.diff(grafo.offsets) + np.diff(grafo.reverso.offsets))[vertices]
+
+    travessias = 0
+    pelo_superior = True
+
+    while pendente.any():
+        candidatos = np.flatnonzero(pendente)
+
+        if pelo_superior:
+            escolhido = candidatos[np.lexsort((-grau[candidatos], -superior[candidatos]))[0]]
+        else:
+            escolhido = candidatos[np.lexsort((-grau[candidatos], inferior[candidatos]))[0]]
+        pelo_superior = not pelo_superior
+
+        w = int(vertices[escolhido])
+        ida = _distancias(grafo, w, ponderado)[vertices]
+        travessias += 1
+
+        # no grafo não-direcionado o reverso é o próprio grafo e a volta é igual à ida
+        if grafo.dirigido:
+            volta = _distancias(grafo.reverso, w, ponderado)[vertices]
+            travessias += 1
+        else:
+            volta = ida
+
+        excentricidade_w = ida.max()
+
+        inferior = np.maximum(inferior, np.maximum(volta, excentricidade_w - ida))
+        superior = np.minimum(superior, volta + excentricidade_w)
+        inferior[escolhido] = superior[escolhido] = excentricidade_w
+
+        # tolerância relativa: com pesos reais as somas dos limites podem diferir no último bit
+        pendente = superior - inferior > 1e-9 * np.maximum(1.0, superior)
+
+    excentricidades = inferior if ponderado else inferior.astype(np.int64)
+    diametro = excentricidades.max().item() if k else 0
+    raio = excentricidades.min().item() if k else 0
+
+    nomes = [grafo.nomes[v] for v in vertices.tolist()]
+    valores = excentricidades.tolist()
+
+    return {
+        "ponderado": ponderado,
+        "vertices": k,
+        "travessias": travessias,
+        "diametro": diametro,
+        "raio": raio,
+        "centro": [nome for nome, valor in zip(nomes, valores) if valor - raio <= 1e-9 * max(1.0, raio)],
+        "periferia": [nome for nome, valor in zip(nomes, valores) if diametro - valor <= 1e-9 * max(1.0, diametro)],
+        "excentricidades": dict(zip(nomes, valores)),
+    }
+
+# Excentricidade restrita aos vértices alcançáveis: ecc(v) = maior distância finita a partir de v.
+# Serve para digrafos cuja componente fortemente conexa é pequena demais (num grafo acíclico todas têm
+# um vértice só). Com distâncias infinitas os limites acima não valem, então aqui é uma travessia por vértice.
+# O raio e o centro consideram só os vértices que alcançam algum outro vértice.
+def excentricidades_alcancaveis(grafo, ponderado=False) -> dict:
+    if not isinstance(grafo, GrafoCSR):
+        grafo = GrafoCSR.de_lista_adjacencia(grafo)
+
+    if ponderado and grafo.possui_peso_negativo:
+        raise ValueError("Excentricidade ponderada exige pesos não negativos")
+
+    n = grafo.num_vertices
+    excentricidades = np.zeros(n)
+    alcanca_algum = np.zeros(n, dtype=bool)
+
+    for v in range(n):
+        distancias = _distancias(grafo, v, ponderado)
+        finitas = distancias[distancias != np.inf]
+        excentricidades[v] = finitas.max()
+        alcanca_algum[v] = len(finitas) > 1
+
+    if not ponderado:
+        excentricidades = excentricidades.astype(np.int64)
+
+    valores = excentricidades.tolist()
+    diametro = excentricidades.max().item() if n else 0
+    raio = excentricidades[alcanca_algum].min().item() if alcanca_algum.any() else 0
+
+    return {
+        "ponderado": ponderado,
+        "vertices": n,
+        "travessias": n,
+        "diametro": diametro,
+        "raio": raio,
+        "centro": [nome for nome, valor, ok in zip(grafo.nomes, valores, alcanca_algum) if ok and valor == raio],
+        "periferia": [nome for nome, valor in zip(grafo.nomes, valores) if valor == diametro],
+        "excentricidades": dict(zip(grafo.nomes, valores)),
+    }
@@ -1,13 +1,27 @@
 import csv
 from collections import defaultdict
+from array import array
 import os
 
+from graphs.csr import GrafoCSR
+from graphs.snapshot import carregar_com_snapshot
+
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 caminho_csv = os.path.join(BASE_DIR, "../../data/adjacencias_bairros.csv")
 # Função que lê um arquivo CSV contendo as arestas
 # e constrói uma lista de adjacência representando o grafo.
-def carregar_lista_adjacencia() -> dict[str, list[tuple[str, float]]]:
+# Com compacto=True o grafo é devolvido como GrafoCSR (ids inteiros e vetores contíguos).
+# Com snapshot=True o grafo é lido do snapshot binário ao lado do CSV (criado na primeira leitura
+# e reconstruído sozinho quando o CSV muda), sem passar pelo csv.DictReader.
+def carregar_lista_adjacencia(compacto: bool = False, snapshot: bool = True) -> dict[str, list[tuple[str, float]]] | GrafoCSR:
+    if snapshot:
+        grafo = carregar_com_snapshot(caminho_csv, carregar_grafo_csr)
+        return grafo if compacto else grafo.para_lista_adjacencia()
+
+    if compacto:
+        return carregar_grafo_csr()
+
     # Cria um dicionário que, para cada bairro (vértice),
     # armazenará uma lista de tuplas (vizinho, peso da ligação)
     grafo = defaultdict(list)
@@ -33,6 +47,31 @@ def carregar_lista_adjacencia() -> dict[str, list[tuple[str, float]]]:
     # Converte o defaultdict em dict normal antes de retornar
     return dict(grafo)
 
+# Lê o mesmo CSV direto para o formato compacto, sem montar o dicionário intermediário
+def carregar_grafo_csr(caminho_csv: str = caminho_csv) -> GrafoCSR:
+    # bairro -> id inteiro, na ordem em que aparecem (mesma ordem das chaves do dicionário)
+    ids: dict[str, int] = {}
+
+    # arestas em colunas: origem, destino e peso
+    origens = array("i")
+    destinos = array("i")
+    pesos = array("d")
+
+    with open(caminho_csv, encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+
+        for linha in reader:
+            origem = ids.setdefault(linha["bairro_origem"].strip().lower(), len(ids))
+            destino = ids.setdefault(linha["bairro_destino"].strip().lower(), len(ids))
+            peso = float(linha["peso"])
+
+            # grafo não-direcionado: a aresta é guardada nas duas direções
+            origens.extend((origem, destino))
+            destinos.extend((destino, origem))
+            pesos.extend((peso, peso))
+
+    return GrafoCSR.de_arestas(list(ids.keys()), origens, destinos, pesos, dirigido=False)
+
 # Bloco principal — só é executado se o arquivo for rodado diretamente (não importado)
 if __name__ == "__main__":
 
@@ -0,0 +1,44 @@
+import numpy as np
+
+# Graus de todos os vértices calculados de uma vez sobre os vetores do grafo compacto.
+#
+# Grau de saída é a diferença entre offsets consecutivos; grau de entrada e graus ponderados são um
+# np.bincount sobre alvos/origens (com os pesos como "weights"). Histogramas, maiores graus e percentis
+# são tirados desses vetores, sem laços em Python nem arquivos intermediários.
+#
+# No grafo não-direcionado cada aresta aparece nas duas listas, então entrada == saída == grau.
+
+
+class Graus:
+
+    def __init__(self, grafo):
+
+        # Definição dos parâmetros:
+        #   grafo -> GrafoCSR (offsets/alvos/pesos); normalmente obtido por grafo.graus, que guarda o resultado
+
+        n = len(grafo.offsets) - 1
+        origens = np.repeat(np.arange(n), np.diff(grafo.offsets))
+
+        # número de arestas que saem / chegam em cada vértice (arestas paralelas contam)
+        self.saida = np.diff(grafo.offsets)
+        self.entrada = np.bincount(grafo.alvos, minlength=n)
+
+        # soma dos pesos das arestas que saem / chegam em cada vértice
+        self.peso_saida = np.bincount(origens, weights=grafo.pesos, minlength=n)
+        self.peso_entrada = np.bincount(grafo.alvos, weights=grafo.pesos, minlength=n)
+
+        # histograma[g] -> quantos vértices têm grau g
+        self.histograma_saida = np.bincount(self.saida)
+        self.histograma_entrada = np.bincount(self.entrada)
+
+    # ids dos k vértices de maior grau, do maior para o menor; empates ficam na ordem dos ids
+    def maiores(self, k=1, entrada=False):
+        graus = self.entrada if entrada else self.saida
+        return np.argsort(-graus, kind="stable")[:k].tolist()
+
+    # percentis (0 a 100) da distribuição de graus
+    def percentis(self, percentis=(50, 90, 99), entrada=False):
+        graus = self.entrada if entrada else self.saida
+        if len(graus) == 0:
+            return {p: 0.0 for p in percentis}
+        return dict(zip(percentis, np.percentile(graus, percentis).tolist()))
@@ -0,0 +1,142 @@
+import re
+import unicodedata
+from collections import Counter
+from functools import lru_cache
+
+# Índice de nomes de vértices: nome normalizado (ou apelido) -> id, montado uma vez por grafo.
+#
+# Os nomes que chegam do usuário ("Várzea", "  VARZEA ", "pau ferro") passam pela mesma normalização
+# (sem acentos, minúsculas, pontuação vira espaço) que os nomes do grafo, então todos os caminhos do
+# código resolvem o mesmo vértice. A normalização fica em um cache LRU limitado: nomes repetidos (como
+# os bairros do enderecos.csv) só são normalizados uma vez.
+#
+# Quando o nome não existe, a busca aproximada compara os trigramas do nome com os de todas as chaves
+# (índice invertido trigrama -> chaves) e aceita a chave mais parecida se a similaridade de Jaccard
+# passar do limiar. Se nada passar, o erro sai na hora, com sugestões, antes de qualquer travessia.
+#
+# Dois vértices cujos nomes viram a mesma chave ("São José" e "sao jose") não são resolvidos por ela:
+# a chave fica ambígua e a busca levanta VerticeDesconhecido com todos os candidatos como sugestões
+# (o nome escrito exatamente como está no grafo continua resolvendo o seu vértice).
+
+
+# Remove acentos, espaços extras e transforma em minúsculas
+@lru_cache(maxsize=4096)
+def normalizar_nome(nome: str) -> str:
+    nome = unicodedata.normalize("NFKD", nome)
+    nome = nome.encode("ASCII", "ignore").decode("utf-8").lower().strip()
+    nome = re.sub(r"\s+", " ", nome)  # colapsa espaços internos
+    return nome
+
+# Chave usada no índice: nome normalizado com a pontuação ("pau-ferro") trocada por espaço
+@lru_cache(maxsize=4096)
+def chave_busca(nome: str) -> str:
+    return re.sub(r"[^a-z0-9]+", " ", normalizar_nome(nome)).strip()
+
+def _trigramas(chave: str) -> Counter:
+    texto = f"  {chave} "
+    return Counter(texto[i:i + 3] for i in range(len(texto) - 2))
+
+
+class VerticeDesconhecido(KeyError):
+
+    def __init__(self, nome, sugestoes):
+        super().__init__(nome)
+        self.nome = nome
+        self.sugestoes = sugestoes
+
+    def __str__(self):
+        if self.sugestoes:
+            return f"Vértice desconhecido: {self.nome!r} (você quis dizer {', '.join(self.sugestoes)}?)"
+        return f"Vértice desconhecido: {self.nome!r}"
+
+
+class IndiceVertices:
+
+    def __init__(self, nomes, apelidos=None, limiar=0.5):
+
+        # Definição dos parâmetros:
+        #   nomes -> nome de cada vértice, na ordem dos ids
+        #   apelidos -> dicionário apelido -> nome do vértice (opcional)
+        #   limiar -> similaridade mínima (0 a 1) para aceitar a busca aproximada
+
+        self.nomes = list(nomes)
+        self.limiar = limiar
+        self._id_nome = {nome: i for i, nome in enumerate(self.nomes)}
+
+        # chave -> ids dos vértices que ela pode indicar; o nome exato vence um apelido com a mesma chave
+        candidatos = {}
+        for apelido, nome in (apelidos or {}).items():
+            candidatos.setdefault(chave_busca(apelido), {})[self._id_nome[nome]] = None
+        por_nome = {}
+        for i, nome in enumerate(self.nomes):
+            por_nome.setdefault(chave_busca(nome), {})[i] = None
+        candidatos.update(por_nome)
+
+        # chave -> id das chaves sem conflito; as outras guardam todos os candidatos
+        self.ids = {}
+        self._ambiguas = {}
+        for chave, ids in candidatos.items():
+            if len(ids) == 1:
+                self.ids[chave] = next(iter(ids))
+            else:
+                self._ambiguas[chave] = list(ids)
+
+        # índice invertido: trigrama -> posições das chaves que têm esse trigrama
+        # (uma posição por candidato, para que as chaves ambíguas também apareçam nas sugestões)
+        self._chaves = [(chave, i) for chave, ids in candidatos.items() for i in ids]
+        self._tamanhos = []
+        self._postagens = {}
+        for posicao, (chave, _) in enumerate(self._chaves):
+            trigramas = _trigramas(chave)
+            self._tamanhos.append(sum(trigramas.values()))
+            for trigrama, quantidade in trigramas.items():
+                self._postagens.setdefault(trigrama, []).append((posicao, quantidade))
+
+    def __contains__(self, nome):
+        return chave_busca(nome) in self.ids
+
+    # As k chaves mais parecidas com o nome: [(nome do vértice, similaridade)], da maior para a menor
+    def sugestoes(self, nome, k=3):
+        consulta = _trigramas(chave_busca(nome))
+        tamanho_consulta = sum(consulta.values())
+
+        # trigramas em comum com cada chave (só as chaves que aparecem em alguma postagem)
+        comuns = Counter()
+        for trigrama, quantidade in consulta.items():
+            for posicao, quantidade_chave in self._postagens.get(trigrama, ()):
+                comuns[posicao] += min(quantidade, quantidade_chave)
+
+        melhores = {}
+        for posicao, comum in comuns.items():
+            similaridade = comum / (tamanho_consulta + self._tamanhos[posicao] - comum)
+            vertice = self.nomes[self._chaves[posicao][1]]
+            melhores[vertice] = max(similaridade, melhores.get(vertice, 0.0))
+
+        return sorted(melhores.items(), key=lambda item: -item[1])[:k]
+
+    # Id do vértice; sem correspondência exata usa a busca aproximada (se aproximado=True)
+    def id(self, nome, aproximado=True) -> int:
+        chave = chave_busca(nome)
+        i = self.ids.get(chave)
+        if i is not None:
+            return i
+
+        # chave de mais de um vértice: só o nome exato decide, senão as sugestões são os candidatos
+        if chave in self._ambiguas:
+            if nome in self._id_nome:
+                return self._id_nome[nome]
+            raise VerticeDesconhecido(nome, [self.nomes[i] for i in self._ambiguas[chave]])
+
+        sugestoes = self.sugestoes(nome)
+        if aproximado and sugestoes and sugestoes[0][1] >= self.limiar:
+            # a busca aproximada também não escolhe entre vértices com a mesma chave
+            ambigua = self._ambiguas.get(chave_busca(sugestoes[0][0]))
+            if ambigua:
+                raise VerticeDesconhecido(nome, [self.nomes[i] for i in ambigua])
+            return self._id_nome[sugestoes[0][0]]
+
+        raise VerticeDesconhecido(nome, [vertice for vertice, _ in sugestoes])
+
+    # Nome do vértice, como está no grafo
+    def resolver(self, nome, aproximado=True) -> str:
+        return self.nomes[self.id(nome, aproximado)]
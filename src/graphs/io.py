@@ -1,20 +1,22 @@
 import csv
 import os
-import unicodedata
+import time
 import re
+from concurrent.futures import ProcessPoolExecutor
 from collections import defaultdict
+from array import array
+from io import StringIO
+
+from graphs.csr import GrafoCSR
+from graphs.indice import normalizar_nome
+from graphs.snapshot import carregar_com_snapshot, salvar_snapshot
+from graphs.temporal import ArmazemTemporal, construir_armazem_temporal
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 caminho_csvFiltrado = os.path.join(BASE_DIR, "../../data/dataset_parte2/csvFiltrado.csv")
+caminho_temporal = os.path.join(BASE_DIR, "../../data/dataset_parte2/airlineFlightRoutes.temporal.npz")
 
 
-def normalizar_nome(nome: str) -> str:
-    # Remove acentos, espaços extras e transforma em minúsculas
-    nome = unicodedata.normalize("NFKD", nome)
-    nome = nome.encode("ASCII", "ignore").decode("utf-8").lower().strip()
-    nome = re.sub(r"\s+", " ", nome)  # colapsa espaços internos
-    return nome
-
 ##############################
 # PARTE 1
 ##############################
@@ -77,48 +79,246 @@ def ler_dataset_bruto(caminho: str):
             linhas.append(linha)
     return linhas   
 
-# Função pra filtrar o dataset e gerar um csv limpo
-def filtrar_dataset_2024_e_gerar_csv(caminho_entrada: str, caminho_saida: str):
-    with open(caminho_entrada, newline='', encoding="utf-8") as f_in:
-        leitor = csv.DictReader(f_in) # lê como um dicionario
+##############################
+# Leitura do dataset bruto em blocos, em vários processos
+#
+# O arquivo é dividido em intervalos de bytes de ~tamanho_bloco, com cada limite empurrado até o fim da
+# linha em que caiu (nenhuma linha fica partida entre dois blocos). Cada processo lê o seu intervalo,
+# aplica o filtro (ano, aeroportos e nsmiles preenchidos) e remove as duplicatas dentro do bloco.
+# A junção percorre os blocos na ordem do arquivo e mantém a primeira ocorrência de cada rota, então o
+# resultado é exatamente o da leitura sequencial.
+#
+# Os limites são procurados por quebras de linha: o dataset não tem campos entre aspas com quebra de
+# linha dentro (as aspas só protegem vírgulas, como em "Albuquerque, NM").
+##############################
 
-        # Já prepara o arquivo de saída 
-        with open(caminho_saida, "w", encoding="utf-8", newline="") as f_out:
-            escritor = csv.writer(f_out)
+# tamanho aproximado de cada bloco lido por um processo
+TAMANHO_BLOCO = 32 << 20
 
-            # Cabeçalho 
-            escritor.writerow(["vertice_origem", "vertice_destino", "peso"])
+# Intervalos [inicio, fim) de bytes de cada bloco, depois do cabeçalho, alinhados em fim de linha
+def _limites_blocos(caminho: str, tamanho_bloco: int) -> tuple[list[str], list[tuple[int, int]]]:
+    tamanho = os.path.getsize(caminho)
 
-            # Pra evitar duplicatas
-            vistos = set()
+    with open(caminho, "rb") as f:
+        cabecalho = next(csv.reader([f.readline().decode("utf-8-sig")]))
+        inicio = f.tell()
 
-            for linha in leitor:
-                # Filtra apenas voos de 2024
-                if linha["Year"] != "2024":
-                    continue
+        limites = []
+        while inicio < tamanho:
+            f.seek(min(inicio + tamanho_bloco, tamanho))
+            f.readline()
+            fim = min(f.tell(), tamanho)
+            limites.append((inicio, fim))
+            inicio = fim
 
-                vertice_origem = linha["airport_1"].strip().lower()
-                vertice_destino = linha["airport_2"].strip().lower()
-                peso_str = linha["nsmiles"].strip()
+    return cabecalho, limites
 
-                # validações básicas
-                if not vertice_destino or not vertice_origem or not peso_str:
-                    continue
-                
-                # Converte peso para float
-                peso = float(peso_str)
-                
-                # Verifica duplicatas
+# Lê um bloco e devolve (linhas lidas, rotas do bloco na ordem do arquivo, sem duplicatas no bloco).
+# Cada rota é (período, origem, destino, peso); com ano=None todos os anos são mantidos e o período é o
+# ano (ou "ano-Ttrimestre" com trimestral=True)
+def _ler_bloco(caminho: str, inicio: int, fim: int, cabecalho: list[str], ano: str | None, trimestral: bool = False):
+    with open(caminho, "rb") as f:
+        f.seek(inicio)
+        texto = f.read(fim - inicio).decode("utf-8")
+
+    # newline="" deixa o csv tratar campos entre aspas com quebra de linha
+    leitor = csv.reader(StringIO(texto, newline=""))
+
+    coluna_ano = cabecalho.index("Year")
+    coluna_trimestre = cabecalho.index("quarter") if trimestral else None
+    coluna_origem = cabecalho.index("airport_1")
+    coluna_destino = cabecalho.index("airport_2")
+    coluna_peso = cabecalho.index("nsmiles")
+    colunas = max(coluna_ano, coluna_origem, coluna_destino, coluna_peso, coluna_trimestre or 0) + 1
+
+    lidas = 0
+    rotas = []
+    vistos = set()
+
+    for linha in leitor:
+        if not linha:
+            continue
+        lidas += 1
+
+        # linha curta (cortada ou malformada) é ignorada
+        if len(linha) < colunas:
+            continue
+
+        # Filtra apenas voos do ano pedido
+        if ano is not None and linha[coluna_ano] != ano:
+            continue
+
+        vertice_origem = linha[coluna_origem].strip().lower()
+        vertice_destino = linha[coluna_destino].strip().lower()
+        peso_str = linha[coluna_peso].strip()
+
+        # validações básicas
+        if not vertice_destino or not vertice_origem or not peso_str:
+            continue
+
+        # sem ano não há período onde guardar a rota
+        periodo = linha[coluna_ano].strip()
+        if not periodo:
+            continue
+        if trimestral:
+            periodo = f"{periodo}-T{linha[coluna_trimestre].strip()}"
+
+        try:
+            peso = float(peso_str)
+        except ValueError:
+            continue
+
+        chave = (periodo, vertice_origem, vertice_destino)
+        if chave in vistos:
+            continue
+        vistos.add(chave)
+
+        rotas.append((periodo, vertice_origem, vertice_destino, peso))
+
+    return lidas, rotas
+
+# Lê todos os blocos do dataset bruto (em processos) e devolve (blocos na ordem do arquivo, processos usados)
+def _ler_blocos(caminho: str, ano: str | None, trimestral: bool, processos: int | None, tamanho_bloco: int):
+    cabecalho, limites = _limites_blocos(caminho, tamanho_bloco)
+    argumentos = [(caminho, ini, fim, cabecalho, ano, trimestral) for ini, fim in limites]
+
+    processos = processos or os.cpu_count() or 1
+    processos = max(1, min(processos, len(limites)))
+
+    if processos == 1:
+        return [_ler_bloco(*args) for args in argumentos], processos
+
+    with ProcessPoolExecutor(processos) as executor:
+        # executor.map devolve os blocos na ordem do arquivo
+        return list(executor.map(_ler_bloco, *zip(*argumentos))), processos
+
+def filtrar_dataset_paralelo(caminho_entrada: str, caminho_saida: str, ano: str = "2024", processos: int | None = None, tamanho_bloco: int = TAMANHO_BLOCO, snapshot: bool = False) -> dict:
+
+    # Definição dos parâmetros:
+    #   caminho_entrada -> dataset bruto (airlineFlightRoutes.csv)
+    #   caminho_saida -> csv filtrado (vertice_origem, vertice_destino, peso)
+    #   ano -> valor da coluna Year que entra no csv filtrado
+    #   processos -> número de processos (None: os.cpu_count(); 1: lê no próprio processo)
+    #   tamanho_bloco -> bytes (aproximados) por bloco
+    #   snapshot -> se True, grava também o snapshot binário do csv filtrado (graphs.snapshot), já com o grafo
+    #               montado aqui, para que a próxima leitura (mesmo sem o csv) não precise reprocessar o texto
+    #
+    # Retorna o relatório da leitura: linhas lidas, rotas gravadas, blocos, segundos e linhas por segundo.
+
+    inicio_tempo = time.perf_counter()
+
+    blocos, processos = _ler_blocos(caminho_entrada, ano, False, processos, tamanho_bloco)
+
+    lidas = 0
+    gravadas = 0
+
+    # arestas do snapshot, com os ids na mesma ordem de carregar_grafo_csr_parte2
+    ids: dict[str, int] = {}
+    origens = array("i")
+    destinos = array("i")
+    pesos = array("d")
+
+    with open(caminho_saida, "w", encoding="utf-8", newline="") as f_out:
+        escritor = csv.writer(f_out)
+
+        # Cabeçalho 
+        escritor.writerow(["vertice_origem", "vertice_destino", "peso"])
+
+        # Pra evitar duplicatas entre blocos (fica a primeira ocorrência no arquivo)
+        vistos = set()
+
+        for lidas_bloco, rotas in blocos:
+            lidas += lidas_bloco
+
+            for _, vertice_origem, vertice_destino, peso in rotas:
                 chave = (vertice_origem, vertice_destino)
                 if chave in vistos:
                     continue
                 vistos.add(chave)
-                
-                # Escreve no arquivo de saída
+
                 escritor.writerow([vertice_origem, vertice_destino, peso])
+                gravadas += 1
+
+                if snapshot:
+                    destinos.append(ids.setdefault(vertice_destino, len(ids)))
+                    origens.append(ids.setdefault(vertice_origem, len(ids)))
+                    pesos.append(peso)
+
+    if snapshot:
+        salvar_snapshot(GrafoCSR.de_arestas(list(ids.keys()), origens, destinos, pesos), caminho_saida)
+
+    segundos = time.perf_counter() - inicio_tempo
+
+    return {
+        "linhas_lidas": lidas,
+        "rotas_gravadas": gravadas,
+        "blocos": len(blocos),
+        "processos": processos,
+        "segundos": round(segundos, 4),
+        "linhas_por_segundo": round(lidas / segundos, 1) if segundos > 0 else 0.0
+    }
+
+# Lê o dataset bruto uma única vez (todos os anos) e grava o armazém temporal (grafo base + diferenças
+# por período, ver graphs.temporal). Retorna (armazém, relatório da leitura)
+def gerar_armazem_temporal(caminho_entrada: str, caminho_saida: str = caminho_temporal, trimestral: bool = False, processos: int | None = None, tamanho_bloco: int = TAMANHO_BLOCO):
+    inicio_tempo = time.perf_counter()
+
+    blocos, processos = _ler_blocos(caminho_entrada, None, trimestral, processos, tamanho_bloco)
+
+    armazem = construir_armazem_temporal(rota for _, rotas in blocos for rota in rotas)
+    armazem.salvar(caminho_saida)
+
+    lidas = sum(lidas_bloco for lidas_bloco, _ in blocos)
+    segundos = time.perf_counter() - inicio_tempo
+
+    relatorio = {
+        "linhas_lidas": lidas,
+        "periodos": armazem.periodos,
+        "rotas": armazem.num_arestas,
+        "blocos": len(blocos),
+        "processos": processos,
+        "segundos": round(segundos, 4),
+        "linhas_por_segundo": round(lidas / segundos, 1) if segundos > 0 else 0.0
+    }
+
+    return armazem, relatorio
+
+# armazéns temporais já abertos: caminho -> (mtime do arquivo, armazém)
+_armazens: dict[str, tuple[int, ArmazemTemporal]] = {}
+
+def carregar_armazem_temporal(caminho: str = caminho_temporal) -> ArmazemTemporal:
+    if not os.path.exists(caminho):
+        raise FileNotFoundError(f"{caminho} não existe: gere com gerar_armazem_temporal(airlineFlightRoutes.csv)")
+
+    mtime = os.stat(caminho).st_mtime_ns
+    aberto = _armazens.get(caminho)
+    if aberto is None or aberto[0] != mtime:
+        aberto = _armazens[caminho] = (mtime, ArmazemTemporal.carregar(caminho))
+
+    return aberto[1]
+
+# Função pra filtrar o dataset e gerar um csv limpo (e o snapshot binário ao lado dele)
+def filtrar_dataset_2024_e_gerar_csv(caminho_entrada: str, caminho_saida: str, processos: int | None = None) -> dict:
+    return filtrar_dataset_paralelo(caminho_entrada, caminho_saida, "2024", processos, snapshot=True)
 
 # Função pra transformar o csv filtrado em uma lista de adjacência
-def carregar_lista_adjacencia_parte2(caminho_csv: str = caminho_csvFiltrado) -> dict:
+# Com compacto=True o grafo é devolvido como GrafoCSR (ids inteiros, vetores contíguos e índice reverso).
+# Com snapshot=True o grafo é lido do snapshot binário ao lado do CSV (criado na primeira leitura ou pelo
+# filtro, e reconstruído sozinho quando o CSV muda), sem passar pelo csv.DictReader; sem o CSV, o snapshot
+# é usado como está.
+# Com ano (ou período "2024-T1") o grafo vem do armazém temporal, sem ler nenhum CSV.
+def carregar_lista_adjacencia_parte2(caminho_csv: str = caminho_csvFiltrado, compacto: bool = False, snapshot: bool = True, ano: str | int | None = None, caminho_armazem: str = caminho_temporal) -> dict | GrafoCSR:
+    if ano is not None:
+        grafo = carregar_armazem_temporal(caminho_armazem).grafo(ano)
+        return grafo if compacto else grafo.para_lista_adjacencia()
+
+    if snapshot:
+        grafo = carregar_com_snapshot(caminho_csv, carregar_grafo_csr_parte2)
+        return grafo if compacto else grafo.para_lista_adjacencia()
+
+    if compacto:
+        return carregar_grafo_csr_parte2(caminho_csv)
+
     grafo = defaultdict(list)
 
     with open(caminho_csv, newline='', encoding="utf-8") as f:
@@ -138,6 +338,29 @@ def carregar_lista_adjacencia_parte2(caminho_csv: str = caminho_csvFiltrado) ->
 
     return dict(grafo)
 
+# Lê o csv filtrado direto para o formato compacto, sem montar o dicionário intermediário
+def carregar_grafo_csr_parte2(caminho_csv: str = caminho_csvFiltrado) -> GrafoCSR:
+    # vértice -> id inteiro, na mesma ordem das chaves de carregar_lista_adjacencia_parte2
+    ids: dict[str, int] = {}
+
+    origens = array("i")
+    destinos = array("i")
+    pesos = array("d")
+
+    with open(caminho_csv, newline='', encoding="utf-8") as f:
+        leitor = csv.DictReader(f)
+
+        for linha in leitor:
+            origem = linha["vertice_origem"].strip().lower()
+            destino = linha["vertice_destino"].strip().lower()
+
+            # o destino recebe id antes da origem, como no dicionário
+            destinos.append(ids.setdefault(destino, len(ids)))
+            origens.append(ids.setdefault(origem, len(ids)))
+            pesos.append(float(linha["peso"].strip()))
+
+    return GrafoCSR.de_arestas(list(ids.keys()), origens, destinos, pesos, dirigido=True)
+
 # Main para testar as funções 
 if __name__ == "__main__":
     #caminho_csv = "../../data/bairros_recife.csv"
@@ -153,8 +376,9 @@ if __name__ == "__main__":
 
     """
     try:
-        filtrar_dataset_2024_e_gerar_csv(caminho_csvBruto, saida_csvFiltrado)
+        relatorio = filtrar_dataset_2024_e_gerar_csv(caminho_csvBruto, saida_csvFiltrado)
         print("CSV filtrado gerado com sucesso!")
+        print(f"{relatorio['linhas_lidas']} linhas em {relatorio['segundos']}s ({relatorio['linhas_por_segundo']} linhas/s)")
 
     except Exception as e:
         print("Erro:", e)
@@ -0,0 +1,123 @@
+import numpy as np
+
+# Componentes fortemente conexas (Tarjan iterativo) e o DAG de condensação.
+#
+# Cada componente vira um vértice do DAG de condensação, e existe a aresta C1 -> C2 quando alguma aresta
+# do grafo sai de C1 e chega em C2. As componentes são numeradas em ordem topológica: toda aresta do
+# grafo vai de uma componente para ela mesma ou para uma de número maior. Assim:
+#   componente[u] > componente[v]  -> não existe caminho de u até v (resposta em O(1))
+#   componente[x] > componente[v]  -> x não chega em v, e a busca de u para v pode ignorar x
+#
+# No grafo não-direcionado as componentes fortemente conexas são as componentes conexas.
+
+
+class Condensacao:
+
+    def __init__(self, grafo):
+
+        # Definição dos parâmetros:
+        #   grafo -> GrafoCSR (offsets/alvos); normalmente obtido por grafo.condensacao, que guarda o resultado
+
+        componente, quantidade = _tarjan(grafo)
+
+        # vértice -> número da componente (em ordem topológica)
+        self.componente = componente
+        self.num_componentes = quantidade
+        self.tamanhos = np.bincount(componente, minlength=quantidade)
+
+        # DAG de condensação em CSR, sem arestas repetidas nem laços
+        origens = componente[np.repeat(np.arange(len(componente)), np.diff(grafo.offsets))]
+        destinos = componente[grafo.alvos]
+        externas = origens != destinos
+        arestas = np.unique(origens[externas].astype(np.int64) * quantidade + destinos[externas])
+
+        self.dag_offsets = np.zeros(quantidade + 1, dtype=np.int64)
+        np.cumsum(np.bincount(arestas // quantidade, minlength=quantidade), out=self.dag_offsets[1:])
+        self.dag_alvos = (arestas % quantidade).astype(np.int32)
+
+        # componentes sem arestas de saída (sumidouros) e sem arestas de entrada (fontes) no DAG
+        self.sumidouro = np.diff(self.dag_offsets) == 0
+        self.fonte = np.bincount(self.dag_alvos, minlength=quantidade) == 0
+
+    # True quando a condensação garante que não há caminho do id "inicio" até o id "destino".
+    # False não garante que o caminho exista (só que a busca é necessária)
+    def sem_rota(self, inicio, destino):
+        c_inicio = self.componente[inicio]
+        c_destino = self.componente[destino]
+
+        if c_inicio == c_destino:
+            return False
+
+        # ordem topológica, componente sem saída ou destino em componente sem entrada
+        return bool(c_inicio > c_destino or self.sumidouro[c_inicio] or self.fonte[c_destino])
+
+# Tarjan com pilha explícita (sem recursão): devolve (componente de cada vértice, número de componentes)
+def _tarjan(grafo):
+    n = len(grafo.offsets) - 1
+    offsets = grafo.offsets.tolist()
+    alvos = grafo.alvos.tolist()
+
+    indice = [-1] * n
+    menor = [0] * n
+    na_pilha = bytearray(n)
+    pilha = []
+    componente = [-1] * n
+
+    contador = 0
+    quantidade = 0
+
+    for raiz in range(n):
+        if indice[raiz] != -1:
+            continue
+
+        indice[raiz] = menor[raiz] = contador
+        contador += 1
+        pilha.append(raiz)
+        na_pilha[raiz] = 1
+
+        # pilha de chamadas: vértice e a próxima aresta dele a examinar
+        chamadas = [raiz]
+        proxima = [offsets[raiz]]
+
+        while chamadas:
+            vertice = chamadas[-1]
+            i = proxima[-1]
+
+            if i < offsets[vertice + 1]:
+                proxima[-1] = i + 1
+                v_adjacente = alvos[i]
+
+                if indice[v_adjacente] == -1:
+                    indice[v_adjacente] = menor[v_adjacente] = contador
+                    contador += 1
+                    pilha.append(v_adjacente)
+                    na_pilha[v_adjacente] = 1
+
+                    chamadas.append(v_adjacente)
+                    proxima.append(offsets[v_adjacente])
+                elif na_pilha[v_adjacente] and indice[v_adjacente] < menor[vertice]:
+                    menor[vertice] = indice[v_adjacente]
+                continue
+
+            # todas as arestas examinadas: "retorna" para o vértice anterior
+            chamadas.pop()
+            proxima.pop()
+            if chamadas and menor[vertice] < menor[chamadas[-1]]:
+                menor[chamadas[-1]] = menor[vertice]
+
+            # raiz de uma componente: tudo acima dela na pilha pertence à mesma componente
+            if menor[vertice] == indice[vertice]:
+                while True:
+                    membro = pilha.pop()
+                    na_pilha[membro] = 0
+                    componente[membro] = quantidade
+                    if membro == vertice:
+                        break
+                quantidade += 1
+
+    # o Tarjan fecha as componentes em ordem topológica inversa
+    componente = np.array(componente, dtype=np.int32)
+    if n:
+        componente = (quantidade - 1 - componente).astype(np.int32)
+
+    return componente, quantidade
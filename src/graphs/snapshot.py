@@ -0,0 +1,187 @@
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import zipfile
+
+import numpy as np
+
+from graphs.csr import GrafoCSR
+
+# Snapshot binário dos grafos lidos dos CSVs.
+#
+# Na primeira leitura o GrafoCSR é salvo ao lado do CSV de origem, em um .npz sem compressão.
+# Nas leituras seguintes os vetores são mapeados direto do arquivo (np.memmap), sem copiar
+# nem reprocessar o CSV: vários processos que mapeiam o mesmo snapshot dividem uma única cópia física
+# nas páginas do sistema operacional. O snapshot guarda o tamanho, o mtime e o sha256 do CSV e é
+# reconstruído sozinho quando o CSV muda. Sem o CSV (um worker que só recebeu o snapshot, por exemplo)
+# o snapshot é usado como está.
+
+# versão do layout do snapshot (muda quando os vetores salvos mudam)
+FORMATO_SNAPSHOT = 1
+
+# tamanho fixo do cabeçalho local de cada arquivo dentro do zip
+_TAMANHO_CABECALHO_ZIP = 30
+
+
+def caminho_snapshot(caminho_csv: str) -> str:
+    # data/adjacencias_bairros.csv -> data/adjacencias_bairros.snapshot.npz
+    return os.path.splitext(caminho_csv)[0] + ".snapshot.npz"
+
+def hash_arquivo(caminho: str) -> str:
+    h = hashlib.sha256()
+    with open(caminho, "rb") as f:
+        for bloco in iter(lambda: f.read(1 << 20), b""):
+            h.update(bloco)
+    return h.hexdigest()
+
+##############################
+# .npz mapeado em memória
+##############################
+
+# Salva os vetores em um .npz sem compressão (requisito para mapear depois).
+# Escreve em um arquivo temporário (nome único, na mesma pasta) e troca no final, para nunca deixar um
+# snapshot pela metade nem misturar a escrita de dois processos que gravam o mesmo arquivo ao mesmo tempo.
+def salvar_npz(caminho: str, vetores: dict[str, np.ndarray]) -> None:
+    pasta, nome = os.path.split(os.path.abspath(caminho))
+    with tempfile.NamedTemporaryFile(dir=pasta, prefix=nome + ".", suffix=".tmp", delete=False) as f:
+        temporario = f.name
+        try:
+            np.savez(f, **vetores)
+        except BaseException:
+            f.close()
+            os.remove(temporario)
+            raise
+    os.replace(temporario, caminho)
+
+# Abre um .npz sem compressão e devolve cada vetor como np.memmap somente leitura.
+# (np.load ignora mmap_mode para .npz, então os deslocamentos são calculados a partir do zip)
+def mapear_npz(caminho: str) -> dict[str, np.ndarray]:
+    vetores = {}
+
+    with open(caminho, "rb") as f, zipfile.ZipFile(f) as arquivo_zip:
+        for info in arquivo_zip.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"{caminho}: '{info.filename}' está comprimido e não pode ser mapeado")
+
+            # o cabeçalho local tem nome e campo extra de tamanho variável antes dos dados
+            f.seek(info.header_offset)
+            cabecalho = f.read(_TAMANHO_CABECALHO_ZIP)
+            tamanho_nome, tamanho_extra = struct.unpack("<HH", cabecalho[26:30])
+            f.seek(info.header_offset + _TAMANHO_CABECALHO_ZIP + tamanho_nome + tamanho_extra)
+
+            # cabeçalho do .npy: tipo, formato e ordem do vetor
+            versao = np.lib.format.read_magic(f)
+            if versao == (1, 0):
+                formato, fortran, tipo = np.lib.format.read_array_header_1_0(f)
+            else:
+                formato, fortran, tipo = np.lib.format.read_array_header_2_0(f)
+
+            nome = info.filename.removesuffix(".npy")
+
+            # np.memmap não aceita vetores vazios
+            if int(np.prod(formato)) == 0:
+                vetores[nome] = np.empty(formato, dtype=tipo)
+                continue
+
+            vetores[nome] = np.memmap(
+                caminho, dtype=tipo, mode="r", offset=f.tell(),
+                shape=formato, order="F" if fortran else "C"
+            )
+
+    return vetores
+
+##############################
+# Snapshot de grafos
+##############################
+
+def _metadados_csv(caminho_csv: str) -> dict:
+    info = os.stat(caminho_csv)
+    return {"tamanho": info.st_size, "mtime_ns": info.st_mtime_ns}
+
+def salvar_snapshot(grafo: GrafoCSR, caminho_csv: str, sha256: str | None = None) -> str:
+    meta = _metadados_csv(caminho_csv)
+    meta["sha256"] = sha256 or hash_arquivo(caminho_csv)
+    meta["formato"] = FORMATO_SNAPSHOT
+    meta["dirigido"] = grafo.dirigido
+
+    vetores = {
+        "meta": np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8),
+        "nomes": np.array(grafo.nomes, dtype=str),
+        "offsets": grafo.offsets,
+        "alvos": grafo.alvos,
+        "pesos": grafo.pesos,
+    }
+
+    # o índice reverso só existe (e só é salvo) em grafos dirigidos
+    if grafo.dirigido:
+        reverso = grafo.reverso
+        vetores["rev_offsets"] = reverso.offsets
+        vetores["rev_alvos"] = reverso.alvos
+        vetores["rev_pesos"] = reverso.pesos
+
+    destino = caminho_snapshot(caminho_csv)
+    salvar_npz(destino, vetores)
+    return destino
+
+# Retorna o GrafoCSR mapeado do snapshot, ou None se ele não existe ou está desatualizado
+# (sem o CSV não há com o que comparar e o snapshot é sempre aceito)
+def carregar_snapshot(caminho_csv: str) -> GrafoCSR | None:
+    origem = caminho_snapshot(caminho_csv)
+    if not os.path.exists(origem):
+        return None
+
+    try:
+        vetores = mapear_npz(origem)
+        meta = json.loads(bytes(vetores["meta"]).decode("utf-8"))
+    except (OSError, ValueError, KeyError):
+        # snapshot corrompido ou de outro formato: será reconstruído
+        return None
+
+    if meta.get("formato") != FORMATO_SNAPSHOT:
+        return None
+
+    mtime_mudou = False
+    if os.path.exists(caminho_csv):
+        atual = _metadados_csv(caminho_csv)
+        if atual["tamanho"] != meta["tamanho"]:
+            return None
+
+        # mesmo tamanho mas mtime diferente: confere o conteúdo antes de descartar o snapshot
+        mtime_mudou = atual["mtime_ns"] != meta["mtime_ns"]
+        if mtime_mudou and hash_arquivo(caminho_csv) != meta["sha256"]:
+            return None
+
+    grafo = GrafoCSR(vetores["nomes"].tolist(), vetores["offsets"], vetores["alvos"], vetores["pesos"], meta["dirigido"])
+
+    if meta["dirigido"]:
+        grafo._reverso = GrafoCSR(grafo.nomes, vetores["rev_offsets"], vetores["rev_alvos"], vetores["rev_pesos"], ids=grafo.ids)
+        grafo._reverso._reverso = grafo
+
+    # o CSV só foi "tocado": atualiza o mtime do snapshot para a próxima leitura não precisar do hash
+    if mtime_mudou:
+        try:
+            salvar_snapshot(grafo, caminho_csv, meta["sha256"])
+        except OSError:
+            pass
+
+    return grafo
+
+# Carrega o grafo do snapshot quando ele está válido; caso contrário, lê o CSV com "construir"
+# e grava um snapshot novo para as próximas execuções
+def carregar_com_snapshot(caminho_csv: str, construir) -> GrafoCSR:
+    grafo = carregar_snapshot(caminho_csv)
+    if grafo is not None:
+        return grafo
+
+    sha256 = hash_arquivo(caminho_csv)
+    grafo = construir(caminho_csv)
+
+    try:
+        salvar_snapshot(grafo, caminho_csv, sha256)
+    except OSError:
+        # diretório somente leitura, por exemplo: segue sem snapshot
+        pass
+
+    return grafo
@@ -0,0 +1,148 @@
+import numpy as np
+
+from graphs.csr import GrafoCSR
+
+# Subgrafos induzidos sem cópia e métricas de todas as partes de uma partição em uma passada.
+#
+# SubgrafoInduzido guarda só o grafo original e uma máscara de vértices: as arestas continuam nos vetores
+# do GrafoCSR e são filtradas na hora em que são lidas (só ficam as que chegam em um vértice da máscara).
+#
+# metricas_por_grupo recebe o grupo de cada vértice (microrregião, RPA, zona...) e percorre o vetor de
+# arestas uma vez só: cada aresta é interna (mesmo grupo nas duas pontas) ou de corte (sai do grupo), e
+# as contagens de todos os grupos saem de np.bincount sobre o grupo da origem.
+
+
+class SubgrafoInduzido:
+
+    def __init__(self, grafo, mascara):
+
+        # Definição dos parâmetros:
+        #   grafo -> GrafoCSR original (não é copiado)
+        #   mascara -> vetor booleano (um valor por vértice do grafo) com os vértices do subgrafo
+
+        self.grafo = grafo
+        self.mascara = np.asarray(mascara, dtype=bool)
+        self._ids = np.flatnonzero(self.mascara)
+
+    @classmethod
+    def de_vertices(cls, grafo, vertices):
+        mascara = np.zeros(grafo.num_vertices, dtype=bool)
+        mascara[[grafo.ids[v] for v in vertices if v in grafo.ids]] = True
+        return cls(grafo, mascara)
+
+    @property
+    def dirigido(self):
+        return self.grafo.dirigido
+
+    @property
+    def num_vertices(self):
+        return len(self._ids)
+
+    # Número de entradas de aresta internas (no não-direcionado cada aresta aparece duas vezes)
+    @property
+    def num_arestas(self):
+        # o vetor de origens é calculado uma vez e fica guardado no GrafoCSR
+        origens = self.grafo.origens()
+        return int(np.count_nonzero(self.mascara[origens] & self.mascara[self.grafo.alvos]))
+
+    #####################################
+    # Interface de dicionário, como no GrafoCSR
+    #####################################
+
+    def __len__(self):
+        return self.num_vertices
+
+    def __iter__(self):
+        return (self.grafo.nomes[u] for u in self._ids.tolist())
+
+    def __contains__(self, nome):
+        u = self.grafo.ids.get(nome)
+        return u is not None and bool(self.mascara[u])
+
+    def __getitem__(self, nome):
+        if nome not in self:
+            raise KeyError(nome)
+
+        u = self.grafo.ids[nome]
+        ini, fim = self.grafo.offsets[u], self.grafo.offsets[u + 1]
+        alvos = self.grafo.alvos[ini:fim]
+        internas = self.mascara[alvos]
+
+        nomes = self.grafo.nomes
+        return list(zip([nomes[v] for v in alvos[internas].tolist()], self.grafo.pesos[ini:fim][internas].tolist()))
+
+    def keys(self):
+        return list(self)
+
+    def values(self):
+        return [self[nome] for nome in self]
+
+    def items(self):
+        return [(nome, self[nome]) for nome in self]
+
+    def __repr__(self):
+        return f"SubgrafoInduzido(vertices={self.num_vertices}, arestas={self.num_arestas}, dirigido={self.dirigido})"
+
+# Converte rótulos por nome (dicionário vértice -> grupo) no vetor de grupos usado por metricas_por_grupo.
+# Retorna (rótulos na ordem da primeira aparição, grupo de cada vértice); vértices sem rótulo ficam com -1
+def grupos_por_rotulo(grafo, rotulos):
+    nomes_grupos = list(dict.fromkeys(rotulos.values()))
+    numero = {rotulo: i for i, rotulo in enumerate(nomes_grupos)}
+
+    grupo = np.full(grafo.num_vertices, -1, dtype=np.int64)
+    for vertice, rotulo in rotulos.items():
+        u = grafo.ids.get(vertice)
+        if u is not None:
+            grupo[u] = numero[rotulo]
+
+    return nomes_grupos, grupo
+
+def metricas_por_grupo(grafo, grupo, quantidade=None) -> dict:
+
+    # Definição dos parâmetros:
+    #   grafo -> GrafoCSR (ou lista de adjacencia em dicionário, convertida para GrafoCSR)
+    #   grupo -> vetor com o grupo (0..quantidade-1) de cada vértice, ou -1 para vértices fora da partição
+    #   quantidade -> número de grupos (None: maior grupo + 1)
+    #
+    # Retorna um dicionário de vetores, um valor por grupo:
+    #   ordem -> vértices do grupo
+    #   ordem_com_arestas -> vértices do grupo com pelo menos uma aresta interna
+    #   tamanho -> arestas internas (no não-direcionado, entradas / 2)
+    #   densidade -> tamanho / pares possíveis entre os vértices com arestas internas
+    #   arestas_corte -> arestas que saem do grupo
+
+    if not isinstance(grafo, GrafoCSR):
+        grafo = GrafoCSR.de_lista_adjacencia(grafo)
+
+    grupo = np.asarray(grupo, dtype=np.int64)
+    if quantidade is None:
+        quantidade = int(grupo.max()) + 1 if len(grupo) else 0
+
+    origens = grafo.origens()
+    grupo_origem = grupo[origens]
+    grupo_alvo = grupo[grafo.alvos]
+
+    participa = grupo_origem >= 0
+    internas = participa & (grupo_origem == grupo_alvo)
+    corte = participa & (grupo_origem != grupo_alvo)
+
+    entradas = np.bincount(grupo_origem[internas], minlength=quantidade)
+
+    com_arestas = np.zeros(grafo.num_vertices, dtype=bool)
+    com_arestas[origens[internas]] = True
+
+    ordem = np.bincount(grupo[grupo >= 0], minlength=quantidade)
+    ordem_com_arestas = np.bincount(grupo[com_arestas], minlength=quantidade)
+
+    tamanho = entradas if grafo.dirigido else entradas // 2
+    pares = ordem_com_arestas * (ordem_com_arestas - 1)
+    if not grafo.dirigido:
+        pares = pares // 2
+
+    return {
+        "ordem": ordem,
+        "ordem_com_arestas": ordem_com_arestas,
+        "tamanho": tamanho,
+        "densidade": np.divide(tamanho, pares, out=np.zeros(quantidade), where=pares > 0),
+        "arestas_corte": np.bincount(grupo_origem[corte], minlength=quantidade),
+    }
@@ -0,0 +1,197 @@
+import numpy as np
+
+from graphs.csr import GrafoCSR
+from graphs.snapshot import mapear_npz, salvar_npz
+
+# Rotas de vários anos (ou trimestres) guardadas como um grafo base mais diferenças por período.
+#
+# Todas as rotas que aparecem em algum período ficam em uma tabela única de arestas (origem, destino),
+# na ordem da primeira aparição no dataset. Cada período guarda só o que mudou em relação ao anterior:
+#   entradas -> arestas que passam a existir
+#   saidas   -> arestas que deixam de existir
+#   pesos    -> arestas cujo peso (nsmiles) mudou
+# O primeiro período é o grafo base (todas as arestas dele são "entradas").
+#
+# O grafo de um período é obtido aplicando as diferenças até ele sobre uma máscara de arestas (operações
+# vetorizadas, sem reler o dataset), e "quais rotas surgiram/sumiram entre dois anos" é uma comparação
+# de duas máscaras.
+
+
+class ArmazemTemporal:
+
+    def __init__(self, nomes, periodos, origens, destinos, pesos_iniciais,
+                 delta_offsets, delta_arestas, delta_entrou, peso_offsets, peso_arestas, peso_valores):
+
+        # Definição dos parâmetros:
+        #   nomes -> nome de cada vértice (id global, ordem da primeira aparição)
+        #   periodos -> períodos em ordem crescente ("2023", "2024" ou "2024-T1"...)
+        #   origens, destinos -> tabela de arestas (ids globais)
+        #   pesos_iniciais -> peso de cada aresta na primeira vez em que aparece
+        #   delta_offsets -> (períodos + 1) intervalo das mudanças de presença de cada período
+        #   delta_arestas, delta_entrou -> aresta e tipo da mudança (True: entrou, False: saiu)
+        #   peso_offsets -> (períodos + 1) intervalo das mudanças de peso de cada período
+        #   peso_arestas, peso_valores -> aresta e novo peso
+
+        self.nomes = list(nomes)
+        self.periodos = list(periodos)
+        self.indice_periodo = {p: i for i, p in enumerate(self.periodos)}
+
+        self.origens = np.asanyarray(origens, dtype=np.int32)
+        self.destinos = np.asanyarray(destinos, dtype=np.int32)
+        self.pesos_iniciais = np.asanyarray(pesos_iniciais, dtype=np.float64)
+
+        self.delta_offsets = np.asanyarray(delta_offsets, dtype=np.int64)
+        self.delta_arestas = np.asanyarray(delta_arestas, dtype=np.int32)
+        self.delta_entrou = np.asanyarray(delta_entrou, dtype=bool)
+        self.peso_offsets = np.asanyarray(peso_offsets, dtype=np.int64)
+        self.peso_arestas = np.asanyarray(peso_arestas, dtype=np.int32)
+        self.peso_valores = np.asanyarray(peso_valores, dtype=np.float64)
+
+        # grafos de período já montados
+        self._grafos = {}
+
+    @property
+    def num_arestas(self):
+        return len(self.origens)
+
+    # (máscara de arestas presentes, peso de cada aresta) no período
+    def estado(self, periodo):
+        fim = self.indice_periodo[str(periodo)]
+
+        presente = np.zeros(self.num_arestas, dtype=bool)
+        pesos = self.pesos_iniciais.copy()
+
+        for p in range(fim + 1):
+            ini, fim_delta = self.delta_offsets[p], self.delta_offsets[p + 1]
+            presente[self.delta_arestas[ini:fim_delta]] = self.delta_entrou[ini:fim_delta]
+
+            ini, fim_peso = self.peso_offsets[p], self.peso_offsets[p + 1]
+            pesos[self.peso_arestas[ini:fim_peso]] = self.peso_valores[ini:fim_peso]
+
+        return presente, pesos
+
+    # GrafoCSR dirigido do período, só com os vértices que têm alguma rota nele (montado uma vez por período)
+    def grafo(self, periodo) -> GrafoCSR:
+        periodo = str(periodo)
+        if periodo not in self._grafos:
+            presente, pesos = self.estado(periodo)
+            origens = self.origens[presente]
+            destinos = self.destinos[presente]
+
+            # ids do período na ordem dos ids globais
+            usados = np.unique(np.concatenate([origens, destinos]))
+            novo_id = np.full(len(self.nomes), -1, dtype=np.int64)
+            novo_id[usados] = np.arange(len(usados))
+
+            self._grafos[periodo] = GrafoCSR.de_arestas(
+                [self.nomes[v] for v in usados.tolist()], novo_id[origens], novo_id[destinos], pesos[presente]
+            )
+
+        return self._grafos[periodo]
+
+    # Rotas que surgiram e que sumiram do período "de" para o período "ate"
+    def diferenca(self, de, ate) -> dict:
+        antes, _ = self.estado(de)
+        depois, _ = self.estado(ate)
+
+        return {
+            "surgiram": self._rotas(depois & ~antes),
+            "sumiram": self._rotas(antes & ~depois)
+        }
+
+    def _rotas(self, mascara):
+        return [
+            (self.nomes[o], self.nomes[d])
+            for o, d in zip(self.origens[mascara].tolist(), self.destinos[mascara].tolist())
+        ]
+
+    def salvar(self, caminho: str) -> None:
+        salvar_npz(caminho, {
+            "nomes": np.array(self.nomes, dtype=str),
+            "periodos": np.array(self.periodos, dtype=str),
+            "origens": self.origens,
+            "destinos": self.destinos,
+            "pesos_iniciais": self.pesos_iniciais,
+            "delta_offsets": self.delta_offsets,
+            "delta_arestas": self.delta_arestas,
+            "delta_entrou": self.delta_entrou,
+            "peso_offsets": self.peso_offsets,
+            "peso_arestas": self.peso_arestas,
+            "peso_valores": self.peso_valores,
+        })
+
+    @classmethod
+    def carregar(cls, caminho: str):
+        v = mapear_npz(caminho)
+        return cls(
+            v["nomes"].tolist(), v["periodos"].tolist(), v["origens"], v["destinos"], v["pesos_iniciais"],
+            v["delta_offsets"], v["delta_arestas"], v["delta_entrou"],
+            v["peso_offsets"], v["peso_arestas"], v["peso_valores"]
+        )
+
+    def __repr__(self):
+        return f"ArmazemTemporal(periodos={self.periodos}, vertices={len(self.nomes)}, arestas={self.num_arestas})"
+
+def construir_armazem_temporal(rotas) -> ArmazemTemporal:
+
+    # Definição dos parâmetros:
+    #   rotas -> (período, origem, destino, peso) na ordem do dataset; em cada período fica a primeira
+    #            ocorrência de cada rota
+
+    ids = {}
+    arestas = {}
+    origens = []
+    destinos = []
+    pesos_iniciais = []
+
+    # período -> {aresta: peso}
+    por_periodo = {}
+
+    for periodo, origem, destino, peso in rotas:
+        rotas_periodo = por_periodo.setdefault(periodo, {})
+
+        chave = (origem, destino)
+        aresta = arestas.get(chave)
+        if aresta is None:
+            aresta = arestas[chave] = len(origens)
+            # o destino recebe id antes da origem, como em carregar_grafo_csr_parte2
+            destinos.append(ids.setdefault(destino, len(ids)))
+            origens.append(ids.setdefault(origem, len(ids)))
+            pesos_iniciais.append(peso)
+
+        rotas_periodo.setdefault(aresta, peso)
+
+    periodos = sorted(por_periodo)
+
+    delta_offsets = [0]
+    delta_arestas = []
+    delta_entrou = []
+    peso_offsets = [0]
+    peso_arestas = []
+    peso_valores = []
+
+    anteriores = set()
+    pesos_atuais = list(pesos_iniciais)
+
+    for periodo in periodos:
+        atuais = por_periodo[periodo]
+
+        entradas = sorted(set(atuais) - anteriores)
+        saidas = sorted(anteriores - set(atuais))
+        delta_arestas += entradas + saidas
+        delta_entrou += [True] * len(entradas) + [False] * len(saidas)
+        delta_offsets.append(len(delta_arestas))
+
+        for aresta in sorted(atuais):
+            if atuais[aresta] != pesos_atuais[aresta]:
+                pesos_atuais[aresta] = atuais[aresta]
+                peso_arestas.append(aresta)
+                peso_valores.append(atuais[aresta])
+        peso_offsets.append(len(peso_arestas))
+
+        anteriores = set(atuais)
+
+    return ArmazemTemporal(
+        list(ids.keys()), periodos, origens, destinos, pesos_iniciais,
+        delta_offsets, delta_arestas, delta_entrou, peso_offsets, peso_arestas, peso_valores
+    )
@@ -0,0 +1,149 @@
+import heapq
+import sys
+from collections import deque
+
+from graphs.algorithms import _dijkstra_csr
+from graphs.csr import GrafoCSR
+
+# K caminhos mínimos sem repetição de vértices (algoritmo de Yen).
+#
+# O primeiro caminho é o caminho mínimo. Cada caminho seguinte sai de um "desvio": para cada vértice
+# (spur) de um caminho já aceito, mantemos o trecho até ele (raiz), proibimos os vértices da raiz e as
+# arestas que os caminhos já aceitos usam logo depois dessa mesma raiz, e procuramos o melhor caminho
+# do spur até o destino. O melhor candidato ainda não aceito é o próximo caminho.
+#
+# As buscas de desvio são A* guiadas pela árvore de caminhos mínimos reversa (distância de cada vértice
+# até o destino no grafo sem proibições), calculada uma única vez: proibir vértices e arestas só aumenta
+# distâncias, então ela é uma heurística admissível e consistente para todas as buscas.
+# As proibições ficam em um bytearray e em um set de pares (sem copiar a estrutura do grafo).
+
+
+def k_caminhos_minimos(grafo, v_inicio, v_destino, k=None, arvores=None):
+
+    # Definição dos parâmetros:
+    #   grafo -> GrafoCSR (ou lista de adjacencia em dicionário, convertida para GrafoCSR)
+    #   v_inicio -> vértice de início dos caminhos
+    #   v_destino -> vértice de destino dos caminhos
+    #   k -> número máximo de caminhos (None: continua enquanto existirem caminhos)
+    #   arvores -> cache de árvores (graphs.cache.CacheArvores) opcional, de onde sai a árvore reversa
+    #
+    # Gerador: entrega (custo, caminho) em ordem crescente de custo, no mesmo formato de dijkstra_path,
+    # então quem chama pode parar assim que tiver caminhos suficientes.
+
+    if not isinstance(grafo, GrafoCSR):
+        grafo = GrafoCSR.de_lista_adjacencia(grafo)
+
+    if grafo.possui_peso_negativo:
+        raise ValueError("K caminhos mínimos exige pesos não negativos")
+
+    inicio = grafo.ids[v_inicio]
+    destino = grafo.ids[v_destino]
+
+    # distância de cada vértice até o destino e o próximo vértice no caminho mínimo até ele
+    if arvores is None:
+        ate_destino, proximo = _dijkstra_csr(grafo.reverso, destino)
+    else:
+        distancias, antecessor = arvores.arvore(grafo.reverso, v_destino)
+        ate_destino = [sys.maxsize if d == float("inf") else d for d in distancias.tolist()]
+        proximo = antecessor.tolist()
+
+    if ate_destino[inicio] == sys.maxsize or k == 0:
+        return
+
+    # primeiro caminho: basta seguir a árvore reversa a partir do início
+    caminho = [inicio]
+    while caminho[-1] != destino:
+        caminho.append(proximo[caminho[-1]])
+
+    # custo acumulado até cada posição do caminho (ao longo da árvore, o que falta até o destino diminui)
+    acumulado = [ate_destino[inicio] - ate_destino[v] for v in caminho]
+
+    aceitos = [(tuple(caminho), tuple(acumulado))]
+    candidatos = []
+    vistos = {tuple(caminho)}
+
+    yield acumulado[-1], _nomes(grafo, caminho)
+
+    proibidos = bytearray(grafo.num_vertices)
+
+    while k is None or len(aceitos) < k:
+        caminho, acumulado = aceitos[-1]
+
+        for i in range(len(caminho) - 1):
+            spur = caminho[i]
+            raiz = caminho[:i + 1]
+
+            # arestas que os caminhos aceitos com a mesma raiz usam a partir do spur
+            arestas_proibidas = {(p[i], p[i + 1]) for p, _ in aceitos if p[:i + 1] == raiz}
+
+            # os vértices da raiz (menos o spur) não podem aparecer de novo: o caminho não teria repetição
+            for v in raiz[:-1]:
+                proibidos[v] = 1
+
+            desvio = _busca_desvio(grafo, spur, destino, ate_destino, proibidos, arestas_proibidas)
+
+            for v in raiz[:-1]:
+                proibidos[v] = 0
+
+            if desvio is None:
+                continue
+
+            trecho, custos = desvio
+            novo = raiz[:-1] + trecho
+            if novo in vistos:
+                continue
+
+            vistos.add(novo)
+            novo_acumulado = acumulado[:i] + tuple(acumulado[i] + c for c in custos)
+            heapq.heappush(candidatos, (novo_acumulado[-1], novo, novo_acumulado))
+
+        if not candidatos:
+            return
+
+        custo, caminho, acumulado = heapq.heappop(candidatos)
+        aceitos.append((caminho, acumulado))
+
+        yield custo, _nomes(grafo, caminho)
+
+# A* do spur até o destino respeitando as proibições.
+# Retorna (vértices do trecho, custo acumulado em cada vértice) ou None se o destino ficou inalcançável
+def _busca_desvio(grafo, spur, destino, ate_destino, proibidos, arestas_proibidas):
+    offsets, alvos, pesos = grafo.vistas()
+
+    distancias = {spur: 0}
+    antecessor = {spur: spur}
+    fila = [(ate_destino[spur], 0, spur)]
+
+    while fila:
+        _, distancia, vertice = heapq.heappop(fila)
+
+        # entrada desatualizada
+        if distancia > distancias[vertice]:
+            continue
+
+        if vertice == destino:
+            trecho = [destino]
+            while trecho[-1] != spur:
+                trecho.append(antecessor[trecho[-1]])
+            trecho.reverse()
+            return tuple(trecho), tuple(distancias[v] for v in trecho)
+
+        for i in range(offsets[vertice], offsets[vertice + 1]):
+            v_adjacente = alvos[i]
+
+            # vértices que não chegam ao destino nem no grafo sem proibições
+            if proibidos[v_adjacente] or ate_destino[v_adjacente] == sys.maxsize:
+                continue
+            if (vertice, v_adjacente) in arestas_proibidas:
+                continue
+
+            nova_distancia = distancia + pesos[i]
+            if nova_distancia < distancias.get(v_adjacente, sys.maxsize):
+                distancias[v_adjacente] = nova_distancia
+                antecessor[v_adjacente] = vertice
+                heapq.heappush(fila, (nova_distancia + ate_destino[v_adjacente], nova_distancia, v_adjacente))
+
+    return None
+
+def _nomes(grafo, caminho):
+    return deque(grafo.nomes[v] for v in caminho)
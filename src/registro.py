@@ -0,0 +1,102 @@
+import os
+import threading
+
+import pandas as pd
+
+from graphs.cache import CacheArvores
+from graphs.ch import HierarquiaContracao, carregar_hierarquia
+from graphs.csr import GrafoCSR
+from graphs.graph import carregar_lista_adjacencia
+from graphs.io import carregar_lista_adjacencia_parte2
+
+# Registro central dos datasets usados por solve.py e viz.py.
+#
+# Cada dataset só é carregado na primeira vez que alguém pede por ele e, a partir daí,
+# a mesma instância é devolvida para todo o processo. Assim nenhum arquivo é lido ao
+# importar os módulos, e funções diferentes não reprocessam o mesmo CSV.
+#
+# As instâncias são compartilhadas: quem precisar modificar um grafo ou DataFrame deve copiá-lo antes.
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+caminho_bairros_unique = os.path.join(BASE_DIR, "../data/bairros_unique.csv")
+caminho_enderecos_csv = os.path.join(BASE_DIR, "../data/enderecos.csv")
+caminho_csvFiltrado = os.path.join(BASE_DIR, "../data/dataset_parte2/csvFiltrado.csv")
+caminho_hierarquia_voos = os.path.join(BASE_DIR, "../data/dataset_parte2/csvFiltrado.ch.npz")
+
+# nome do dataset -> função que carrega o dataset
+_carregadores = {
+    # grafos compactos (GrafoCSR), mapeados do snapshot binário
+    "grafo_bairros_csr": lambda: carregar_lista_adjacencia(compacto=True),
+    "grafo_voos_csr": lambda: carregar_lista_adjacencia_parte2(caminho_csvFiltrado, compacto=True),
+
+    # nomes antigos: o próprio grafo compacto, que já tem a interface de dicionário (somente leitura)
+    # e não pode ficar diferente de uma cópia convertida
+    "grafo_bairros": lambda: obter("grafo_bairros_csr"),
+    "grafo_voos": lambda: obter("grafo_voos_csr"),
+
+    # tabelas
+    "bairros_unique": lambda: pd.read_csv(caminho_bairros_unique),
+    "enderecos": lambda: pd.read_csv(caminho_enderecos_csv),
+
+    # árvores de caminhos mínimos dos grafos acima, compartilhadas pelas consultas do processo
+    "cache_arvores": lambda: CacheArvores(),
+
+    # Contraction Hierarchy do grafo de voos: pré-processada uma vez, salva ao lado do CSV
+    # e mapeada do disco pelos processos seguintes
+    "hierarquia_voos": lambda: carregar_hierarquia(obter("grafo_voos_csr"), caminho_hierarquia_voos),
+}
+
+# nome do dataset -> instância já carregada
+_instancias = {}
+
+# RLock: um carregador pode pedir outro dataset (ex.: grafo_bairros devolve o grafo_bairros_csr)
+_trava = threading.RLock()
+
+
+def obter(nome: str):
+    # caminho rápido, sem trava, quando o dataset já foi carregado
+    if nome in _instancias:
+        return _instancias[nome]
+
+    if nome not in _carregadores:
+        raise KeyError(f"Dataset desconhecido: {nome}")
+
+    with _trava:
+        # outra thread pode ter carregado enquanto esta esperava a trava
+        if nome not in _instancias:
+            _instancias[nome] = _carregadores[nome]()
+
+    return _instancias[nome]
+
+# Descarta as instâncias carregadas (todas, ou só a informada) para forçar uma nova leitura
+def limpar(nome: str | None = None) -> None:
+    with _trava:
+        if nome is None:
+            _instancias.clear()
+        else:
+            _instancias.pop(nome, None)
+
+def grafo_bairros() -> GrafoCSR:
+    return obter("grafo_bairros")
+
+def grafo_bairros_csr() -> GrafoCSR:
+    return obter("grafo_bairros_csr")
+
+def grafo_voos() -> GrafoCSR:
+    return obter("grafo_voos")
+
+def grafo_voos_csr() -> GrafoCSR:
+    return obter("grafo_voos_csr")
+
+def cache_arvores() -> CacheArvores:
+    return obter("cache_arvores")
+
+def hierarquia_voos() -> HierarquiaContracao:
+    return obter("hierarquia_voos")
+
+def df_bairros_unique() -> pd.DataFrame:
+    return obter("bairros_unique")
+
+def df_enderecos() -> pd.DataFrame:
+    return obter("enderecos")
@@ -3,8 +3,8 @@ import os
 import pandas as pd
 import matplotlib.pyplot as plt
 
-from graphs.graph import carregar_lista_adjacencia
-from graphs.io import carregar_lista_adjacencia_parte2
+import registro
+from graphs.csr import GrafoCSR
 from solve import gerar_csv_graus, ego_network_metricas, calcular_peso_caminho_enderecos
 
 from pyvis.network import Network
@@ -21,10 +21,6 @@ caminho_graus_csv = os.path.join(BASE_DIR, "../out/graus.csv")
 
 caminho_csvFiltrado = os.path.join(BASE_DIR, "../data/dataset_parte2/csvFiltrado.csv")
 
-gerar_csv_graus()
-ego_network_metricas()
-calcular_peso_caminho_enderecos()
-
 def string_to_list(string):
     return string.strip().split(" -> ")
 
@@ -47,7 +43,12 @@ def plot_percurso_nova_descoberta_setubal():
     net.write_html(arvore_percurso_html)
 
 # Função para criar um mapa de cores baseado no grau dos bairros
-def mapa_de_cores_por_grau(lista_adjacencia = carregar_lista_adjacencia(), graus = pd.read_csv(caminho_graus_csv)):
+def mapa_de_cores_por_grau(lista_adjacencia = None, graus = None):
+    if lista_adjacencia is None:
+        lista_adjacencia = registro.grafo_bairros()
+    if graus is None:
+        graus = pd.read_csv(caminho_graus_csv)
+
     net = Network(height="750px", width="100%", notebook=False)
 
     min_grau = graus["grau"].min()
@@ -72,8 +73,15 @@ def mapa_de_cores_por_grau(lista_adjacencia = carregar_lista_adjacencia(), graus
     net.write_html(mapa_cores_graus_html)
 
 # Função para gerar um gráfico de ranking de microrregiões por densidade ego
-def ranking_densidade_ego_por_microrregiao(df_ego_bairro = pd.read_csv(ego_bairros_csv), bairros_microrregiao_csv = bairros_microrregiao_csv):
-    bairros_microrregiao = pd.read_csv(bairros_microrregiao_csv)
+def ranking_densidade_ego_por_microrregiao(df_ego_bairro = None, bairros_microrregiao_csv = None):
+    if df_ego_bairro is None:
+        df_ego_bairro = pd.read_csv(ego_bairros_csv)
+
+    # sem caminho informado usa o dataset do registro (copiado, pois a coluna de microrregião é modificada abaixo)
+    if bairros_microrregiao_csv is None:
+        bairros_microrregiao = registro.df_bairros_unique().copy()
+    else:
+        bairros_microrregiao = pd.read_csv(bairros_microrregiao_csv)
 
     # Remover espaços em branco dos nomes dos bairros e microrregiões
     bairros_microrregiao["microrregiao"] = (
@@ -103,7 +111,11 @@ def ranking_densidade_ego_por_microrregiao(df_ego_bairro = pd.read_csv(ego_bairr
     plt.savefig(os.path.join(BASE_DIR, "../out/ranking_densidade_ego_por_microrregiao.png"))
     plt.close()
 
-def histograma_graus(lista_graus = pd.read_csv(caminho_graus_csv)):
+def histograma_graus(lista_graus = None):
+    if lista_graus is None:
+        # graus calculados (e guardados) no grafo compacto dos bairros, sem reler o graus.csv
+        lista_graus = {"grau": registro.grafo_bairros_csr().graus.saida}
+
     # Histograma
     plt.hist(lista_graus["grau"])
     plt.xlabel("Grau")
@@ -114,13 +126,22 @@ def histograma_graus(lista_graus = pd.read_csv(caminho_graus_csv)):
 
 # Função principal para visualizar o grafo interativo
 def visualizar_grafo(
-    lista_adjacencia = carregar_lista_adjacencia(),
-    graus = pd.read_csv(caminho_graus_csv),
-    ego_df = pd.read_csv(ego_bairros_csv),
-    micro_df = pd.read_csv(bairros_microrregiao_csv),
+    lista_adjacencia = None,
+    graus = None,
+    ego_df = None,
+    micro_df = None,
 
     output_html="out/grafo_interativo.html",
 ):
+    if lista_adjacencia is None:
+        lista_adjacencia = registro.grafo_bairros()
+    if graus is None:
+        graus = pd.read_csv(caminho_graus_csv)
+    if ego_df is None:
+        ego_df = pd.read_csv(ego_bairros_csv)
+    if micro_df is None:
+        micro_df = registro.df_bairros_unique()
+
     net = Network(height="850px", width="100%", notebook=False, directed=False)
     net.force_atlas_2based()
 
@@ -165,7 +186,7 @@ def visualizar_grafo(
     script = f"""
         <script>
 
-        const adj = {json.dumps(lista_adjacencia)};
+        const adj = {json.dumps(dict(lista_adjacencia.items()))};
 
         function dijkstra(graph, start, end) {{
             let distances = {{}};
@@ -360,9 +381,12 @@ def visualizar_grafo(
     print(f"Grafo salvo em {output_html}")
 
 def visualizar_digrafo(
-    lista_adjacencia=carregar_lista_adjacencia_parte2(),
+    lista_adjacencia=None,
     output_html="out/digrafo_interativo.html",
 ):
+    if lista_adjacencia is None:
+        lista_adjacencia = registro.grafo_voos()
+
     # converte
     vertices = list(lista_adjacencia.keys())
     arestas = []
@@ -530,11 +554,12 @@ def gerar_grafico_distribuicao_graus(lista_adj):
 
     print("Gerando grafico de distribuição de graus.")
 
-    # Para cada vizinho na lista de adjacencia, aumenta o grau de saida
+    # graus de saída de todos os aeroportos em uma passada (graphs.graus)
+    grafo = lista_adj
+    if not isinstance(grafo, GrafoCSR):
+        grafo = GrafoCSR.de_lista_adjacencia(lista_adj)
 
-    graus_saida = []
-    for vizinhos in lista_adj.values():
-        graus_saida.append(len(vizinhos))
+    graus_saida = grafo.graus.saida
     
     plt.figure(figsize=(10, 6))
     
@@ -552,8 +577,15 @@ def gerar_grafico_distribuicao_graus(lista_adj):
     print(f"Visualização salva em: {caminho_img}")
     plt.close()
 
-def main_viz():
-    lista_adj = carregar_lista_adjacencia_parte2(caminho_csvFiltrado)
+# gerar_entradas=False quando os arquivos de /out usados aqui (graus, ego e percurso)
+# acabaram de ser gerados pelo solve.py no mesmo processo
+def main_viz(gerar_entradas=True):
+    if gerar_entradas:
+        gerar_csv_graus()
+        ego_network_metricas()
+        calcular_peso_caminho_enderecos()
+
+    lista_adj = registro.grafo_voos()
 
     plot_percurso_nova_descoberta_setubal()
     mapa_de_cores_por_grau()
@@ -0,0 +1,54 @@
+import sys
+import os
+# Ajuste de path para importar da pasta src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from graphs.alcance import construir_indice_alcance, carregar_indice_alcance
+from graphs.algorithms import bfs
+from graphs.csr import GrafoCSR
+
+# Ciclo {A, B} que leva a C, C leva a D, e E isolado
+GRAFO = {
+    "A": [("B", 1)],
+    "B": [("A", 1), ("C", 1)],
+    "C": [("D", 1)],
+    "D": [],
+    "E": []
+}
+
+def test_consultas_de_alcance():
+    indice = construir_indice_alcance(GrafoCSR.de_lista_adjacencia(GRAFO))
+
+    assert indice.alcanca("A", "D")
+    assert indice.alcanca("B", "A")
+    assert not indice.alcanca("D", "A")
+    assert not indice.alcanca("A", "E")
+
+    assert indice.alcancaveis_de("B") == ["A", "B", "C", "D"]
+    assert indice.que_alcancam("C") == ["A", "B", "C"]
+    assert indice.que_alcancam("E") == ["E"]
+
+    # o mesmo conjunto de vértices que a BFS visita
+    for vertice in GRAFO:
+        assert set(indice.alcancaveis_de(vertice)) == set(bfs(GRAFO, vertice))
+
+def test_mais_de_uma_palavra():
+    # caminho com 130 componentes: os bitsets ocupam 3 palavras de 64 bits
+    lista = {i: [(i + 1, 1)] for i in range(129)}
+    lista[129] = []
+    indice = construir_indice_alcance(GrafoCSR.de_lista_adjacencia(lista))
+
+    assert indice.bits.shape == (130, 3)
+    assert indice.alcancaveis_de(70) == list(range(70, 130))
+    assert indice.que_alcancam(70) == list(range(71))
+
+def test_indice_salvo_e_reaproveitado(tmp_path):
+    grafo = GrafoCSR.de_lista_adjacencia(GRAFO)
+    caminho = str(tmp_path / "alcance.npz")
+
+    carregar_indice_alcance(grafo, caminho)
+    indice = carregar_indice_alcance(grafo, caminho)
+
+    # a segunda leitura vem do arquivo mapeado em memória
+    assert hasattr(indice.bits, "filename")
+    assert indice.alcancaveis_de("A") == ["A", "B", "C", "D"]
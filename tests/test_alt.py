@@ -0,0 +1,69 @@
+import sys
+import os
+# Arrumando o caminho pra conseguir importar os algoritmos da pasta src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from graphs.alt import construir_tabelas_landmarks, carregar_tabelas_landmarks, dijkstra_alt
+from graphs.algorithms import dijkstra_path
+from graphs.csr import GrafoCSR
+
+# Uma "linha" de 6 vértices com ida e volta, mais um atalho caro de A até F
+GRAFO = {
+    "A": [("B", 1), ("F", 10)],
+    "B": [("A", 1), ("C", 1)],
+    "C": [("B", 1), ("D", 1)],
+    "D": [("C", 1), ("E", 1)],
+    "E": [("D", 1), ("F", 1)],
+    "F": [("E", 1)]
+}
+
+def test_alt_mesmo_custo_que_dijkstra():
+    csr = GrafoCSR.de_lista_adjacencia(GRAFO)
+    tabelas = construir_tabelas_landmarks(csr, k=2)
+
+    # Para todos os pares o custo tem que bater com o Dijkstra
+    for origem in GRAFO:
+        for destino in GRAFO:
+            assert dijkstra_alt(csr, origem, destino, tabelas)[0] == dijkstra_path(GRAFO, origem, destino)[0]
+
+def test_alt_assenta_menos_vertices():
+    csr = GrafoCSR.de_lista_adjacencia(GRAFO)
+    tabelas = construir_tabelas_landmarks(csr, k=2)
+
+    com_landmarks = {}
+    sem_landmarks = {}
+    dijkstra_alt(csr, "C", "A", tabelas, com_landmarks)
+    dijkstra_alt(csr, "C", "A", None, sem_landmarks)
+
+    # Com a heurística a busca não deveria se espalhar para o lado de D, E e F
+    assert com_landmarks["assentados"] < sem_landmarks["assentados"]
+
+def test_tabelas_salvas_por_versao(tmp_path):
+    csr = GrafoCSR.de_lista_adjacencia(GRAFO)
+    caminho = str(tmp_path / "landmarks.npz")
+
+    tabelas = carregar_tabelas_landmarks(csr, caminho, k=2)
+    assert os.path.exists(caminho)
+
+    # Mesma versão do grafo: as tabelas vêm do disco
+    relidas = carregar_tabelas_landmarks(csr, caminho, k=2)
+    assert relidas["versao"] == tabelas["versao"]
+    assert (relidas["de"] == tabelas["de"]).all()
+
+def test_tabelas_salvas_com_menos_landmarks_que_k(tmp_path):
+    # só A e B têm arestas de entrada e de saída: a escolha "distante" para em 2 landmarks
+    csr = GrafoCSR.de_lista_adjacencia({"A": [("B", 1)], "B": [("A", 1), ("C", 1)], "C": [], "D": [("A", 1)]})
+    caminho = str(tmp_path / "landmarks.npz")
+
+    tabelas = carregar_tabelas_landmarks(csr, caminho, k=4)
+    assert len(tabelas["landmarks"]) == 2
+    gravado = os.stat(caminho).st_mtime_ns
+
+    # mesmo k e mesma estratégia: vem do disco, sem reescrever o arquivo
+    relidas = carregar_tabelas_landmarks(csr, caminho, k=4)
+    assert os.stat(caminho).st_mtime_ns == gravado
+    assert relidas["k"] == 4 and relidas["estrategia"] == "distante"
+
+    # outra estratégia: reconstrói
+    assert carregar_tabelas_landmarks(csr, caminho, k=4, estrategia="grau")["estrategia"] == "grau"
+    assert len(carregar_tabelas_landmarks(csr, caminho, k=4, estrategia="grau")["landmarks"]) == 4
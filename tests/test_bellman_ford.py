@@ -3,7 +3,7 @@ import os
 # Ajuste de path para importar da pasta src
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
-from graphs.algorithms import bellman_ford
+from graphs.algorithms import bellman_ford, bellman_ford_fila, bellman_ford_vetorizado
 
 def test_bf_com_pesos_negativos():
     # Pesos negativos (sem ciclo)
@@ -36,4 +36,69 @@ def test_bf_ciclo_negativo():
     resultado = bellman_ford(nos, conexoes, "A")
     
     # O algoritmo deve perceber o ciclo e retornar a flag de erro (-1)
-    assert resultado == -1
\ No newline at end of file
+    assert resultado == -1
+
+
+def test_bf_fila_mesmo_resultado():
+    # O SPFA tem que chegar nas mesmas distâncias do Bellman-Ford clássico
+    # (D não é alcançável e continua com sys.maxsize)
+
+    lista_vertices = ["A", "B", "C", "D"]
+    lista_arestas = [
+        ("A", "B", 4),
+        ("A", "C", 2),
+        ("C", "B", -1),
+        ("B", "C", 3)
+    ]
+
+    esperado = bellman_ford(lista_vertices, lista_arestas, "A")
+    assert bellman_ford_fila(lista_vertices, lista_arestas, "A") == esperado
+    assert esperado["B"] == 1
+    assert esperado["D"] == sys.maxsize
+
+def test_bf_fila_extrai_ciclo_negativo():
+    # Ciclo B -> C -> D -> B com custo 1 - 4 + 2 = -1, alcançável a partir de A
+
+    nos = ["A", "B", "C", "D"]
+    conexoes = [
+        ("A", "B", 1),
+        ("B", "C", 1),
+        ("C", "D", -4),
+        ("D", "B", 2)
+    ]
+
+    assert bellman_ford_fila(nos, conexoes, "A") == -1
+
+    ciclo = bellman_ford_fila(nos, conexoes, "A", retornar_ciclo=True)
+
+    # o ciclo começa e termina no mesmo vértice e segue as arestas do grafo
+    assert ciclo[0] == ciclo[-1]
+    assert sorted(ciclo[:-1]) == ["B", "C", "D"]
+    pesos = {(o, d): p for o, d, p in conexoes}
+    assert sum(pesos[(ciclo[i], ciclo[i + 1])] for i in range(len(ciclo) - 1)) < 0
+
+def test_bf_vetorizado_mesmo_resultado():
+    # A versão vetorizada tem que devolver o mesmo dicionário do Bellman-Ford clássico
+
+    lista_vertices = ["A", "B", "C", "D"]
+    lista_arestas = [
+        ("A", "B", 4),
+        ("A", "C", 2),
+        ("C", "B", -1),
+        ("B", "C", 3)
+    ]
+
+    assert bellman_ford_vetorizado(lista_vertices, lista_arestas, "A") == bellman_ford(lista_vertices, lista_arestas, "A")
+
+    # no formato de vetor, inalcançável vira np.inf
+    vetor = bellman_ford_vetorizado(lista_vertices, lista_arestas, "A", retornar_vetor=True)
+    assert vetor.tolist() == [0, 1, 2, float("inf")]
+
+def test_bf_vetorizado_ciclo_negativo():
+    nos = ["A", "B"]
+    conexoes = [
+        ("A", "B", 1),
+        ("B", "A", -5)
+    ]
+
+    assert bellman_ford_vetorizado(nos, conexoes, "A") == -1
@@ -3,7 +3,7 @@ import os
 # Arrumando o caminho pra conseguir importar os algoritmos da pasta src
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
-from graphs.algorithms import bfs
+from graphs.algorithms import bfs, bfs_niveis
 
 def test_bfs_basico():
     # Montando um grafo simples pra testar se o BFS respeita os níveis
@@ -28,4 +28,35 @@ def test_bfs_basico():
     assert "C" in vizinhos
     
     # Verifica se o tamanho tá certo (não pode ter visitado nenhum a mais)
-    assert len(ordem_visitada) == 3
\ No newline at end of file
+    assert len(ordem_visitada) == 3
+
+
+def test_bfs_niveis_distancias_e_pais():
+    # A -> B -> D e A -> C -> D: D está a 2 arestas de A e o pai dele é B (visitado primeiro)
+    grafo = {
+        "A": [("B", 1), ("C", 1)],
+        "B": [("D", 1)],
+        "C": [("D", 1)],
+        "D": [],
+        "E": [("A", 1)]
+    }
+
+    resultado = bfs_niveis(grafo, "A")
+    ids = {nome: i for i, nome in enumerate(resultado["nomes"])}
+
+    assert resultado["ordem"] == bfs(grafo, "A")
+    assert [resultado["distancias"][ids[v]] for v in "ABCDE"] == [0, 1, 1, 2, -1]
+    assert resultado["pais"][ids["D"]] == ids["B"]
+    assert resultado["pais"][ids["A"]] == -1
+
+def test_bfs_niveis_bottom_up():
+    # Estrela: o hub alcança todos os vértices em um nível, e com alfa alto a busca troca para bottom-up
+    grafo = {"hub": [(i, 1) for i in range(50)]}
+    for i in range(50):
+        grafo[i] = [("hub", 1), ((i + 1) % 50, 1)]
+
+    resultado = bfs_niveis(grafo, 0, alfa=1000)
+
+    assert "bottom-up" in resultado["direcoes"]
+    assert sorted(resultado["ordem"], key=str) == sorted(bfs(grafo, 0), key=str)
+    assert resultado["distancias"].max() == 2
@@ -0,0 +1,73 @@
+import sys
+import os
+# Arrumando o caminho pra conseguir importar os algoritmos da pasta src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from graphs.cache import CacheArvores
+from graphs.algorithms import dijkstra, dijkstra_path
+from graphs.csr import GrafoCSR
+from graphs.yen import k_caminhos_minimos
+
+GRAFO = {
+    "A": [("B", 10), ("C", 1)],
+    "B": [("D", 1)],
+    "C": [("B", 1)],
+    "D": []
+}
+
+def test_cache_acerta_mesma_origem():
+    cache = CacheArvores()
+    csr = GrafoCSR.de_lista_adjacencia(GRAFO)
+
+    # A primeira consulta calcula a árvore, as outras da mesma origem só reconstroem o caminho
+    assert cache.dijkstra_path(csr, "A", "D") == dijkstra_path(GRAFO, "A", "D")
+    assert cache.dijkstra_path(csr, "A", "B") == dijkstra_path(GRAFO, "A", "B")
+    assert cache.dijkstra(csr, "A") == dijkstra(GRAFO, "A")
+
+    # D não alcança ninguém
+    assert cache.dijkstra_path(csr, "D", "A")[1] == -1
+
+    estatisticas = cache.estatisticas()
+    assert estatisticas["falhas"] == 2
+    assert estatisticas["acertos"] == 2
+
+def test_cache_remove_menos_usada():
+    csr = GrafoCSR.de_lista_adjacencia(GRAFO)
+
+    # Cada árvore ocupa 4 * (8 + 4) = 48 bytes: cabem só duas
+    cache = CacheArvores(memoria_max_bytes=100)
+    cache.arvore(csr, "A")
+    cache.arvore(csr, "B")
+    cache.arvore(csr, "A")
+    cache.arvore(csr, "C")
+
+    # B era a menos usada e saiu
+    assert cache.estatisticas()["remocoes"] == 1
+    cache.arvore(csr, "A")
+    assert cache.estatisticas()["acertos"] == 2
+    cache.arvore(csr, "B")
+    assert cache.estatisticas()["falhas"] == 4
+
+def test_cache_separa_versoes_do_grafo():
+    cache = CacheArvores()
+    cache.dijkstra_path(GrafoCSR.de_lista_adjacencia(GRAFO), "A", "D")
+
+    # Mesmo vértice de origem, mas grafo diferente: não pode reaproveitar a árvore antiga
+    alterado = dict(GRAFO, A=[("D", 1)])
+    custo, caminho = cache.dijkstra_path(GrafoCSR.de_lista_adjacencia(alterado), "A", "D")
+
+    assert custo == 1
+    assert list(caminho) == ["A", "D"]
+    assert cache.estatisticas()["acertos"] == 0
+
+def test_yen_usa_a_arvore_reversa_do_cache():
+    cache = CacheArvores()
+    csr = GrafoCSR.de_lista_adjacencia(GRAFO)
+
+    esperado = list(k_caminhos_minimos(csr, "A", "D", k=2))
+    assert list(k_caminhos_minimos(csr, "A", "D", k=2, arvores=cache)) == esperado
+    assert list(k_caminhos_minimos(csr, "C", "D", k=2, arvores=cache)) == list(k_caminhos_minimos(csr, "C", "D", k=2))
+
+    # o mesmo destino reaproveita a árvore do grafo reverso
+    assert cache.estatisticas()["falhas"] == 1
+    assert cache.estatisticas()["acertos"] == 1
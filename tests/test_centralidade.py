@@ -0,0 +1,76 @@
+import sys
+import os
+# Ajuste de path para importar da pasta src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from graphs.centralidade import autovetor, intermediacao, pagerank, proximidade
+from graphs.csr import GrafoCSR
+
+def test_intermediacao_caminho_nao_direcionado():
+    # A - B - C - D: B fica entre A e C, A e D (2 pares); C entre A e D, B e D
+    lista = {v: [] for v in "ABCD"}
+    for u, v in ("AB", "BC", "CD"):
+        lista[u].append((v, 1))
+        lista[v].append((u, 1))
+
+    resultado = intermediacao(GrafoCSR.de_lista_adjacencia(lista, dirigido=False), ponderado=False, processos=1)
+
+    assert resultado == {"A": 0, "B": 2, "C": 2, "D": 0}
+
+def test_intermediacao_ponderada_divide_caminhos_empatados():
+    # A -> B -> D e A -> C -> D custam 2; A -> D direto custa 5 e não é mínimo
+    lista = {
+        "A": [("B", 1), ("C", 1), ("D", 5)],
+        "B": [("D", 1)],
+        "C": [("D", 1)],
+        "D": []
+    }
+
+    ponderada = intermediacao(lista, ponderado=True, processos=1)
+    saltos = intermediacao(lista, ponderado=False, processos=1)
+
+    # os dois caminhos mínimos dividem o par (A, D)
+    assert ponderada["B"] == ponderada["C"] == 0.5
+    # contando arestas, A -> D direto é o único caminho mínimo
+    assert saltos["B"] == saltos["C"] == 0
+
+def test_intermediacao_em_processos_igual_serial():
+    lista = {i: [((i + 1) % 12, 1 + i % 3), ((i * 5) % 12, 2)] for i in range(12)}
+    grafo = GrafoCSR.de_lista_adjacencia(lista)
+
+    serial = intermediacao(grafo, processos=1)
+    paralela = intermediacao(grafo, processos=2, tamanho_lote=3)
+
+    for vertice in serial:
+        assert abs(serial[vertice] - paralela[vertice]) < 1e-9
+
+def test_pagerank_soma_um_com_vertice_sem_saida():
+    # C não tem arestas de saída (dangling): a pontuação dele é redistribuída e o total continua 1
+    lista = {"A": [("B", 1)], "B": [("C", 1)], "C": []}
+
+    resultado = pagerank(lista)
+
+    assert abs(sum(resultado.values()) - 1) < 1e-9
+    assert resultado["C"] > resultado["B"] > resultado["A"]
+
+def test_autovetor_estrela():
+    # Estrela não-direcionada: o centro tem a maior centralidade e as pontas são iguais
+    lista = {"centro": [(i, 1) for i in range(4)]}
+    for i in range(4):
+        lista[i] = [("centro", 1)]
+
+    resultado = autovetor(GrafoCSR.de_lista_adjacencia(lista, dirigido=False))
+
+    assert resultado["centro"] > resultado[0]
+    assert max(resultado[i] for i in range(4)) - min(resultado[i] for i in range(4)) < 1e-9
+
+def test_proximidade_e_harmonica():
+    # A -> B -> C: só A e B chegam em C, a distâncias 2 e 1
+    lista = {"A": [("B", 1)], "B": [("C", 1)], "C": []}
+
+    resultado = proximidade(lista, ponderado=False)
+
+    assert resultado["A"] == {"proximidade": 0.0, "harmonica": 0.0}
+    assert resultado["C"]["harmonica"] == 1.5
+    # (r - 1) / soma * (r - 1) / (n - 1) = 2/3 * 2/2
+    assert abs(resultado["C"]["proximidade"] - 2 / 3) < 1e-12
@@ -0,0 +1,57 @@
+import sys
+import os
+# Arrumando o caminho pra conseguir importar os algoritmos da pasta src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from graphs.ch import construir_hierarquia, carregar_hierarquia, HierarquiaContracao
+from graphs.algorithms import dijkstra_path
+from graphs.csr import GrafoCSR
+
+# Digrafo pequeno com caminho mais barato passando por vários vértices
+GRAFO = {
+    "A": [("B", 1), ("E", 10)],
+    "B": [("C", 1)],
+    "C": [("D", 1), ("A", 4)],
+    "D": [("E", 1)],
+    "E": [("B", 2)],
+    "F": []
+}
+
+def test_ch_mesmo_resultado_que_dijkstra():
+    hierarquia = construir_hierarquia(GrafoCSR.de_lista_adjacencia(GRAFO))
+
+    for origem in GRAFO:
+        for destino in GRAFO:
+            custo_ch, caminho_ch = hierarquia.consultar(origem, destino)
+            custo_dij, caminho_dij = dijkstra_path(GRAFO, origem, destino)
+
+            assert custo_ch == custo_dij
+            # sem caminho os dois retornam -1
+            if caminho_dij == -1:
+                assert caminho_ch == -1
+
+    # Os atalhos têm que ser desempacotados no caminho original
+    custo, caminho = hierarquia.consultar("A", "E")
+    assert custo == 4
+    assert " -> ".join(caminho) == "A -> B -> C -> D -> E"
+
+def test_ch_salva_e_carrega(tmp_path):
+    hierarquia = construir_hierarquia(GrafoCSR.de_lista_adjacencia(GRAFO))
+    caminho = str(tmp_path / "ch.npz")
+    hierarquia.salvar(caminho)
+
+    carregada = HierarquiaContracao.carregar(caminho)
+    assert carregada.versao == hierarquia.versao
+    assert carregada.consultar("C", "B") == hierarquia.consultar("C", "B")
+
+def test_carregar_hierarquia_reaproveita_o_indice(tmp_path):
+    grafo = GrafoCSR.de_lista_adjacencia(GRAFO)
+    caminho = str(tmp_path / "ch.npz")
+
+    # a primeira chamada constrói e salva; a segunda lê o arquivo, com o mesmo tempo de construção
+    construida = carregar_hierarquia(grafo, caminho)
+    carregada = carregar_hierarquia(grafo, caminho)
+    assert os.path.exists(caminho)
+    assert carregada is not construida
+    assert carregada.segundos_construcao == construida.segundos_construcao
+    assert carregada.consultar("A", "E") == construida.consultar("A", "E")
@@ -0,0 +1,69 @@
+import sys
+import os
+# Arrumando o caminho pra conseguir importar os algoritmos da pasta src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from graphs.csr import GrafoCSR, compacto
+from graphs.algorithms import dijkstra, dijkstra_bidirecional, dijkstra_path, bfs, bellman_ford
+
+def test_csr_ida_e_volta():
+    # O grafo compacto tem que guardar exatamente a mesma lista de adjacência
+    # D só aparece como destino, mas também precisa virar vértice
+    grafo = {
+        "A": [("B", 1.0), ("C", 4.0)],
+        "B": [("C", 2.0), ("D", 7.0)],
+        "C": []
+    }
+
+    csr = GrafoCSR.de_lista_adjacencia(grafo)
+
+    assert csr.num_vertices == 4
+    assert csr.num_arestas == 4
+    assert csr["A"] == [("B", 1.0), ("C", 4.0)]
+    assert csr["D"] == []
+    assert list(csr.keys()) == ["A", "B", "C", "D"]
+
+    # Índice reverso: quem chega em C
+    assert csr.reverso["C"] == [("A", 4.0), ("B", 2.0)]
+
+def test_algoritmos_aceitam_csr():
+    # Os algoritmos têm que dar o mesmo resultado com o dicionário e com o grafo compacto
+    grafo = {
+        "A": [("B", 10), ("C", 1)],
+        "B": [("D", 1)],
+        "C": [("B", 1)],
+        "D": []
+    }
+    csr = GrafoCSR.de_lista_adjacencia(grafo)
+
+    assert dijkstra(csr, "A") == dijkstra(grafo, "A")
+    assert bfs(csr, "A") == bfs(grafo, "A")
+
+    custo, rota = dijkstra_path(csr, "A", "D")
+    assert custo == 3
+    assert list(rota) == ["A", "C", "B", "D"]
+
+    # Bellman-Ford lê as arestas direto do grafo compacto
+    assert bellman_ford(csr, None, "A")["D"] == 3
+
+def test_compacto_devolve_o_proprio_grafo():
+    csr = GrafoCSR.de_lista_adjacencia({"A": [("B", 2.0)], "B": [("C", 3.0)], "C": []})
+    lista = csr.para_lista_adjacencia()
+
+    # o grafo compacto não é copiado; a lista em dicionário é convertida
+    assert compacto(csr) is csr
+    assert compacto(lista) is not csr
+    assert compacto(lista).para_lista_adjacencia() == lista
+    assert compacto(lista, converter=False) is None
+
+    custo, rota = dijkstra_path(csr, "A", "C")
+    assert custo == 5 and list(rota) == ["A", "B", "C"]
+    assert dijkstra_bidirecional(lista, "A", "C")[0] == 5
+
+def test_origens_calculadas_uma_vez():
+    csr = GrafoCSR.de_lista_adjacencia({"A": [("B", 1.0), ("C", 4.0)], "B": [("C", 2.0)], "C": []})
+
+    # o mesmo vetor é devolvido nas chamadas seguintes e não pode ser alterado por quem o recebe
+    assert csr.origens().tolist() == [0, 0, 1]
+    assert csr.origens() is csr.origens()
+    assert not csr.origens().flags.writeable
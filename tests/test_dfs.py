@@ -3,7 +3,7 @@ import os
 # Arrumando o caminho pra conseguir importar os algoritmos da pasta src
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
-from graphs.algorithms import dfs
+from graphs.algorithms import dfs, dfs_classificada, TIPOS_ARESTA
 
 def test_dfs_classificacao_arestas():
     # Testa o caminho básico de arestas de arvore
@@ -34,4 +34,52 @@ def test_dfs_deteccao_ciclo():
     # 2. Tem que visitar os dois nós (A e B) e parar quando achar o ciclo
     assert len(visitados) == 2
     assert "A" in visitados
-    assert "B" in visitados
\ No newline at end of file
+    assert "B" in visitados
+
+
+def test_dfs_classificada_tipos_e_tempos():
+    # A -> B -> C, C -> A (retorno), A -> C (avanço), A -> D -> B (cruzamento)
+    grafo = {
+        "A": [("B", 1), ("C", 1), ("D", 1)],
+        "B": [("C", 1)],
+        "C": [("A", 1)],
+        "D": [("B", 1)]
+    }
+
+    chamadas = []
+    resultado = dfs_classificada(grafo, "A", ao_classificar=lambda o, d, t: chamadas.append((o, d, t)))
+
+    assert resultado["ordem"] == ["A", "B", "C", "D"]
+    assert chamadas == [
+        ("A", "B", "arvore"),
+        ("B", "C", "arvore"),
+        ("C", "A", "retorno"),
+        ("A", "C", "avanco"),
+        ("A", "D", "arvore"),
+        ("D", "B", "cruzamento"),
+    ]
+
+    # os vetores compactos trazem a mesma classificação, por id
+    nomes = resultado["nomes"]
+    classificacao = [
+        (nomes[o], nomes[d], TIPOS_ARESTA[t])
+        for o, d, t in zip(resultado["origens"], resultado["destinos"], resultado["tipos"])
+    ]
+    assert classificacao == chamadas
+
+    # A é descoberto primeiro e termina por último
+    ids = {nome: i for i, nome in enumerate(nomes)}
+    assert resultado["descoberta"][ids["A"]] == 0
+    assert resultado["termino"][ids["A"]] == 2 * len(grafo) - 1
+    assert resultado["descoberta"][ids["C"]] < resultado["termino"][ids["C"]] < resultado["termino"][ids["B"]]
+
+def test_dfs_caminho_longo_sem_recursao(capsys):
+    # Um caminho bem maior que o limite de recursão do Python, e nada pode ser impresso
+    n = sys.getrecursionlimit() * 5
+    grafo = {i: [(i + 1, 1)] for i in range(n)}
+    grafo[n] = []
+
+    resultado = dfs(grafo, 0)
+
+    assert resultado == list(range(n + 1))
+    assert capsys.readouterr().out == ""
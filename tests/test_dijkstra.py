@@ -3,7 +3,8 @@ import os
 # Arrumando o path para importar corretamente da pasta src
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
-from graphs.algorithms import dijkstra_path
+from graphs.algorithms import dijkstra_path, dijkstra_bidirecional, dijkstra_lote
+from graphs.csr import GrafoCSR
 
 def test_dijkstra_caminho_correto():
     # Teste de lógica: Caminho mais curto vs Caminho direto
@@ -34,4 +35,46 @@ def test_dijkstra_rejeita_pesos_negativos():
     resultado = dijkstra_path(grafo_invalido, "A", "B")
     
     # Tem que retornar o código de erro -1
-    assert resultado == -1
\ No newline at end of file
+    assert resultado == -1
+
+def test_dijkstra_bidirecional_mesmo_custo():
+    # A busca bidirecional tem que achar o mesmo custo do Dijkstra comum
+    # A -> B -> D custa 2 + 2 = 4, A -> C -> D custa 1 + 5 = 6
+    grafo = {
+        "A": [("B", 2), ("C", 1)],
+        "B": [("D", 2)],
+        "C": [("D", 5)],
+        "D": [("E", 1)],
+        "E": []
+    }
+    csr = GrafoCSR.de_lista_adjacencia(grafo)
+
+    custo, rota = dijkstra_bidirecional(csr, "A", "E")
+    assert custo == 5
+    assert list(rota) == ["A", "B", "D", "E"]
+
+    # dijkstra_path usa a busca bidirecional no grafo compacto
+    assert dijkstra_path(csr, "A", "E")[0] == dijkstra_path(grafo, "A", "E")[0]
+
+    # Sem caminho: E não tem arestas de saída
+    assert dijkstra_bidirecional(csr, "E", "A")[1] == -1
+
+def test_dijkstra_lote_na_ordem_dos_pares():
+    # Vários pares com origens repetidas: cada resultado tem que bater com o dijkstra_path do par
+    grafo = {
+        "A": [("B", 2), ("C", 1)],
+        "B": [("D", 2)],
+        "C": [("D", 5)],
+        "D": [],
+        "E": [("A", 1)]
+    }
+    pares = [("A", "D"), ("E", "B"), ("A", "C"), ("D", "A"), ("A", "D")]
+
+    resultados = dijkstra_lote(grafo, pares)
+
+    assert len(resultados) == len(pares)
+    for (origem, destino), (custo, caminho) in zip(pares, resultados):
+        custo_esperado, caminho_esperado = dijkstra_path(grafo, origem, destino)
+        assert custo == custo_esperado
+        assert caminho == caminho_esperado
+
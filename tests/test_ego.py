@@ -0,0 +1,61 @@
+import sys
+import os
+import random
+# Ajuste de path para importar da pasta src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from graphs.csr import GrafoCSR
+from graphs.ego import metricas_ego
+
+# Triângulo A-B-C com D pendurado em C (não-direcionado, arestas nas duas listas)
+GRAFO = {
+    "A": [("B", 1), ("C", 1)],
+    "B": [("A", 1), ("C", 1)],
+    "C": [("A", 1), ("B", 1), ("D", 1)],
+    "D": [("C", 1)]
+}
+
+# Ego network pelo método direto: sets de vértices e de pares (u, v) dentro da ego
+def _ego_referencia(lista_adjacencia):
+    resultado = {}
+    for vertice, vizinhos in lista_adjacencia.items():
+        ego = {vertice} | {v for v, _ in vizinhos}
+        arestas = {(u, v) for u in ego for v, _ in lista_adjacencia.get(u, []) if v in ego}
+        resultado[vertice] = (len(vizinhos), len(ego), len(arestas))
+    return resultado
+
+def test_ego_e_agrupamento_no_triangulo():
+    metricas = metricas_ego(GrafoCSR.de_lista_adjacencia(GRAFO, dirigido=False))
+    ids = {nome: i for i, nome in enumerate(metricas["nomes"])}
+
+    assert metricas["ordem_ego"][ids["C"]] == 4
+    assert metricas["tamanho_ego"][ids["C"]] == 8
+    assert metricas["triangulos"].tolist() == [1, 1, 1, 0]
+
+    # C tem 3 vizinhos (3 pares possíveis) e só um par ligado
+    assert abs(metricas["agrupamento"][ids["C"]] - 1 / 3) < 1e-12
+    assert metricas["agrupamento"][ids["A"]] == 1.0
+    assert metricas["agrupamento"][ids["D"]] == 0.0
+
+    # 3 triângulos (um por vértice) sobre 1 + 1 + 3 trincas conectadas
+    assert abs(metricas["transitividade"] - 3 / 5) < 1e-12
+
+def test_igual_ao_metodo_direto_com_arestas_paralelas_e_laco():
+    random.seed(7)
+    nomes = [f"v{i}" for i in range(40)]
+    lista = {nome: [] for nome in nomes}
+
+    for _ in range(150):
+        u, v = random.choice(nomes), random.choice(nomes)
+        lista[u].append((v, 1))
+        if random.random() < 0.5:
+            lista[u].append((v, 1))
+
+    metricas = metricas_ego(lista)
+    referencia = _ego_referencia(lista)
+
+    for i, nome in enumerate(metricas["nomes"]):
+        grau, ordem, tamanho = referencia[nome]
+        assert metricas["grau"][i] == grau
+        assert metricas["ordem_ego"][i] == ordem
+        assert metricas["tamanho_ego"][i] == tamanho
@@ -0,0 +1,71 @@
+import sys
+import os
+# Ajuste de path para importar da pasta src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import random
+
+from graphs.algorithms import dijkstra
+from graphs.csr import GrafoCSR
+from graphs.excentricidade import calcular_excentricidades, componente_do_hub, excentricidades_alcancaveis
+
+def test_excentricidade_caminho_nao_direcionado():
+    # Caminho A - B - C - D - E: o centro é C, a periferia são as pontas
+    lista = {v: [] for v in "ABCDE"}
+    for u, v in zip("ABCD", "BCDE"):
+        lista[u].append((v, 1))
+        lista[v].append((u, 1))
+
+    resultado = calcular_excentricidades(GrafoCSR.de_lista_adjacencia(lista, dirigido=False))
+
+    assert resultado["excentricidades"] == {"A": 4, "B": 3, "C": 2, "D": 3, "E": 4}
+    assert resultado["diametro"] == 4
+    assert resultado["raio"] == 2
+    assert resultado["centro"] == ["C"]
+    assert resultado["periferia"] == ["A", "E"]
+
+def test_excentricidade_igual_a_todos_os_pares():
+    # Os limites não podem mudar o resultado: compara com um Dijkstra a partir de cada vértice
+    sorteio = random.Random(3)
+
+    for _ in range(30):
+        n = sorteio.randint(2, 20)
+        lista = {v: [((v + 1) % n, sorteio.randint(1, 9))] for v in range(n)}
+        for _ in range(n * 2):
+            lista[sorteio.randrange(n)].append((sorteio.randrange(n), sorteio.randint(1, 9)))
+
+        # o ciclo 0 -> 1 -> ... -> 0 deixa o digrafo fortemente conexo
+        grafo = GrafoCSR.de_lista_adjacencia(lista)
+        componente, _ = componente_do_hub(grafo)
+        assert len(componente) == n
+
+        resultado = calcular_excentricidades(grafo, ponderado=True)
+        for v in range(n):
+            assert resultado["excentricidades"][v] == max(dijkstra(lista, v).values())
+
+def test_excentricidade_alcancaveis_digrafo_aciclico():
+    # A -> B -> C e A -> C: nenhuma componente fortemente conexa passa de um vértice
+    lista = {"A": [("B", 1), ("C", 5)], "B": [("C", 1)], "C": []}
+
+    resultado = excentricidades_alcancaveis(lista, ponderado=True)
+
+    assert resultado["excentricidades"] == {"A": 2, "B": 1, "C": 0}
+    assert resultado["diametro"] == 2
+    assert resultado["centro"] == ["B"]
+
+def test_excentricidade_alcancaveis_digrafo_em_saltos():
+    # A -> B -> C -> D e A -> E -> D: D não alcança ninguém e fica fora do raio e do centro
+    lista = {"A": [("B", 1), ("E", 1)], "B": [("C", 1)], "C": [("D", 1)], "D": [], "E": [("D", 1)]}
+    grafo = GrafoCSR.de_lista_adjacencia(lista)
+
+    # digrafo acíclico: a componente fortemente conexa do hub é só ele
+    componente, _ = componente_do_hub(grafo)
+    assert len(componente) == 1
+
+    resultado = excentricidades_alcancaveis(grafo)
+
+    assert resultado["excentricidades"] == {"A": 2, "B": 2, "C": 1, "D": 0, "E": 1}
+    assert resultado["diametro"] == 2
+    assert resultado["raio"] == 1
+    assert resultado["centro"] == ["C", "E"]
+    assert resultado["periferia"] == ["A", "B"]
@@ -0,0 +1,39 @@
+import sys
+import os
+# Ajuste de path para importar da pasta src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from graphs.csr import GrafoCSR
+
+# D só aparece como destino; A -> B aparece duas vezes (aresta paralela)
+GRAFO = {
+    "A": [("B", 2), ("B", 3), ("C", 1)],
+    "B": [("C", 4)],
+    "C": [("A", 5), ("D", 1)]
+}
+
+def test_graus_em_uma_passada():
+    grafo = GrafoCSR.de_lista_adjacencia(GRAFO)
+    graus = grafo.graus
+
+    assert grafo.nomes == ["A", "B", "C", "D"]
+    assert graus.saida.tolist() == [3, 1, 2, 0]
+    assert graus.entrada.tolist() == [1, 2, 2, 1]
+    assert graus.peso_saida.tolist() == [6.0, 4.0, 6.0, 0.0]
+    assert graus.peso_entrada.tolist() == [5.0, 5.0, 5.0, 1.0]
+
+    # histograma[g] -> quantos vértices têm grau g
+    assert graus.histograma_saida.tolist() == [1, 1, 1, 1]
+    assert graus.histograma_entrada.tolist() == [0, 2, 2]
+
+    # calculado uma vez e guardado no grafo
+    assert grafo.graus is graus
+
+def test_maiores_e_percentis():
+    graus = GrafoCSR.de_lista_adjacencia(GRAFO).graus
+
+    assert graus.maiores(2) == [0, 2]
+
+    # empate entre B e C no grau de entrada: fica o primeiro id
+    assert graus.maiores(1, entrada=True) == [1]
+    assert graus.percentis((0, 50, 100)) == {0: 0.0, 50: 1.5, 100: 3.0}
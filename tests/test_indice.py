@@ -0,0 +1,70 @@
+import sys
+import os
+# Ajuste de path para importar da pasta src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import pytest
+
+from graphs.csr import GrafoCSR
+from graphs.indice import IndiceVertices, VerticeDesconhecido, normalizar_nome
+from graphs.io import normalizar_nome as normalizar_nome_io
+
+NOMES = ["boa vista", "varzea", "estância", "pau-ferro", "sao jose", "santo amaro", "santo antonio"]
+
+def test_nomes_normalizados_e_apelidos():
+    indice = IndiceVertices(NOMES, apelidos={"Bairro do Recife": "boa vista"})
+
+    assert indice.resolver("Várzea") == "varzea"
+    assert indice.resolver("  VARZEA ") == "varzea"
+    assert indice.resolver("Estancia") == "estância"
+    assert indice.resolver("pau ferro") == "pau-ferro"
+    assert indice.resolver("São  José") == "sao jose"
+    assert indice.resolver("bairro do recife") == "boa vista"
+    assert indice.id("santo antonio") == 6
+    assert "SANTO AMARO" in indice
+
+def test_busca_aproximada_e_falha_rapida():
+    indice = IndiceVertices(NOMES)
+
+    # erro de digitação: a chave mais parecida passa do limiar
+    assert indice.resolver("santo amaru") == "santo amaro"
+    assert indice.sugestoes("santo", k=2)[0][0] in ("santo amaro", "santo antonio")
+
+    with pytest.raises(VerticeDesconhecido) as erro:
+        indice.resolver("santo amaru", aproximado=False)
+    assert erro.value.sugestoes[0] == "santo amaro"
+
+    # nada parecido: falha sem sugestão aceitável
+    with pytest.raises(KeyError):
+        indice.resolver("copacabana")
+
+def test_indice_do_grafo_e_cache_da_normalizacao():
+    grafo = GrafoCSR.de_lista_adjacencia({"varzea": [("estância", 1)], "estância": [("varzea", 1)]}, dirigido=False)
+
+    # montado uma vez e guardado no grafo
+    assert grafo.indice is grafo.indice
+    assert grafo.indice.resolver("ESTÂNCIA") == "estância"
+
+    # graphs.io usa a mesma normalização (com cache LRU)
+    assert normalizar_nome_io is normalizar_nome
+    normalizar_nome.cache_clear()
+    normalizar_nome("Várzea")
+    normalizar_nome("Várzea")
+    assert normalizar_nome.cache_info().hits == 1
+
+def test_nomes_com_a_mesma_chave():
+    # "São José" e "sao jose" viram a mesma chave: nenhum dos dois pode sobrescrever o outro
+    indice = IndiceVertices(["São José", "sao jose", "varzea"])
+
+    with pytest.raises(VerticeDesconhecido) as erro:
+        indice.resolver("SAO JOSE")
+    assert erro.value.sugestoes == ["São José", "sao jose"]
+
+    # a busca aproximada também não escolhe um dos candidatos
+    with pytest.raises(VerticeDesconhecido):
+        indice.resolver("sao jos")
+
+    # o nome exato do grafo continua resolvendo o seu vértice
+    assert indice.id("São José") == 0
+    assert indice.id("sao jose") == 1
+    assert indice.resolver("Várzea") == "varzea"
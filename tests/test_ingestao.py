@@ -0,0 +1,156 @@
+import sys
+import os
+import csv
+import random
+# Ajuste de path para importar da pasta src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from graphs.io import carregar_lista_adjacencia_parte2, filtrar_dataset_paralelo, gerar_armazem_temporal
+from graphs.snapshot import caminho_snapshot, carregar_snapshot
+from graphs.temporal import construir_armazem_temporal
+
+CABECALHO = ["tbl", "Year", "quarter", "citymarketid_1", "city1", "airport_1", "airport_2", "nsmiles", "fare"]
+
+# Dataset bruto sintético: anos misturados, rotas repetidas, campos vazios e cidades com vírgula entre aspas
+def escrever_bruto(caminho, quantidade=3000):
+    random.seed(3)
+    aeroportos = ["ABQ", "DAL", "DFW", "SEA", "LAX", "PHX", " ord ", ""]
+
+    with open(caminho, "w", encoding="utf-8", newline="") as f:
+        escritor = csv.writer(f)
+        escritor.writerow(CABECALHO)
+
+        for i in range(quantidade):
+            escritor.writerow([
+                "Table1a", random.choice(["2023", "2024"]), random.randint(1, 4), 30000 + i,
+                "Albuquerque, NM", random.choice(aeroportos), random.choice(aeroportos),
+                random.choice(["580", "1203", "", "77.5"]), "123.45"
+            ])
+
+# Leitura sequencial linha a linha (o comportamento original do filtro)
+def filtrar_sequencial(caminho, ano):
+    rotas = []
+    vistos = set()
+
+    with open(caminho, newline="", encoding="utf-8") as f:
+        for linha in csv.DictReader(f):
+            if linha["Year"] != ano:
+                continue
+
+            origem = linha["airport_1"].strip().lower()
+            destino = linha["airport_2"].strip().lower()
+            peso = linha["nsmiles"].strip()
+
+            if not origem or not destino or not peso or (origem, destino) in vistos:
+                continue
+            vistos.add((origem, destino))
+            rotas.append([origem, destino, str(float(peso))])
+
+    return rotas
+
+def ler_filtrado(caminho):
+    with open(caminho, newline="", encoding="utf-8") as f:
+        leitor = csv.reader(f)
+        assert next(leitor) == ["vertice_origem", "vertice_destino", "peso"]
+        return list(leitor)
+
+def test_blocos_em_processos_igual_a_leitura_sequencial(tmp_path):
+    bruto = str(tmp_path / "bruto.csv")
+    escrever_bruto(bruto)
+    esperado = filtrar_sequencial(bruto, "2024")
+
+    for processos in (1, 3):
+        saida = str(tmp_path / f"filtrado_{processos}.csv")
+
+        # blocos pequenos: muitos limites caem no meio de uma linha
+        relatorio = filtrar_dataset_paralelo(bruto, saida, "2024", processos=processos, tamanho_bloco=4096)
+
+        assert ler_filtrado(saida) == esperado
+        assert relatorio["linhas_lidas"] == 3000
+        assert relatorio["rotas_gravadas"] == len(esperado)
+        assert relatorio["blocos"] > 1
+        assert relatorio["linhas_por_segundo"] > 0
+
+def test_filtro_grava_snapshot(tmp_path):
+    bruto = str(tmp_path / "bruto.csv")
+    escrever_bruto(bruto)
+    saida = str(tmp_path / "filtrado.csv")
+
+    filtrar_dataset_paralelo(bruto, saida, "2024", processos=1, snapshot=True)
+    assert os.path.exists(caminho_snapshot(saida))
+
+    # o snapshot gravado pelo filtro é válido para o csv gerado e tem os mesmos ids da leitura do csv
+    grafo = carregar_snapshot(saida)
+    assert grafo.nomes == carregar_lista_adjacencia_parte2(saida, compacto=True, snapshot=False).nomes
+    assert grafo.para_lista_adjacencia() == carregar_lista_adjacencia_parte2(saida, snapshot=False)
+
+def test_outro_ano(tmp_path):
+    bruto = str(tmp_path / "bruto.csv")
+    escrever_bruto(bruto, 500)
+    saida = str(tmp_path / "filtrado.csv")
+
+    filtrar_dataset_paralelo(bruto, saida, "2023", processos=1, tamanho_bloco=1000)
+    assert ler_filtrado(saida) == filtrar_sequencial(bruto, "2023")
+
+def test_linhas_curtas_ou_malformadas_sao_ignoradas(tmp_path):
+    bruto = str(tmp_path / "bruto.csv")
+    with open(bruto, "w", encoding="utf-8", newline="") as f:
+        escritor = csv.writer(f)
+        escritor.writerow(CABECALHO)
+        escritor.writerow(["Table1a", "2024", "1", "30000", "Albuquerque, NM", "ABQ", "DAL", "580", "1.0"])
+        escritor.writerow(["Table1a", "2024", "1"])
+        escritor.writerow(["Table1a", "2024", "1", "30001", "Dallas, TX", "DAL", "SEA", "muito", "1.0"])
+        escritor.writerow(["Table1a", "2024", "2", "30002", "Cidade\ncom quebra", "SEA", "LAX", "954", "1.0"])
+
+    saida = str(tmp_path / "filtrado.csv")
+    relatorio = filtrar_dataset_paralelo(bruto, saida, "2024", processos=1)
+
+    assert ler_filtrado(saida) == [["abq", "dal", "580.0"], ["sea", "lax", "954.0"]]
+    assert relatorio["linhas_lidas"] == 4
+
+# Rotas (origem, destino, peso) de um grafo, sem depender da ordem das listas
+def rotas_do_grafo(lista_adjacencia):
+    return sorted((origem, destino, peso) for origem, vizinhos in lista_adjacencia.items() for destino, peso in vizinhos)
+
+def test_armazem_temporal_igual_ao_filtro_de_cada_ano(tmp_path):
+    bruto = str(tmp_path / "bruto.csv")
+    escrever_bruto(bruto)
+    caminho_armazem = str(tmp_path / "bruto.temporal.npz")
+
+    # uma linha sem ano não entra em nenhum período
+    with open(bruto, "a", encoding="utf-8", newline="") as f:
+        csv.writer(f).writerow(["Table1a", "", "1", "39999", "Seattle, WA", "SEA", "ABQ", "1180", "1.0"])
+
+    armazem, relatorio = gerar_armazem_temporal(bruto, caminho_armazem, processos=2, tamanho_bloco=4096)
+    assert armazem.periodos == ["2023", "2024"]
+    assert relatorio["linhas_lidas"] == 3001
+
+    for ano in ("2023", "2024"):
+        filtrado = str(tmp_path / f"filtrado_{ano}.csv")
+        filtrar_dataset_paralelo(bruto, filtrado, ano, processos=1)
+        esperado = carregar_lista_adjacencia_parte2(filtrado, snapshot=False)
+
+        # o grafo do ano vem do armazém salvo (mapeado), sem ler o dataset de novo
+        grafo = carregar_lista_adjacencia_parte2(ano=ano, caminho_armazem=caminho_armazem)
+        assert sorted(grafo) == sorted(esperado)
+        assert rotas_do_grafo(grafo) == rotas_do_grafo(esperado)
+
+def test_rotas_que_surgiram_e_sumiram():
+    rotas = [
+        ("2022", "abq", "dal", 580.0),
+        ("2022", "dal", "sea", 1660.0),
+        ("2023", "abq", "dal", 580.0),
+        ("2023", "sea", "lax", 954.0),
+        ("2024", "dal", "sea", 1670.0),
+        ("2024", "sea", "lax", 954.0),
+    ]
+    armazem = construir_armazem_temporal(rotas)
+
+    assert armazem.diferenca("2022", "2023") == {"surgiram": [("sea", "lax")], "sumiram": [("dal", "sea")]}
+    assert armazem.diferenca("2023", "2024") == {"surgiram": [("dal", "sea")], "sumiram": [("abq", "dal")]}
+
+    # a rota voltou em 2024 com outro peso; abq não tem nenhuma rota em 2024
+    grafo = armazem.grafo(2024)
+    assert grafo["dal"] == [("sea", 1670.0)]
+    assert "abq" not in grafo
+    assert armazem.grafo("2022")["dal"] == [("sea", 1660.0)]
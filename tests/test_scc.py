@@ -0,0 +1,57 @@
+import sys
+import os
+# Ajuste de path para importar da pasta src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from graphs.algorithms import dijkstra_path, dijkstra_lote
+from graphs.csr import GrafoCSR
+
+# Dois ciclos {A, B, C} e {D, E} ligados por C -> D, e F isolado
+GRAFO = {
+    "A": [("B", 1)],
+    "B": [("C", 1)],
+    "C": [("A", 1), ("D", 2)],
+    "D": [("E", 1)],
+    "E": [("D", 1)],
+    "F": []
+}
+
+def test_componentes_e_ordem_topologica():
+    grafo = GrafoCSR.de_lista_adjacencia(GRAFO)
+    condensacao = grafo.condensacao
+    componente = {nome: condensacao.componente[grafo.ids[nome]] for nome in GRAFO}
+
+    assert condensacao.num_componentes == 3
+    assert componente["A"] == componente["B"] == componente["C"]
+    assert componente["D"] == componente["E"]
+    assert sorted(condensacao.tamanhos.tolist()) == [1, 2, 3]
+
+    # a aresta C -> D vira a única aresta do DAG, e vai para uma componente de número maior
+    assert len(condensacao.dag_alvos) == 1
+    assert componente["A"] < componente["D"]
+
+    # a condensação é calculada uma vez e fica guardada no grafo
+    assert grafo.condensacao is condensacao
+
+def test_sem_rota_pela_condensacao():
+    grafo = GrafoCSR.de_lista_adjacencia(GRAFO)
+    ids = grafo.ids
+
+    assert grafo.condensacao.sem_rota(ids["D"], ids["A"])
+    assert grafo.condensacao.sem_rota(ids["A"], ids["F"])
+    assert not grafo.condensacao.sem_rota(ids["A"], ids["E"])
+
+    # as consultas continuam iguais às do Dijkstra com dicionário
+    for origem in GRAFO:
+        for destino in GRAFO:
+            assert dijkstra_path(grafo, origem, destino)[0] == dijkstra_path(GRAFO, origem, destino)[0]
+
+    custo, caminho = dijkstra_lote(grafo, [("D", "A")])[0]
+    assert custo == sys.maxsize and caminho == -1
+
+def test_caminho_longo_sem_recursao():
+    # um ciclo muito maior que o limite de recursão do Python vira uma única componente
+    n = sys.getrecursionlimit() * 5
+    grafo = GrafoCSR.de_lista_adjacencia({i: [((i + 1) % n, 1)] for i in range(n)})
+
+    assert grafo.condensacao.num_componentes == 1
@@ -0,0 +1,80 @@
+import sys
+import os
+# Arrumando o caminho pra conseguir importar os módulos da pasta src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import numpy as np
+
+from graphs.io import carregar_lista_adjacencia_parte2
+from graphs.snapshot import caminho_snapshot, mapear_npz, salvar_npz
+
+def escrever_csv(caminho, linhas):
+    with open(caminho, "w", encoding="utf-8") as f:
+        f.write("vertice_origem,vertice_destino,peso\n")
+        for linha in linhas:
+            f.write(",".join(linha) + "\n")
+
+def test_snapshot_criado_e_mapeado(tmp_path):
+    caminho = str(tmp_path / "voos.csv")
+    escrever_csv(caminho, [("abq", "dal", "580.0"), ("dal", "abq", "580.0"), ("abq", "dfw", "570.0")])
+
+    # Primeira leitura: lê o CSV e grava o snapshot ao lado dele
+    grafo = carregar_lista_adjacencia_parte2(caminho, compacto=True)
+    assert os.path.exists(caminho_snapshot(caminho))
+
+    # Segunda leitura: os vetores vêm mapeados do arquivo, sem cópia
+    mapeado = carregar_lista_adjacencia_parte2(caminho, compacto=True)
+    assert isinstance(mapeado.alvos, np.memmap)
+    assert isinstance(mapeado.reverso.alvos, np.memmap)
+    assert mapeado.para_lista_adjacencia() == grafo.para_lista_adjacencia()
+
+    # O dicionário tem que ser o mesmo de quando o CSV é lido direto
+    assert carregar_lista_adjacencia_parte2(caminho) == carregar_lista_adjacencia_parte2(caminho, snapshot=False)
+
+def test_snapshot_reconstruido_quando_csv_muda(tmp_path):
+    caminho = str(tmp_path / "voos.csv")
+    escrever_csv(caminho, [("abq", "dal", "580.0")])
+    carregar_lista_adjacencia_parte2(caminho)
+
+    # CSV novo com o mesmo tamanho: só o conteúdo (e o mtime) mudam
+    escrever_csv(caminho, [("abq", "dal", "990.0")])
+    os.utime(caminho, ns=(0, 0))
+
+    grafo = carregar_lista_adjacencia_parte2(caminho)
+    assert grafo["abq"] == [("dal", 990.0)]
+
+def test_snapshot_usado_sem_o_csv(tmp_path):
+    caminho = str(tmp_path / "voos.csv")
+    escrever_csv(caminho, [("abq", "dal", "580.0"), ("dal", "abq", "580.0"), ("abq", "dfw", "570.0")])
+    esperado = carregar_lista_adjacencia_parte2(caminho, snapshot=False)
+    carregar_lista_adjacencia_parte2(caminho)
+
+    # sem o csv não há com o que validar: o snapshot é mapeado como está
+    os.remove(caminho)
+    grafo = carregar_lista_adjacencia_parte2(caminho, compacto=True)
+    assert isinstance(grafo.alvos, np.memmap)
+    assert isinstance(grafo.reverso.pesos, np.memmap)
+    assert grafo.para_lista_adjacencia() == esperado
+    assert grafo.reverso["abq"] == [("dal", 580.0)]
+
+def test_snapshot_false_le_o_csv(tmp_path):
+    caminho = str(tmp_path / "voos.csv")
+    escrever_csv(caminho, [("abq", "dal", "580.0")])
+    carregar_lista_adjacencia_parte2(caminho)
+
+    # mesmo tamanho e mesmo mtime: o snapshot continuaria válido, mas snapshot=False lê o csv
+    mtime = os.stat(caminho).st_mtime_ns
+    escrever_csv(caminho, [("abq", "sea", "990.0")])
+    os.utime(caminho, ns=(mtime, mtime))
+
+    assert carregar_lista_adjacencia_parte2(caminho, snapshot=False) == {"abq": [("sea", 990.0)], "sea": []}
+    assert carregar_lista_adjacencia_parte2(caminho, compacto=True, snapshot=False)["abq"] == [("sea", 990.0)]
+
+def test_salvar_npz_com_temporario_unico(tmp_path):
+    caminho = str(tmp_path / "vetores.npz")
+    salvar_npz(caminho, {"a": np.arange(3)})
+    salvar_npz(caminho, {"a": np.arange(5)})
+
+    # a troca é atômica e nenhum arquivo temporário fica para trás
+    assert os.listdir(tmp_path) == ["vetores.npz"]
+    assert mapear_npz(caminho)["a"].tolist() == [0, 1, 2, 3, 4]
@@ -0,0 +1,47 @@
+import sys
+import os
+# Ajuste de path para importar da pasta src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from graphs.csr import GrafoCSR
+from graphs.subgrafo import SubgrafoInduzido, grupos_por_rotulo, metricas_por_grupo
+
+# Não-direcionado: grupo X = {A, B, C} (triângulo), grupo Y = {D, E} (aresta interna D-E repetida), F sem grupo
+GRAFO = {
+    "A": [("B", 1), ("C", 2)],
+    "B": [("A", 1), ("C", 3), ("D", 4)],
+    "C": [("A", 2), ("B", 3), ("F", 5)],
+    "D": [("B", 4), ("E", 1), ("E", 1)],
+    "E": [("D", 1), ("D", 1)],
+    "F": [("C", 5)]
+}
+
+ROTULOS = {"A": "X", "B": "X", "C": "X", "D": "Y", "E": "Y"}
+
+def test_subgrafo_induzido_sem_copia():
+    grafo = GrafoCSR.de_lista_adjacencia(GRAFO, dirigido=False)
+    subgrafo = SubgrafoInduzido.de_vertices(grafo, ["A", "B", "C"])
+
+    # as arestas continuam sendo as do grafo original
+    assert subgrafo.grafo is grafo
+    assert len(subgrafo) == 3
+    assert "D" not in subgrafo
+    assert subgrafo["B"] == [("A", 1.0), ("C", 3.0)]
+    assert subgrafo.num_arestas == 6
+    assert dict(subgrafo.items()) == {"A": [("B", 1.0), ("C", 2.0)], "B": [("A", 1.0), ("C", 3.0)], "C": [("A", 2.0), ("B", 3.0)]}
+
+def test_metricas_de_todos_os_grupos_em_uma_passada():
+    grafo = GrafoCSR.de_lista_adjacencia(GRAFO, dirigido=False)
+    nomes_grupos, grupo = grupos_por_rotulo(grafo, ROTULOS)
+    metricas = metricas_por_grupo(grafo, grupo, len(nomes_grupos))
+
+    assert nomes_grupos == ["X", "Y"]
+    assert metricas["ordem"].tolist() == [3, 2]
+    assert metricas["ordem_com_arestas"].tolist() == [3, 2]
+
+    # a aresta paralela D-E conta duas vezes, como na lista de adjacência
+    assert metricas["tamanho"].tolist() == [3, 2]
+    assert metricas["densidade"].tolist() == [1.0, 2.0]
+
+    # X sai por B-D e C-F; Y sai por D-B
+    assert metricas["arestas_corte"].tolist() == [2, 1]
@@ -0,0 +1,87 @@
+import sys
+import os
+import random
+# Ajuste de path para importar da pasta src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from graphs.algorithms import dijkstra_path
+from graphs.yen import k_caminhos_minimos
+
+# Exemplo clássico do algoritmo de Yen (C -> H)
+GRAFO = {
+    "C": [("D", 3), ("E", 2)],
+    "D": [("F", 4)],
+    "E": [("D", 1), ("F", 2), ("G", 3)],
+    "F": [("G", 2), ("H", 1)],
+    "G": [("H", 2)],
+    "H": []
+}
+
+def test_k_caminhos_em_ordem_de_custo():
+    caminhos = list(k_caminhos_minimos(GRAFO, "C", "H", k=3))
+
+    assert [custo for custo, _ in caminhos] == [5, 7, 8]
+    assert [" -> ".join(caminho) for _, caminho in caminhos] == [
+        "C -> E -> F -> H",
+        "C -> E -> G -> H",
+        "C -> D -> F -> H",
+    ]
+
+    # o primeiro é o mesmo caminho mínimo do dijkstra_path
+    assert caminhos[0][0] == dijkstra_path(GRAFO, "C", "H")[0]
+
+def test_k_caminhos_gerador_sem_repeticao():
+    # sem limite o gerador entrega todos os caminhos sem repetir vértices, e para sozinho
+    caminhos = list(k_caminhos_minimos(GRAFO, "C", "H"))
+    custos = [custo for custo, _ in caminhos]
+
+    assert custos == sorted(custos)
+    assert len({tuple(caminho) for _, caminho in caminhos}) == len(caminhos)
+    for _, caminho in caminhos:
+        assert len(set(caminho)) == len(caminho)
+
+    # quem chama pode parar cedo
+    gerador = k_caminhos_minimos(GRAFO, "C", "H")
+    assert next(gerador)[0] == 5
+
+def test_k_caminhos_sem_rota():
+    assert list(k_caminhos_minimos(GRAFO, "H", "C", k=3)) == []
+
+# Todos os caminhos simples de inicio até destino por DFS, como (custo, caminho)
+def caminhos_por_dfs(grafo, inicio, destino):
+    caminhos = []
+
+    def visitar(vertice, caminho, custo):
+        if vertice == destino:
+            caminhos.append((custo, list(caminho)))
+            return
+        for vizinho, peso in grafo[vertice]:
+            if vizinho not in caminho:
+                caminho.append(vizinho)
+                visitar(vizinho, caminho, custo + peso)
+                caminho.pop()
+
+    visitar(inicio, [inicio], 0)
+    return caminhos
+
+def test_k_caminhos_igual_a_enumeracao_por_dfs():
+    aleatorio = random.Random(7)
+
+    for _ in range(30):
+        vertices = [str(i) for i in range(aleatorio.randint(2, 7))]
+        grafo = {
+            u: [(v, aleatorio.randint(1, 5)) for v in vertices if v != u and aleatorio.random() < 0.4]
+            for u in vertices
+        }
+        inicio, destino = aleatorio.sample(vertices, 2)
+
+        esperado = caminhos_por_dfs(grafo, inicio, destino)
+        caminhos = list(k_caminhos_minimos(grafo, inicio, destino))
+
+        # os mesmos caminhos, sem repetição, em ordem de custo (empates podem sair em qualquer ordem)
+        assert sorted(tuple(caminho) for _, caminho in caminhos) == sorted(tuple(caminho) for _, caminho in esperado)
+        assert [custo for custo, _ in caminhos] == sorted(custo for custo, _ in esperado)
+
+        # com limite, os k primeiros custos
+        k = aleatorio.randint(1, 4)
+        assert [custo for custo, _ in k_caminhos_minimos(grafo, inicio, destino, k=k)] == sorted(custo for custo, _ in esperado)[:k]